@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Benchmark the scripts on synthetic catalogs of increasing size.
+
+Synthetic catalogs (see slackkb/synthetic.py) are generated under
+.cache/benchmark/<size>/ and reused between runs. Each benchmark reports the
+best of --repeat runs, as JSON, and can be compared against a baseline
+stored earlier on the same machine to catch regressions.
+
+Usage:
+    ./scripts/benchmark.py                              # Sizes 10 and 1000
+    ./scripts/benchmark.py --sizes 10,1000,10000,100000
+    ./scripts/benchmark.py --only load_projects,validate_all
+    ./scripts/benchmark.py --baseline                   # Compare with .cache/benchmark-baseline.json
+    ./scripts/benchmark.py --save-baseline              # Store this run as the baseline
+"""
+
+import sys
+import json
+import time
+import argparse
+import platform
+from pathlib import Path
+
+import yaml
+
+from slackkb.cache import CACHE_DIRNAME, YamlCache
+from slackkb.catalog import Catalog, load_projects
+from slackkb.coverage_tables import calculate_coverage, generate_gaps_table
+from slackkb.openapi import extract_methods, load_openapi_spec, load_spec_index
+from slackkb.output import render
+from slackkb.synthetic import load_seeds, write_catalog
+from slackkb.tables import generate_full_report
+from slackkb.validate import validate_all
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+RESULTS_VERSION = 1
+
+DEFAULT_SIZES = '10,1000'
+# Timings only compare on one machine, so the baseline is local, not committed
+DEFAULT_BASELINE = Path(CACHE_DIRNAME) / 'benchmark-baseline.json'
+SPEC_PATH = Path('archived-sources') / 'slack-api' / 'slack-web-openapi-v2.json'
+
+# A benchmark regresses if it is this much slower than its baseline...
+DEFAULT_THRESHOLD = 0.25
+# ...and slower by at least this many seconds (below that it is noise)
+MIN_REGRESSION = 0.005
+# A benchmark that looks like a regression is measured again, with this many
+# times --repeat runs, before it is reported
+CONFIRM_FACTOR = 3
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+
+
+def best_of(func, repeat: int) -> float:
+    """Best wall time of func() over repeat runs, in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def is_regression(seconds: float, before: float, threshold: float) -> bool:
+    """True if seconds is slower than before by more than threshold and the noise floor."""
+    return seconds > before * (1 + threshold) and seconds - before >= MIN_REGRESSION
+
+
+# =============================================================================
+# BENCHMARKS
+# =============================================================================
+
+def catalog_benchmarks(catalog_dir: Path, jobs: int, all_methods: dict) -> list:
+    """(name, func) for every benchmark that runs over one catalog."""
+    # Parse once into a cache; the warm-load benchmarks and the setup below reuse it
+    cache_file = catalog_dir.parent / f'{catalog_dir.name}.cache.pickle'
+    primed = YamlCache(cache_file)
+    catalog = Catalog.load(catalog_dir, primed, jobs)
+    primed.save()
+
+    errors = sum(len(result.errors) for result in catalog.validate())
+    if errors:
+        print(f"Warning: synthetic catalog has {errors} validation errors", file=sys.stderr)
+
+    # Rendering and coverage benchmarks share one parsed catalog
+    projects = catalog.projects
+
+    def pipeline():
+        # Everything the three generator scripts do, from a single load
+        loaded = Catalog.load(catalog_dir, YamlCache(cache_file), jobs)
+        loaded.validate()
+        loaded.render(generate_full_report, timestamp='none')
+        matrix = loaded.coverage(all_methods)
+        generate_gaps_table(matrix, matrix.all_methods)
+
+    return [
+        ('load_projects', lambda: load_projects(catalog_dir, None, jobs)),
+        ('load_projects_cached', lambda: load_projects(catalog_dir, YamlCache(cache_file), jobs)),
+        ('validate_all', lambda: validate_all(catalog_dir, cache=None, jobs=jobs)),
+        ('generate_full_report', lambda: render(generate_full_report(projects, 'none'))),
+        ('calculate_coverage', lambda: [calculate_coverage(p, all_methods) for p in projects]),
+        ('generate_gaps_table', lambda: generate_gaps_table(projects, all_methods)),
+        ('catalog_pipeline', pipeline),
+    ]
+
+
+def run_benchmarks(args, baseline: dict = None) -> dict:
+    """
+    Run every selected benchmark. With a baseline, a result that looks like a
+    regression is measured again and the best of both measurements is kept.
+    """
+    spec_path = REPO_ROOT / SPEC_PATH
+    all_methods = load_spec_index(spec_path).categories()
+    method_names = [m for methods in all_methods.values() for m in methods]
+    seeds = load_seeds(REPO_ROOT / 'projects')
+    only = set(args.only.split(',')) if args.only else None
+
+    previous = baseline_seconds(baseline) if baseline is not None else {}
+    results = []
+
+    def record(name, size, func):
+        seconds = best_of(func, args.repeat)
+        before = previous.get((name, size))
+        note = ''
+        if before is not None and is_regression(seconds, before, args.threshold):
+            seconds = min(seconds, best_of(func, args.repeat * CONFIRM_FACTOR))
+            note = ' (re-measured)'
+        entry = {'benchmark': name, 'size': size, 'seconds': round(seconds, 6)}
+        results.append(entry)
+        print(f"  {name:<24} {size:>8} {seconds * 1000:>12.2f} ms{note}", file=sys.stderr)
+
+    # Independent of catalog size
+    if only is None or 'extract_methods' in only:
+        spec = load_openapi_spec(spec_path)
+        record('extract_methods', 0, lambda: extract_methods(spec))
+
+    for size in args.sizes:
+        catalog_dir = args.catalog_dir / str(size)
+        print(f"Catalog of {size} projects: {catalog_dir}", file=sys.stderr)
+        write_catalog(catalog_dir, size, seeds, method_names, args.seed)
+
+        for name, func in catalog_benchmarks(catalog_dir, args.jobs, all_methods):
+            if only is None or name in only:
+                record(name, size, func)
+
+    return {
+        'version': RESULTS_VERSION,
+        'environment': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'yaml': yaml.__version__,
+            'libyaml': yaml.__with_libyaml__,
+        },
+        'jobs': args.jobs,
+        'repeat': args.repeat,
+        'seed': args.seed,
+        'results': results,
+    }
+
+
+# =============================================================================
+# BASELINES
+# =============================================================================
+
+def baseline_seconds(baseline: dict) -> dict:
+    """(benchmark, size) -> seconds for every result in a stored baseline."""
+    return {(r['benchmark'], r['size']): r['seconds'] for r in baseline.get('results', [])}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Print each result against its baseline; return the regressions.
+
+    Results without a baseline entry are reported as such and never regress.
+    """
+    previous = baseline_seconds(baseline)
+    regressions = []
+    unmatched = []
+
+    print(f"\n{'Benchmark':<24} {'Size':>8} {'Baseline':>12} {'Current':>12} {'Change':>8}")
+    for r in results['results']:
+        key = (r['benchmark'], r['size'])
+        before = previous.get(key)
+        if before is None:
+            unmatched.append(r)
+            print(f"{r['benchmark']:<24} {r['size']:>8} {'-':>12} "
+                  f"{r['seconds'] * 1000:>10.2f}ms  no baseline")
+            continue
+        change = (r['seconds'] - before) / before if before else 0.0
+        flag = ''
+        if is_regression(r['seconds'], before, threshold):
+            regressions.append(r)
+            flag = '  REGRESSION'
+        print(f"{r['benchmark']:<24} {r['size']:>8} {before * 1000:>10.2f}ms "
+              f"{r['seconds'] * 1000:>10.2f}ms {change:>+7.0%}{flag}")
+    if unmatched:
+        print(f"\n{len(unmatched)} result(s) have no baseline entry and were not compared; "
+              f"store one with --save-baseline")
+    return regressions
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the scripts on synthetic catalogs')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                        help=f'Comma-separated catalog sizes (default: {DEFAULT_SIZES})')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per benchmark; the best is reported (default: 3)')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='Worker processes for parsing and validation (default: 1)')
+    parser.add_argument('--only', metavar='NAMES',
+                        help='Comma-separated benchmarks to run (default: all)')
+    parser.add_argument('--seed', type=int, default=0, help='Synthetic catalog seed')
+    parser.add_argument('--catalog-dir', type=Path,
+                        default=REPO_ROOT / CACHE_DIRNAME / 'benchmark',
+                        help='Where synthetic catalogs are generated')
+    parser.add_argument('--output', '-o', help='Write the JSON results here (default: stdout)')
+    parser.add_argument('--baseline', nargs='?', const=str(DEFAULT_BASELINE), metavar='FILE',
+                        help=f'Compare with a stored baseline (default: {DEFAULT_BASELINE}); '
+                             'exit 1 on regressions')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Slowdown that counts as a regression (default: 0.25 = 25%%)')
+    parser.add_argument('--save-baseline', nargs='?', const=str(DEFAULT_BASELINE),
+                        metavar='FILE', help=f'Store the results as baseline '
+                                             f'(default: {DEFAULT_BASELINE})')
+
+    args = parser.parse_args()
+    try:
+        args.sizes = [int(size) for size in args.sizes.split(',')]
+    except ValueError:
+        parser.error(f'--sizes must be comma-separated integers: {args.sizes}')
+
+    # Read before running, so suspected regressions can be re-measured
+    baseline = None
+    if args.baseline:
+        try:
+            with open(REPO_ROOT / args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot read baseline {args.baseline}: {e}")
+            print("Store one on this machine first with --save-baseline")
+            return 1
+
+    results = run_benchmarks(args, baseline)
+    text = json.dumps(results, indent=2)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f"Results written to {args.output}", file=sys.stderr)
+    elif not args.baseline:
+        print(text)
+
+    if args.save_baseline:
+        path = REPO_ROOT / args.save_baseline
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f"Baseline written to {path}", file=sys.stderr)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+            return 1
+        print("\nNo regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Build or update catalog.sqlite from the project YAML files and the OpenAPI spec.
+
+The database has normalized tables for projects, capability flags,
+supported/partial/undocumented methods, evidence and notes, plus the spec's
+method list, for ad-hoc SQL:
+
+    sqlite3 catalog.sqlite "SELECT p.name, count(*) FROM methods m
+        JOIN projects p ON p.id = m.project_id
+        WHERE m.status = 'supported' GROUP BY p.id ORDER BY 2 DESC"
+
+Updates are incremental: only files whose content hash changed are parsed
+and rewritten, and rows of deleted files are removed.
+
+Usage:
+    ./scripts/build-catalog-db.py                      # Update catalog.sqlite
+    ./scripts/build-catalog-db.py -o /tmp/catalog.sqlite
+    ./scripts/build-catalog-db.py --rebuild            # Recreate from scratch
+    ./scripts/build-catalog-db.py --no-cache           # Bypass the parsed-YAML cache
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+from slackkb.cache import open_cache
+from slackkb.database import (CatalogDatabase, CatalogDatabaseError, SyncStats,
+                              default_database_file)
+from slackkb.parallel import add_jobs_argument
+from slackkb.profile import add_profile_arguments, start_profiler
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Build or update the SQLite copy of the catalog'
+    )
+    parser.add_argument('-o', '--output',
+                        help=f'Database file (default: {default_database_file(Path())})')
+    parser.add_argument('--spec-path', type=str,
+                        default='archived-sources/slack-api/slack-web-openapi-v2.json',
+                        help='Path to OpenAPI spec file')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Drop the catalog tables and build them from scratch')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the parsed-YAML cache')
+    add_jobs_argument(parser)
+    add_profile_arguments(parser)
+
+    args = parser.parse_args()
+    profiler = start_profiler(args)
+
+    script_dir = Path(__file__).parent
+    repo_root = script_dir.parent
+    projects_dir = repo_root / 'projects'
+    spec_path = repo_root / args.spec_path
+    database_file = Path(args.output) if args.output else default_database_file(repo_root)
+
+    if not projects_dir.exists():
+        print(f"Error: Projects directory not found: {projects_dir}")
+        return 1
+    if not spec_path.exists():
+        print(f"Error: OpenAPI spec not found at {spec_path}")
+        return 1
+
+    try:
+        db = CatalogDatabase(database_file, rebuild=args.rebuild)
+    except CatalogDatabaseError as e:
+        print(f"Error: {e}")
+        return 1
+
+    stats = SyncStats()
+    cache = open_cache(repo_root, enabled=not args.no_cache)
+    with db:
+        with profiler.phase('sync projects'):
+            db.sync(sorted(projects_dir.glob('*.yaml')), cache, args.jobs, stats)
+            cache.save()
+        with profiler.phase('sync spec'):
+            db.sync_spec(spec_path, stats)
+
+    for filepath, error in stats.errors:
+        print(f"Warning: Failed to load {filepath}: {error}", file=sys.stderr)
+    print(f"{database_file}: {stats}")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Rebuild the generated comparison files that are out of date.
+
+Each file under comparisons/ that is generated from the catalog is declared
+below as a target with its inputs. Only targets whose inputs changed since
+their last build are regenerated, independent targets run in parallel, and
+a regenerated file is only written if its content changed.
+
+Usage:
+    ./scripts/build.py                          # Rebuild stale targets
+    ./scripts/build.py comparisons/auto-generated.md
+    ./scripts/build.py --dry-run                # Show what is stale
+    ./scripts/build.py --always-make            # Rebuild everything
+    ./scripts/build.py --list                   # List targets and their inputs
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+
+from slackkb.build import BuildState, Target, build, default_state_file, with_prerequisites
+
+
+# =============================================================================
+# TARGETS
+# =============================================================================
+
+OPENAPI_SPEC = 'archived-sources/slack-api/slack-web-openapi-v2.json'
+
+# Inputs every target shares: the catalog, its schema and the shared code
+CATALOG_INPUTS = ['projects/*.yaml', 'spec.yaml', 'scripts/slackkb/*.py']
+
+
+def declare_targets(no_cache: bool = False) -> list:
+    """The build graph. Commands write to the {output} placeholder."""
+    python = sys.executable
+    extra = ['--no-cache'] if no_cache else []
+    return [
+        Target(
+            'comparisons/auto-generated.md',
+            CATALOG_INPUTS + ['scripts/generate-tables.py'],
+            # Stamped with the newest last-update, so unchanged inputs give
+            # byte-identical output
+            [python, 'scripts/generate-tables.py', '--timestamp', 'inputs',
+             '-o', '{output}'] + extra,
+        ),
+        Target(
+            'comparisons/api-coverage-comparison.md',
+            CATALOG_INPUTS + ['scripts/generate-api-coverage-table.py', OPENAPI_SPEC,
+                              OPENAPI_SPEC.replace('.json', '.meta.json')],
+            # The sections the committed report has; the gaps table is left out
+            [python, 'scripts/generate-api-coverage-table.py', '--spec-path', OPENAPI_SPEC,
+             '--summary', '--by-tool', '--by-category', '--output', '{output}'] + extra,
+        ),
+    ]
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Rebuild generated comparison files whose inputs changed'
+    )
+    parser.add_argument('targets', nargs='*',
+                        help='Targets to build (default: all)')
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help='Only report which targets are stale')
+    parser.add_argument('--always-make', '-B', action='store_true',
+                        help='Rebuild targets even if they are up to date')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, metavar='N',
+                        help='Build up to N targets at once (default: CPU count)')
+    parser.add_argument('--list', action='store_true',
+                        help='List the targets and their inputs, then exit')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the parsed-YAML cache in the generators')
+
+    args = parser.parse_args()
+
+    repo_root = Path(__file__).resolve().parent.parent
+    targets = declare_targets(args.no_cache)
+
+    if args.list:
+        for target in targets:
+            print(target.output)
+            for pattern in target.inputs:
+                print(f"    {pattern}")
+        return 0
+
+    selected = targets
+    if args.targets:
+        by_output = {target.output: target for target in targets}
+        selected = []
+        for name in args.targets:
+            target = by_output.get(os.path.relpath(Path(name).resolve(), repo_root))
+            if target is None:
+                print(f"Error: Unknown target: {name} (targets: {', '.join(by_output)})")
+                return 1
+            selected.append(target)
+        selected = with_prerequisites(selected, targets)
+
+    state = BuildState(default_state_file(repo_root), repo_root)
+
+    def report(target, status):
+        print(f"{target.output}: {status}")
+
+    statuses = build(selected, state, jobs=args.jobs, force=args.always_make,
+                     dry_run=args.dry_run, report=report)
+    state.save()
+
+    if any(status in ('failed', 'skipped') for status in statuses.values()):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
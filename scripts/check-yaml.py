@@ -10,14 +10,17 @@ Usage:
     ./scripts/check-yaml.py projects/foo.yaml   # Check specific file
     ./scripts/check-yaml.py --strict            # Fail on warnings too
     ./scripts/check-yaml.py --verbose           # Show all checks
+    ./scripts/check-yaml.py --no-cache          # Bypass the parsed-YAML cache
+    ./scripts/check-yaml.py --jobs 8            # Parse/validate on 8 processes
+    ./scripts/check-yaml.py --incremental       # Only revalidate changed files
+    ./scripts/check-yaml.py --since origin/main # Only revalidate files changed since a ref
+    ./scripts/check-yaml.py --print-plan        # Dump the rules compiled from spec.yaml
+    ./scripts/check-yaml.py --watch             # Revalidate each file as it is saved
 """
 
 import sys
-import os
-import re
 import argparse
 from pathlib import Path
-from datetime import datetime
 
 try:
     import yaml
@@ -25,329 +28,103 @@ except ImportError:
     print("Error: PyYAML not installed. Run: pip install pyyaml")
     sys.exit(1)
 
+from slackkb.cache import YamlCache, open_cache
+from slackkb.schema import load_plan, dump_plan
+from slackkb.incremental import Manifest, default_manifest_file, validator_fingerprint, changed_since
+from slackkb.parallel import add_jobs_argument
+from slackkb.validate import (get_plan, set_plan, validate_document,
+                              validate_incremental, validate_paths)
+from slackkb.watch import WatchedCatalog, add_watch_arguments, file_target, open_watcher, watch
+from slackkb.profile import add_profile_arguments, start_profiler
+
 
 # =============================================================================
-# CONFIGURATION
+# REPORTING
 # =============================================================================
 
-REQUIRED_FIELDS = ['last-update', 'repo-url', 'name', 'description', 'language', 'category']
-
-DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
-URL_PATTERN = re.compile(r'^https?://')
-COMMIT_PATTERN = re.compile(r'^[a-fA-F0-9]{7,40}$')
-
-VALID_LANGUAGES = [
-    'Go', 'Python', 'TypeScript', 'JavaScript', 'Rust', 'Bash',
-    'PHP', 'Java', 'C', 'Ruby', 'C++', 'Other'
-]
-
-VALID_CATEGORIES = [
-    'official-cli', 'messaging-cli', 'terminal-ui', 'file-upload',
-    'notification-tool', 'libpurple-plugin', 'bot-framework', 'api-wrapper',
-    'export-tool', 'mcp-server'
-]
-
-VALID_MAINTENANCE_TIERS = [
-    'active-development', 'maintenance-mode', 'community-sustained',
-    'unmaintained', 'archived'
-]
-
-VALID_COMMIT_FREQUENCIES = [
-    'very-active', 'active', 'moderate', 'sporadic', 'stale', 'abandoned'
-]
-
-VALID_EVIDENCE_SOURCE_TYPES = [
-    'source-code', 'documentation', 'readme', 'github-api', 'manual-test', 'inferred'
-]
-
-VALID_EVIDENCE_CONFIDENCE = [
-    # Verified levels (high confidence)
-    'verified-source-code',
-    'verified-manual-test',
-    'verified-api-response',
-    # Documentation-based levels (medium confidence)
-    'from-readme',
-    'from-docs',
-    'from-changelog',
-    # Inferred levels (lower confidence)
-    'inferred-from-features',
-    'inferred-from-deps',
-    'inferred-from-similar',
-    # Uncertain (needs verification)
-    'unverified',
-    'stale',
-]
-
-INTEGER_FIELDS = ['stars', 'forks', 'watchers', 'contributors', 'open-issues',
-                  'closed-issues', 'total-releases']
-
-BOOLEAN_FIELDS = ['reputable-source', 'archived']
-
-DATE_FIELDS = ['last-update', 'last-commit', 'created', 'last-release']
+def print_report(results: list, verbose: bool = False):
+    """Print the banner and every result with something to report."""
+    print("\n" + "=" * 60)
+    print("SLACK CLI TOOLS YAML VALIDATION")
+    print("=" * 60)
 
+    for result in results:
+        result.print_results(verbose)
 
-# =============================================================================
-# VALIDATION FUNCTIONS
-# =============================================================================
 
-class ValidationResult:
-    def __init__(self, filename):
-        self.filename = filename
-        self.errors = []
-        self.warnings = []
-
-    def add_error(self, message):
-        self.errors.append(message)
-
-    def add_warning(self, message):
-        self.warnings.append(message)
-
-    @property
-    def is_valid(self):
-        return len(self.errors) == 0
-
-    def print_results(self, verbose=False):
-        if not self.errors and not self.warnings:
-            if verbose:
-                print(f"  {self.filename}")
-            return
-
-        print(f"\n{self.filename}:")
-        for error in self.errors:
-            print(f"  {error}")
-        for warning in self.warnings:
-            print(f"  {warning}")
-
-
-def validate_date(value, field_name):
-    """Validate date format (YYYY-MM-DD)."""
-    if not DATE_PATTERN.match(str(value)):
-        return f"Invalid date format for '{field_name}': {value} (expected YYYY-MM-DD)"
-    try:
-        datetime.strptime(str(value), '%Y-%m-%d')
-    except ValueError:
-        return f"Invalid date value for '{field_name}': {value}"
-    return None
-
-
-def validate_url(value, field_name):
-    """Validate URL format."""
-    if not URL_PATTERN.match(str(value)):
-        return f"Invalid URL for '{field_name}': {value} (must start with http:// or https://)"
-    return None
-
-
-def validate_commit_hash(value, field_name):
-    """Validate git commit hash format."""
-    if not COMMIT_PATTERN.match(str(value)):
-        return f"Invalid commit hash for '{field_name}': {value}"
-    return None
-
-
-def validate_enum(value, field_name, valid_values):
-    """Validate value against allowed enum values."""
-    if value not in valid_values:
-        return f"Invalid value for '{field_name}': {value} (valid: {', '.join(valid_values)})"
-    return None
-
-
-def validate_type(value, field_name, expected_type, type_name):
-    """Validate value type."""
-    if not isinstance(value, expected_type):
-        return f"Invalid type for '{field_name}': expected {type_name}, got {type(value).__name__}"
-    return None
-
-
-def validate_evidence(evidence: dict, prefix: str, result: 'ValidationResult'):
-    """Validate an evidence sub-object."""
-    # Validate source-type enum
-    if 'source-type' in evidence and evidence['source-type']:
-        error = validate_enum(evidence['source-type'], f'{prefix}.source-type',
-                             VALID_EVIDENCE_SOURCE_TYPES)
-        if error:
-            result.add_warning(error)
-
-    # Validate confidence enum
-    if 'confidence' in evidence and evidence['confidence']:
-        error = validate_enum(evidence['confidence'], f'{prefix}.confidence',
-                             VALID_EVIDENCE_CONFIDENCE)
-        if error:
-            result.add_warning(error)
-
-    # Validate retrieved-date format
-    if 'retrieved-date' in evidence and evidence['retrieved-date']:
-        error = validate_date(evidence['retrieved-date'], f'{prefix}.retrieved-date')
-        if error:
-            result.add_warning(error)
-
-    # Validate source-url format
-    if 'source-url' in evidence and evidence['source-url']:
-        error = validate_url(evidence['source-url'], f'{prefix}.source-url')
-        if error:
-            result.add_warning(error)
-
-    # Validate source-commit format
-    if 'source-commit' in evidence and evidence['source-commit']:
-        error = validate_commit_hash(evidence['source-commit'], f'{prefix}.source-commit')
-        if error:
-            result.add_warning(error)
-
-
-def validate_file(filepath: Path, verbose: bool = False) -> ValidationResult:
-    """Validate a single YAML file."""
-    result = ValidationResult(filepath.name)
-
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        result.add_error(f"YAML parsing error: {e}")
-        return result
-    except Exception as e:
-        result.add_error(f"File read error: {e}")
-        return result
-
-    if data is None:
-        result.add_error("Empty YAML file")
-        return result
-
-    # Check required fields
-    for field in REQUIRED_FIELDS:
-        if field not in data:
-            result.add_error(f"Missing required field: '{field}'")
-
-    # Validate date fields
-    for field in DATE_FIELDS:
-        if field in data and data[field]:
-            error = validate_date(data[field], field)
-            if error:
-                result.add_error(error)
-
-    # Validate URL fields
-    if 'repo-url' in data and data['repo-url']:
-        error = validate_url(data['repo-url'], 'repo-url')
-        if error:
-            result.add_error(error)
-
-    if 'documentation' in data and isinstance(data['documentation'], dict):
-        if 'website' in data['documentation'] and data['documentation']['website']:
-            error = validate_url(data['documentation']['website'], 'documentation.website')
-            if error:
-                result.add_warning(error)
-
-    # Validate commit hash
-    if 'repo-commit' in data and data['repo-commit']:
-        error = validate_commit_hash(data['repo-commit'], 'repo-commit')
-        if error:
-            result.add_warning(error)
-
-    # Validate enum fields
-    if 'language' in data and data['language']:
-        error = validate_enum(data['language'], 'language', VALID_LANGUAGES)
-        if error:
-            result.add_error(error)
-
-    if 'category' in data and data['category']:
-        error = validate_enum(data['category'], 'category', VALID_CATEGORIES)
-        if error:
-            result.add_error(error)
-
-    if 'maintenance-tier' in data and data['maintenance-tier']:
-        error = validate_enum(data['maintenance-tier'], 'maintenance-tier', VALID_MAINTENANCE_TIERS)
-        if error:
-            result.add_warning(error)
-
-    if 'commit-frequency' in data and data['commit-frequency']:
-        error = validate_enum(data['commit-frequency'], 'commit-frequency', VALID_COMMIT_FREQUENCIES)
-        if error:
-            result.add_warning(error)
-
-    # Validate integer fields
-    for field in INTEGER_FIELDS:
-        if field in data and data[field] is not None:
-            if not isinstance(data[field], int):
-                result.add_error(f"Field '{field}' must be an integer, got {type(data[field]).__name__}")
-
-    # Validate boolean fields
-    for field in BOOLEAN_FIELDS:
-        if field in data and data[field] is not None:
-            if not isinstance(data[field], bool):
-                result.add_error(f"Field '{field}' must be a boolean, got {type(data[field]).__name__}")
-
-    # Validate array fields
-    for field in ['features', 'notes', 'warnings', 'languages', 'secondary-categories']:
-        if field in data and data[field] is not None:
-            if not isinstance(data[field], list):
-                result.add_error(f"Field '{field}' must be an array, got {type(data[field]).__name__}")
-
-    # Validate object fields
-    for field in ['slack-features', 'authentication', 'output-formats', 'terminal-features',
-                  'installation', 'documentation', 'ai-friendly', 'read-capabilities',
-                  'query-options', 'communication-features', 'attachment-handling',
-                  'export-capabilities', 'mcp-integration', 'api-coverage']:
-        if field in data and data[field] is not None:
-            if not isinstance(data[field], dict):
-                result.add_error(f"Field '{field}' must be an object, got {type(data[field]).__name__}")
-
-    # Validate api-coverage section
-    if 'api-coverage' in data and isinstance(data['api-coverage'], dict):
-        api_cov = data['api-coverage']
-
-        # Validate methods arrays
-        for array_field in ['methods-supported', 'methods-planned', 'coverage-notes']:
-            if array_field in api_cov and api_cov[array_field] is not None:
-                if not isinstance(api_cov[array_field], list):
-                    result.add_error(f"api-coverage.{array_field} must be an array")
-
-        # Validate methods-partial (array of objects or strings)
-        if 'methods-partial' in api_cov and api_cov['methods-partial']:
-            if not isinstance(api_cov['methods-partial'], list):
-                result.add_error("api-coverage.methods-partial must be an array")
-            else:
-                for i, item in enumerate(api_cov['methods-partial']):
-                    if isinstance(item, dict):
-                        if 'method' not in item:
-                            result.add_warning(f"api-coverage.methods-partial[{i}] should have 'method' field")
-
-        # Validate undocumented-methods (array of objects)
-        if 'undocumented-methods' in api_cov and api_cov['undocumented-methods']:
-            if not isinstance(api_cov['undocumented-methods'], list):
-                result.add_error("api-coverage.undocumented-methods must be an array")
-            else:
-                for i, item in enumerate(api_cov['undocumented-methods']):
-                    if isinstance(item, dict):
-                        if 'method' not in item:
-                            result.add_warning(f"api-coverage.undocumented-methods[{i}] should have 'method' field")
-
-        # Validate evidence sub-object if present
-        if 'evidence' in api_cov and isinstance(api_cov['evidence'], dict):
-            validate_evidence(api_cov['evidence'], 'api-coverage.evidence', result)
-
-    # Filename convention check
-    expected_pattern = re.compile(r'^[a-zA-Z0-9_-]+--[a-zA-Z0-9_-]+\.yaml$')
-    if not expected_pattern.match(filepath.name):
-        result.add_warning(f"Filename should follow pattern: {{owner}}--{{repo}}.yaml")
-
-    # Cross-field consistency checks
-    if data.get('archived') and data.get('maintenance-tier') != 'archived':
-        result.add_warning("If 'archived' is true, 'maintenance-tier' should be 'archived'")
-
-    if data.get('reputable-source') and not data.get('organization'):
-        result.add_warning("If 'reputable-source' is true, 'organization' should be specified")
-
-    return result
-
-
-def validate_all(projects_dir: Path, verbose: bool = False) -> list:
-    """Validate all YAML files in the projects directory."""
-    results = []
-    yaml_files = sorted(projects_dir.glob('*.yaml'))
-
-    for filepath in yaml_files:
-        result = validate_file(filepath, verbose)
-        results.append(result)
-
-    return results
+def print_summary(results: list, strict: bool = False, revalidated: int = None) -> int:
+    """Print the totals and verdict; return the exit status."""
+    total_errors = 0
+    total_warnings = 0
+    valid_files = 0
+
+    for result in results:
+        total_errors += len(result.errors)
+        total_warnings += result.warning_count
+        if result.is_valid:
+            valid_files += 1
+
+    # Summary
+    print("\n" + "-" * 60)
+    print(f"Files checked: {len(results)}")
+    if revalidated is not None:
+        print(f"Revalidated:   {revalidated}")
+    print(f"Valid files:   {valid_files}")
+    print(f"Errors:        {total_errors}")
+    print(f"Warnings:      {total_warnings}")
+    print("-" * 60)
+
+    if total_errors > 0:
+        print("\nValidation FAILED")
+        return 1
+    elif strict and total_warnings > 0:
+        print("\nValidation FAILED (strict mode)")
+        return 1
+    else:
+        print("\nValidation PASSED")
+        return 0
+
+
+def watch_validation(args, repo_root: Path, projects_dir: Path, cache: YamlCache) -> int:
+    """
+    --watch: keep every parsed file in memory and, whenever one changes,
+    revalidate just that file (all of them if spec.yaml changed).
+    """
+    spec_path = repo_root / 'spec.yaml'
+    watcher = open_watcher([(projects_dir, '*.yaml'), file_target(spec_path)], poll=args.poll)
+    catalog = WatchedCatalog(projects_dir, cache, args.jobs)
+    results = {}
+
+    def revalidate(paths) -> list:
+        for path in paths:
+            data, error = catalog.results[path]
+            results[path] = validate_document(path, data, error)
+        for path in set(results) - set(catalog.results):
+            del results[path]
+
+        return [results[path] for path in catalog.paths if path in paths]
+
+    def on_change(paths):
+        if spec_path.resolve() in {path.resolve() for path in paths}:
+            set_plan(load_plan(spec_path, cache))
+            catalog.refresh(paths)
+            changed = catalog.paths
+        else:
+            change = catalog.refresh(paths)
+            changed = [path for path in catalog.paths if path in change.paths]
+            if not changed and set(results) == set(catalog.results):
+                return
+        shown = revalidate(changed)
+        print_report(shown, verbose=True)
+        print_summary(list(results[path] for path in catalog.paths), args.strict, len(changed))
+
+    revalidate(catalog.paths)
+    cache.save()
+    print_report([results[path] for path in catalog.paths], args.verbose)
+    print_summary([results[path] for path in catalog.paths], args.strict)
+    sys.stdout.flush()
+
+    return watch(watcher, on_change, cache)
 
 
 # =============================================================================
@@ -373,8 +150,36 @@ def main():
         action='store_true',
         help='Show all checks including passes'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always re-parse YAML instead of using the on-disk parse cache'
+    )
+    add_jobs_argument(parser)
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only revalidate files changed since the last incremental run'
+    )
+    parser.add_argument(
+        '--since',
+        metavar='REF',
+        help='Only revalidate files changed since a git ref (implies --incremental)'
+    )
+    parser.add_argument(
+        '--print-plan',
+        action='store_true',
+        help='Print the validation plan compiled from spec.yaml as JSON and exit'
+    )
+
+    add_watch_arguments(parser)
+    add_profile_arguments(parser)
 
     args = parser.parse_args()
+    profiler = start_profiler(args)
+    if args.watch and (args.files or args.incremental or args.since):
+        parser.error('--watch always validates all of projects/; it cannot be combined '
+                     'with file arguments, --incremental or --since')
 
     # Find project directory
     script_dir = Path(__file__).parent
@@ -385,51 +190,60 @@ def main():
         print(f"Error: Projects directory not found: {projects_dir}")
         sys.exit(1)
 
+    cache = open_cache(repo_root, enabled=not args.no_cache)
+    with profiler.phase('load plan'):
+        set_plan(load_plan(repo_root / 'spec.yaml', cache))
+
+    if args.print_plan:
+        print(dump_plan(get_plan()))
+        cache.save()
+        sys.exit(0)
+
+    if args.watch:
+        sys.exit(watch_validation(args, repo_root, projects_dir, cache))
+
     # Validate files
     if args.files:
-        results = []
+        paths = []
         for file_path in args.files:
             filepath = Path(file_path)
             if not filepath.exists():
                 print(f"Error: File not found: {filepath}")
                 continue
-            results.append(validate_file(filepath, args.verbose))
+            paths.append(filepath)
+        directory = None
     else:
-        results = validate_all(projects_dir, args.verbose)
-
-    # Print results
-    total_errors = 0
-    total_warnings = 0
-    valid_files = 0
-
-    print("\n" + "=" * 60)
-    print("SLACK CLI TOOLS YAML VALIDATION")
-    print("=" * 60)
-
-    for result in results:
-        result.print_results(args.verbose)
-        total_errors += len(result.errors)
-        total_warnings += len(result.warnings)
-        if result.is_valid:
-            valid_files += 1
+        paths = sorted(projects_dir.glob('*.yaml'))
+        directory = projects_dir
+
+    revalidated = None
+    if args.incremental or args.since:
+        changed = None
+        if args.since:
+            try:
+                changed = changed_since(repo_root, args.since, projects_dir)
+            except RuntimeError as e:
+                print(f"Error: Cannot list files changed since '{args.since}': {e}")
+                sys.exit(1)
+
+        package = script_dir / 'slackkb'
+        fingerprint = validator_fingerprint([Path(__file__), package / 'schema.py',
+                                             package / 'validate.py', repo_root / 'spec.yaml'])
+        manifest = Manifest(default_manifest_file(repo_root), fingerprint)
+        with profiler.phase('validate (incremental)'):
+            results, revalidated = validate_incremental(paths, manifest, cache, args.jobs,
+                                                        changed, directory)
+        manifest.save()
+    else:
+        with profiler.phase('validate'):
+            results = validate_paths(paths, cache, args.jobs)
 
-    # Summary
-    print("\n" + "-" * 60)
-    print(f"Files checked: {len(results)}")
-    print(f"Valid files:   {valid_files}")
-    print(f"Errors:        {total_errors}")
-    print(f"Warnings:      {total_warnings}")
-    print("-" * 60)
+    with profiler.phase('save cache'):
+        cache.save()
 
-    if total_errors > 0:
-        print("\nValidation FAILED")
-        sys.exit(1)
-    elif args.strict and total_warnings > 0:
-        print("\nValidation FAILED (strict mode)")
-        sys.exit(1)
-    else:
-        print("\nValidation PASSED")
-        sys.exit(0)
+    with profiler.phase('report'):
+        print_report(results, args.verbose)
+    sys.exit(print_summary(results, args.strict, revalidated))
 
 
 if __name__ == '__main__':
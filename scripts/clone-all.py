@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Clone or update all tracked repositories into tmp/ for analysis.
+
+Projects come from the catalog loader (and its parsed-YAML cache), and up
+to --jobs repositories are fetched at once. Each repository is mirrored
+once, blobless, into .cache/mirrors/; its clone in tmp/ borrows the mirror's
+history and downloads only the files it checks out. See slackkb/clones.py.
+
+Usage:
+    ./scripts/clone-all.py                      # Clone all missing repos
+    ./scripts/clone-all.py --update             # Fetch and fast-forward existing clones
+    ./scripts/clone-all.py --pin                # Check out each project's repo-commit
+    ./scripts/clone-all.py --force              # Remove and re-clone all
+    ./scripts/clone-all.py --dry-run            # Show what would be done
+    ./scripts/clone-all.py rusq--slackdump      # Only these tools (file name or name)
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+
+from slackkb.cache import open_cache
+from slackkb.catalog import Catalog
+from slackkb.clones import (DEFAULT_CLONE_JOBS, CloneOptions, default_clones_dir,
+                            default_mirrors_dir, select_projects, sync_clones)
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Clone or update the tracked tool repositories'
+    )
+    parser.add_argument('tools', nargs='*',
+                        help='Only these tools (project file name or name; default: all)')
+    parser.add_argument('--update', action='store_true',
+                        help='Fetch mirrors and clones and fast-forward the clones')
+    parser.add_argument('--force', action='store_true',
+                        help='Remove and re-clone existing clones')
+    parser.add_argument('--pin', action='store_true',
+                        help="Check out each project's repo-commit (detached)")
+    parser.add_argument('--full', action='store_true',
+                        help='Mirror every blob, not only the history (for offline re-clones)')
+    parser.add_argument('--shallow', action='store_true',
+                        help=argparse.SUPPRESS)
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help='Show what would be done without executing')
+    parser.add_argument('--projects-dir', type=str, default='projects',
+                        help='Directory holding the project files (default: projects/)')
+    parser.add_argument('--clones-dir', type=str,
+                        help='Directory for the clones (default: tmp/)')
+    parser.add_argument('--mirrors-dir', type=str,
+                        help='Directory for the bare mirrors (default: .cache/mirrors/)')
+    parser.add_argument('--jobs', '-j', type=int, default=DEFAULT_CLONE_JOBS, metavar='N',
+                        help=f'Fetch up to N repositories at once (default: {DEFAULT_CLONE_JOBS})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the parsed-YAML cache')
+
+    args = parser.parse_args()
+    if args.shallow:
+        # Blobless clones download about as little and keep the history
+        # that --pin and scan-api-usage.py need
+        print("Note: --shallow is no longer needed; clones are always blobless",
+              file=sys.stderr)
+
+    script_dir = Path(__file__).parent
+    repo_root = script_dir.parent
+    projects_dir = repo_root / args.projects_dir
+    clones_dir = Path(args.clones_dir) if args.clones_dir else default_clones_dir(repo_root)
+    mirrors_dir = Path(args.mirrors_dir) if args.mirrors_dir else default_mirrors_dir(repo_root)
+
+    cache = open_cache(repo_root, enabled=not args.no_cache)
+    catalog = Catalog.load(projects_dir, cache)
+    cache.save()
+    for filepath, e in catalog.errors:
+        print(f"Warning: Failed to load {filepath}: {e}", file=sys.stderr)
+
+    projects = select_projects(catalog.projects, args.tools)
+    if args.tools and not projects:
+        print(f"Error: No projects match: {', '.join(args.tools)}")
+        return 1
+    if not projects:
+        print(f"Error: No project files in {projects_dir}")
+        return 1
+
+    # A missing or private repository must fail, not wait for a password
+    os.environ.setdefault('GIT_TERMINAL_PROMPT', '0')
+
+    options = CloneOptions(update=args.update, force=args.force, pin=args.pin,
+                           full=args.full, dry_run=args.dry_run)
+    print(f"Processing {len(projects)} projects ({args.jobs} at a time)...\n")
+
+    counts = {}
+    for result in sync_clones(projects, clones_dir, mirrors_dir, options, args.jobs):
+        name = Path(result.project.filename).stem
+        if result.action == 'planned':
+            status = result.detail
+        elif result.detail:
+            status = f"{result.action} ({result.detail})"
+        else:
+            status = result.action
+        print(f"{name}: {status}", flush=True)
+        counts[result.action] = counts.get(result.action, 0) + 1
+
+    print()
+    print("=========================================")
+    print("Summary:")
+    print(f"  Total:   {len(projects)}")
+    actions = ('planned', 'skipped') if args.dry_run else (
+        'cloned', 'updated', 'pinned', 'skipped', 'failed')
+    for action in actions:
+        print(f"  {action.capitalize() + ':':<8} {counts.get(action, 0)}")
+    print("=========================================")
+    return 1 if counts.get('failed') else 0
+
+
+if __name__ == '__main__':
+    exit(main())
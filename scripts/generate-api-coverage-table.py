@@ -13,339 +13,159 @@ Features:
 
 Usage:
     python generate-api-coverage-table.py [--by-category] [--by-tool] [--summary]
+    python generate-api-coverage-table.py --versions [--spec-dir DIR]
+    python generate-api-coverage-table.py --surfaces [scim,audit,undocumented]
+    python generate-api-coverage-table.py --watch --output comparisons/api-coverage-comparison.md
 """
 
+import sys
 import argparse
-import json
-import yaml
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, List, Set, Tuple
-
-
-def load_openapi_methods(spec_path: Path) -> Dict[str, List[str]]:
+from typing import Dict, List
+
+from slackkb.cache import YamlCache, open_cache
+from slackkb.catalog import Catalog
+from slackkb.parallel import add_jobs_argument
+from slackkb.openapi import load_spec_index, load_spec_snapshots
+from slackkb.registry import SURFACES_CONFIG, load_registry
+from slackkb.watch import (Sections, WatchedCatalog, add_watch_arguments, file_target,
+                           open_watcher, update_index, watch)
+from slackkb.profile import add_profile_arguments, start_profiler
+from slackkb.coverage import CoverageMatrix, VersionedCoverage
+from slackkb.coverage_tables import (COVERAGE_FIELDS, generate_by_category_table,
+                                     generate_by_tool_table, generate_gaps_table,
+                                     generate_summary, generate_versions_table)
+
+
+def load_openapi_methods(spec_path: Path, use_index: bool = True) -> Dict[str, List[str]]:
     """Load all API methods from OpenAPI spec, grouped by category."""
-    with open(spec_path, 'r', encoding='utf-8') as f:
-        spec = json.load(f)
-
-    methods_by_category = defaultdict(list)
+    index = load_spec_index(spec_path, use_index=use_index)
+    for problem in index.problems:
+        print(f"Warning: {problem}", file=sys.stderr)
+    return index.categories()
 
-    for path in spec.get('paths', {}).keys():
-        method_name = path.lstrip('/')
-        if '.' in method_name:
-            category = method_name.split('.')[0]
-        else:
-            category = 'other'
-        methods_by_category[category].append(method_name)
 
-    # Sort methods within each category
-    for category in methods_by_category:
-        methods_by_category[category].sort()
+def warn_load_errors(catalog: Catalog):
+    for filepath, e in catalog.errors:
+        print(f"Warning: Error loading {filepath}: {e}")
 
-    return dict(methods_by_category)
-
-
-def get_tool_display_name(project: dict) -> str:
-    """
-    Get display name for a tool using owner/repo format.
 
-    This prevents column name collisions when multiple repos have same name
-    (e.g., rockymadden/slack-cli vs regisb/slack-cli vs cleentfaar/slack-cli).
-    """
-    repo_url = project.get('repo-url', '')
-    if 'github.com/' in repo_url:
-        # Extract owner/repo from URL
-        parts = repo_url.split('github.com/')[-1].rstrip('/').split('/')
-        if len(parts) >= 2:
-            return f"{parts[0]}/{parts[1]}"
-    # Fallback to name
-    return project.get('name', project.get('_filename', 'unknown'))
+def load_projects(projects_dir: Path, cache: YamlCache = None, jobs: int = 1) -> List[dict]:
+    """Load all project YAML files."""
+    catalog = Catalog.load(projects_dir, cache, jobs)
+    warn_load_errors(catalog)
+    return catalog.projects
 
 
-def load_projects(projects_dir: Path) -> List[dict]:
-    """Load all project YAML files."""
+def collect_projects(catalog: WatchedCatalog) -> List[dict]:
+    """A watched catalog's projects, warning about files that failed to load."""
     projects = []
-    for filepath in sorted(projects_dir.glob('*.yaml')):
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                if data:
-                    data['_filename'] = filepath.name
-                    data['_display_name'] = get_tool_display_name(data)
-                    projects.append(data)
-        except Exception as e:
-            print(f"Warning: Error loading {filepath}: {e}")
+    for filepath, project, error in catalog.models():
+        if error is not None:
+            print(f"Warning: Failed to load {filepath}: {error}", file=sys.stderr)
+        elif project is not None:
+            projects.append(project)
     return projects
 
 
-def get_tool_methods(project: dict) -> Tuple[Set[str], Set[str]]:
-    """
-    Get supported and partial methods for a tool.
-
-    Returns (supported_methods, partial_methods)
-    """
-    api_coverage = project.get('api-coverage', {})
-
-    supported = set(api_coverage.get('methods-supported', []))
-
-    partial = set()
-    for item in api_coverage.get('methods-partial', []):
-        if isinstance(item, dict):
-            partial.add(item.get('method', ''))
-        else:
-            partial.add(str(item))
-
-    return supported, partial
-
-
-def calculate_coverage(project: dict, all_methods: Dict[str, List[str]]) -> Dict[str, dict]:
-    """Calculate coverage statistics for a project by category."""
-    supported, partial = get_tool_methods(project)
-    all_supported = supported | partial
-
-    coverage = {}
-    for category, methods in all_methods.items():
-        category_methods = set(methods)
-        covered = category_methods & all_supported
-        coverage[category] = {
-            'covered': len(covered),
-            'total': len(methods),
-            'percentage': round(len(covered) / len(methods) * 100, 1) if methods else 0,
-            'methods': sorted(covered)
-        }
-
-    # Calculate overall
-    total_methods = sum(len(m) for m in all_methods.values())
-    total_covered = len(all_supported)
-    coverage['_overall'] = {
-        'covered': total_covered,
-        'total': total_methods,
-        'percentage': round(total_covered / total_methods * 100, 1) if total_methods else 0
-    }
-
-    return coverage
+def write_output(output: str, output_file: str = None):
+    """Write to output_file, or print."""
+    if output_file:
+        output_path = Path(output_file)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(output)
+        print(f"Output written to {output_path}")
+    else:
+        print(output)
 
 
-def filter_active_tools(projects: List[dict]) -> Tuple[List[dict], List[dict]]:
+def report_sections(args) -> Sections:
+    """The tables selected by args, as independently re-rendered sections."""
+    # Default to --all if no specific option
+    show_all = args.all or not any([args.by_category, args.by_tool, args.summary, args.gaps])
+
+    def header(matrix):
+        return ("# Slack API Coverage Comparison\n\n"
+                "*Auto-generated from project YAML files and official Slack OpenAPI spec*\n")
+
+    def table(generate):
+        # Each table is followed by a blank line
+        return lambda matrix: generate(matrix, matrix.all_methods) + "\n"
+
+    sections = [('header', header, ())]
+    if args.summary or show_all:
+        sections.append(('summary', table(generate_summary), COVERAGE_FIELDS))
+    if args.by_tool or show_all:
+        sections.append(('by-tool', table(generate_by_tool_table), COVERAGE_FIELDS))
+    if args.by_category or show_all:
+        sections.append(('by-category', table(generate_by_category_table), COVERAGE_FIELDS))
+    if args.gaps or show_all:
+        sections.append(('gaps', table(generate_gaps_table), COVERAGE_FIELDS))
+    return Sections(sections)
+
+
+def watch_report(args, repo_root: Path, spec_path: Path, projects_dir: Path,
+                 cache: YamlCache, surfaces: List[str] = None) -> int:
     """
-    Filter projects to those with API coverage data.
-
-    Returns (active_tools, excluded_tools)
+    --watch: keep the catalog and method registry in memory and, whenever a
+    project file or the spec changes, re-render only the affected tables.
     """
-    active = []
-    excluded = []
-
-    for p in projects:
-        api_coverage = p.get('api-coverage', {})
-        methods = api_coverage.get('methods-supported', [])
-        partial = api_coverage.get('methods-partial', [])
-
-        if methods or partial:
-            active.append(p)
-        else:
-            excluded.append(p)
-
-    return active, excluded
-
-
-def format_coverage(covered: int, total: int) -> str:
-    """Format coverage as 'X/Y (Z%)'."""
-    if total == 0:
-        return '-'
-    pct = round(covered / total * 100)
-    return f"{covered}/{total} ({pct}%)"
-
-
-def generate_by_category_table(projects: List[dict], all_methods: Dict[str, List[str]]) -> str:
-    """Generate coverage table grouped by API category."""
-    active, excluded = filter_active_tools(projects)
-
-    if not active:
-        return "No tools have API coverage data.\n"
-
-    # Calculate coverage for each tool
-    tool_coverage = {}
-    for p in active:
-        tool_coverage[p['_display_name']] = calculate_coverage(p, all_methods)
-
-    # Find categories with at least some coverage
-    covered_categories = set()
-    for name, coverage in tool_coverage.items():
-        for cat, data in coverage.items():
-            if cat != '_overall' and data['covered'] > 0:
-                covered_categories.add(cat)
-
-    if not covered_categories:
-        return "No API methods are covered by any tool.\n"
-
-    # Build table
-    lines = []
-    lines.append("## API Coverage by Category\n")
-    lines.append("Coverage shown as: `covered/total (percentage)`\n")
-
-    # Header
-    tool_names = [p['_display_name'] for p in sorted(active, key=lambda x: -(x.get('stars') or 0))]
-    header = "| Category | " + " | ".join(tool_names) + " |"
-    separator = "|" + "|".join(["---"] * (len(tool_names) + 1)) + "|"
-
-    lines.append(header)
-    lines.append(separator)
-
-    # Rows for covered categories (sorted by total methods descending)
-    for cat in sorted(covered_categories,
-                      key=lambda c: -len(all_methods.get(c, []))):
-        total = len(all_methods[cat])
-        row = f"| **{cat}** ({total}) |"
-        for name in tool_names:
-            data = tool_coverage[name].get(cat, {'covered': 0, 'total': total})
-            row += f" {format_coverage(data['covered'], data['total'])} |"
-        lines.append(row)
-
-    # Overall row
-    lines.append("|" + "-" * 20 + "|" + "|".join(["-" * 15] * len(tool_names)) + "|")
-    row = "| **TOTAL** |"
-    for name in tool_names:
-        data = tool_coverage[name]['_overall']
-        row += f" {format_coverage(data['covered'], data['total'])} |"
-    lines.append(row)
-
-    # Uncovered categories
-    uncovered = set(all_methods.keys()) - covered_categories
-    if uncovered:
-        lines.append("\n### Categories Without Tool Coverage\n")
-        lines.append("The following API categories have no coverage from any tool:\n")
-        for cat in sorted(uncovered, key=lambda c: -len(all_methods.get(c, []))):
-            count = len(all_methods[cat])
-            lines.append(f"- **{cat}** ({count} methods)")
-
-    # Excluded tools
-    if excluded:
-        lines.append("\n### Tools Without API Coverage Data\n")
-        lines.append("The following tools have no `api-coverage` section:\n")
-        for p in excluded:
-            reason = p.get('warnings', ['No API coverage data'])[0]
-            lines.append(f"- **{p['_display_name']}**: {reason[:60]}...")
-
-    return "\n".join(lines)
-
-
-def generate_by_tool_table(projects: List[dict], all_methods: Dict[str, List[str]]) -> str:
-    """Generate summary table showing each tool's overall coverage."""
-    active, excluded = filter_active_tools(projects)
-
-    lines = []
-    lines.append("## API Coverage by Tool\n")
-
-    if not active:
-        lines.append("No tools have API coverage data.\n")
-        return "\n".join(lines)
-
-    # Header
-    lines.append("| Tool | Stars | Methods Covered | Coverage % | Top Categories |")
-    lines.append("|------|-------|-----------------|------------|----------------|")
-
-    # Calculate and sort by coverage
-    tool_data = []
-    for p in active:
-        coverage = calculate_coverage(p, all_methods)
-        overall = coverage['_overall']
-
-        # Find top 3 categories
-        top_cats = sorted(
-            [(cat, data) for cat, data in coverage.items() if cat != '_overall' and data['covered'] > 0],
-            key=lambda x: -x[1]['covered']
-        )[:3]
-        top_cats_str = ", ".join([f"{cat}({data['covered']})" for cat, data in top_cats])
-
-        tool_data.append({
-            'project': p,
-            'covered': overall['covered'],
-            'total': overall['total'],
-            'percentage': overall['percentage'],
-            'top_cats': top_cats_str
-        })
-
-    # Sort by coverage percentage descending
-    tool_data.sort(key=lambda x: -x['percentage'])
-
-    for td in tool_data:
-        p = td['project']
-        name = f"[{p['_display_name']}]({p.get('repo-url', '#')})"
-        stars = p.get('stars') or 0
-        lines.append(
-            f"| {name} | {stars} | {td['covered']}/{td['total']} | {td['percentage']}% | {td['top_cats']} |"
-        )
-
-    return "\n".join(lines)
-
-
-def generate_summary(projects: List[dict], all_methods: Dict[str, List[str]]) -> str:
-    """Generate high-level summary statistics."""
-    active, excluded = filter_active_tools(projects)
-
-    total_methods = sum(len(m) for m in all_methods.values())
-    total_categories = len(all_methods)
-
-    # Find all covered methods across all tools
-    all_covered = set()
-    for p in active:
-        supported, partial = get_tool_methods(p)
-        all_covered |= supported | partial
-
-    lines = []
-    lines.append("## Slack API Coverage Summary\n")
-    lines.append(f"- **Total API Methods**: {total_methods}")
-    lines.append(f"- **Total Categories**: {total_categories}")
-    lines.append(f"- **Tools with Coverage Data**: {len(active)}")
-    lines.append(f"- **Tools without Coverage Data**: {len(excluded)}")
-    lines.append(f"- **Methods Covered by At Least One Tool**: {len(all_covered)} ({round(len(all_covered)/total_methods*100, 1)}%)")
-    lines.append(f"- **Methods Not Covered by Any Tool**: {total_methods - len(all_covered)}")
-
-    return "\n".join(lines)
-
-
-def generate_gaps_table(projects: List[dict], all_methods: Dict[str, List[str]]) -> str:
-    """Show methods not covered by each tool."""
-    active, _ = filter_active_tools(projects)
-
-    if not active:
-        return "No tools have API coverage data.\n"
-
-    all_method_names = set()
-    for methods in all_methods.values():
-        all_method_names.update(methods)
-
-    lines = []
-    lines.append("## API Coverage Gaps by Tool\n")
-
-    for p in sorted(active, key=lambda x: -(x.get('stars') or 0)):
-        supported, partial = get_tool_methods(p)
-        covered = supported | partial
-        gaps = all_method_names - covered
-
-        lines.append(f"\n### {p['_display_name']}")
-        lines.append(f"Covered: {len(covered)}/{len(all_method_names)} ({round(len(covered)/len(all_method_names)*100, 1)}%)\n")
-
-        if gaps:
-            # Group gaps by category
-            gaps_by_cat = defaultdict(list)
-            for method in gaps:
-                if '.' in method:
-                    cat = method.split('.')[0]
-                else:
-                    cat = 'other'
-                gaps_by_cat[cat].append(method)
-
-            lines.append("<details>")
-            lines.append(f"<summary>Missing {len(gaps)} methods</summary>\n")
-            for cat in sorted(gaps_by_cat.keys()):
-                lines.append(f"**{cat}** ({len(gaps_by_cat[cat])}): " +
-                            ", ".join(sorted(gaps_by_cat[cat])[:10]))
-                if len(gaps_by_cat[cat]) > 10:
-                    lines.append(f"  ... and {len(gaps_by_cat[cat]) - 10} more")
-            lines.append("</details>")
-
-    return "\n".join(lines)
+    targets = [(projects_dir, '*.yaml'), file_target(spec_path)]
+    if surfaces:
+        targets.append(file_target(repo_root / SURFACES_CONFIG))
+    watcher = open_watcher(targets, poll=args.poll)
+
+    catalog = WatchedCatalog(projects_dir, cache, args.jobs)
+    sections = report_sections(args)
+    registry = None
+    matrix = None
+    written = None
+
+    def rebuild(change, reload_registry=False):
+        nonlocal registry, matrix, written
+        projects = collect_projects(catalog)
+        changed = None if change is None else change.fields
+        # The undocumented surface is derived from the project files
+        if (registry is None or reload_registry
+                or (surfaces and (changed is None or 'api-coverage' in changed))):
+            registry = load_registry(repo_root, spec_path, projects, surfaces,
+                                     cache=cache, use_index=not args.no_index)
+            for surface in registry.surfaces.values():
+                for problem in surface.problems:
+                    print(f"Warning: {problem}", file=sys.stderr)
+            matrix = None
+
+        # Recompute only the edited projects' rows while the registry stands
+        if matrix is None or changed is None or not update_index(matrix, projects, change):
+            matrix = CoverageMatrix(projects, registry)
+            changed = None
+        updated = sections.render(matrix, changed)
+        text = sections.text()
+        if text != written:
+            write_output(text, args.output)
+            written = text
+            if args.output:
+                print(f"Updated tables: {', '.join(updated)}", file=sys.stderr)
+
+    spec_files = {spec_path.resolve(), (repo_root / SURFACES_CONFIG).resolve()}
+
+    def on_change(paths):
+        if any(path.resolve() in spec_files for path in paths):
+            catalog.refresh(paths)
+            rebuild(None, reload_registry=True)
+            return
+        change = catalog.refresh(paths)
+        if change:
+            rebuild(change)
+
+    try:
+        rebuild(None)
+    except (OSError, ValueError) as e:
+        watcher.close()
+        print(f"Error: {e}")
+        return 1
+    cache.save()
+    return watch(watcher, on_change, cache)
 
 
 def main():
@@ -355,12 +175,28 @@ def main():
     parser.add_argument('--summary', action='store_true', help='High-level summary')
     parser.add_argument('--gaps', action='store_true', help='Show coverage gaps')
     parser.add_argument('--all', action='store_true', help='Generate all tables')
+    parser.add_argument('--surfaces', nargs='?', const='all', metavar='NAMES',
+                        help='Also cover the API surfaces in archived-sources/surfaces.yaml '
+                             '(comma-separated names, default: all)')
+    parser.add_argument('--versions', action='store_true',
+                        help='Coverage against every spec snapshot in --spec-dir, with method diffs')
     parser.add_argument('--output', type=str, help='Output file path')
     parser.add_argument('--spec-path', type=str,
                         default='archived-sources/slack-api/slack-web-openapi-v2.json')
+    parser.add_argument('--spec-dir', type=str,
+                        help='Directory of versioned spec snapshots (default: the spec\'s directory)')
     parser.add_argument('--projects-dir', type=str, default='projects')
+    parser.add_argument('--no-index', action='store_true',
+                        help='Parse the OpenAPI spec instead of its compiled sidecar index')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the parsed-YAML cache')
+    add_jobs_argument(parser)
+    add_watch_arguments(parser)
+    add_profile_arguments(parser)
 
     args = parser.parse_args()
+    profiler = start_profiler(args)
+    if args.watch and args.versions:
+        parser.error('--watch cannot be combined with --versions')
 
     # Find paths
     script_dir = Path(__file__).parent
@@ -377,45 +213,50 @@ def main():
         return 1
 
     # Load data
-    all_methods = load_openapi_methods(spec_path)
-    projects = load_projects(projects_dir)
-
-    # Default to --all if no specific option
-    if not any([args.by_category, args.by_tool, args.summary, args.gaps]):
-        args.all = True
-
-    # Generate output
-    output_parts = []
-
-    output_parts.append("# Slack API Coverage Comparison\n")
-    output_parts.append("*Auto-generated from project YAML files and official Slack OpenAPI spec*\n")
-
-    if args.summary or args.all:
-        output_parts.append(generate_summary(projects, all_methods))
-        output_parts.append("")
-
-    if args.by_tool or args.all:
-        output_parts.append(generate_by_tool_table(projects, all_methods))
-        output_parts.append("")
-
-    if args.by_category or args.all:
-        output_parts.append(generate_by_category_table(projects, all_methods))
-        output_parts.append("")
-
-    if args.gaps or args.all:
-        output_parts.append(generate_gaps_table(projects, all_methods))
-        output_parts.append("")
-
-    output = "\n".join(output_parts)
-
-    # Write or print output
-    if args.output:
-        output_path = Path(args.output)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(output)
-        print(f"Output written to {output_path}")
-    else:
-        print(output)
+    cache = open_cache(repo_root, enabled=not args.no_cache)
+    if args.watch:
+        surfaces = args.surfaces.split(',') if args.surfaces else None
+        return watch_report(args, repo_root, spec_path, projects_dir, cache, surfaces)
+    with profiler.phase('load projects'):
+        projects = load_projects(projects_dir, cache, args.jobs)
+
+    if args.versions:
+        cache.save()
+        spec_dir = repo_root / args.spec_dir if args.spec_dir else spec_path.parent
+        with profiler.phase('load spec snapshots'):
+            snapshots = load_spec_snapshots(spec_dir, use_index=not args.no_index)
+        if not snapshots:
+            print(f"Error: No spec snapshots found in {spec_dir}")
+            return 1
+        for label, index in snapshots.items():
+            for problem in index.problems:
+                print(f"Warning: {label}: {problem}", file=sys.stderr)
+        with profiler.phase('render and write'):
+            coverage = VersionedCoverage(
+                projects, {label: index.method_names for label, index in snapshots.items()})
+            write_output(generate_versions_table(coverage), args.output)
+        return 0
+
+    # Every surface is loaded once into one interned registry
+    surfaces = args.surfaces.split(',') if args.surfaces else None
+    try:
+        with profiler.phase('load registry'):
+            registry = load_registry(repo_root, spec_path, projects, surfaces,
+                                     cache=cache, use_index=not args.no_index)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    cache.save()
+    for surface in registry.surfaces.values():
+        for problem in surface.problems:
+            print(f"Warning: {problem}", file=sys.stderr)
+
+    with profiler.phase('coverage matrix'):
+        matrix = CoverageMatrix(projects, registry)
+    with profiler.phase('render and write'):
+        sections = report_sections(args)
+        sections.render(matrix)
+        write_output(sections.text(), args.output)
 
     return 0
 
@@ -6,84 +6,29 @@ This script reads the archived Slack OpenAPI spec and outputs structured data
 about all available API methods, grouped by category.
 
 Usage:
-    python parse-slack-openapi.py [--json] [--summary] [--list-methods]
+    python parse-slack-openapi.py [--json] [--ndjson] [--summary] [--list-methods]
+                                  [--category NAME] [--method NAME]
 
 Output modes:
     --json          Output full structured JSON
+    --ndjson        Output one JSON object per method per line, streamed
     --summary       Output category summary with method counts
     --list-methods  Output flat list of all method names
+    --method NAME   Output JSON for one method
+
+The spec is read through a compiled index stored next to it
+(slack-web-openapi-v2.index.json), rebuilt automatically when the spec or its
+.meta.json changes. Use --no-index to parse the spec itself.
 """
 
+import sys
 import argparse
 import json
 from pathlib import Path
-from collections import defaultdict
-
-
-def load_openapi_spec(spec_path: Path) -> dict:
-    """Load the OpenAPI specification JSON file."""
-    with open(spec_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
 
-def extract_methods(spec: dict) -> dict:
-    """
-    Extract all API methods from the OpenAPI spec.
-
-    Returns dict with structure:
-    {
-        "category": {
-            "method_name": {
-                "path": "/api/method.name",
-                "description": "...",
-                "parameters": [...],
-                "http_method": "get|post"
-            }
-        }
-    }
-    """
-    methods_by_category = defaultdict(dict)
-
-    paths = spec.get('paths', {})
-
-    for path, path_data in paths.items():
-        # Extract method name from path (e.g., "/conversations.history" -> "conversations.history")
-        method_name = path.lstrip('/')
-
-        # Get category from method name (e.g., "conversations.history" -> "conversations")
-        if '.' in method_name:
-            category = method_name.split('.')[0]
-        else:
-            category = 'other'
-
-        # Get HTTP method details (usually GET or POST)
-        for http_method in ['get', 'post', 'put', 'delete', 'patch']:
-            if http_method in path_data:
-                method_details = path_data[http_method]
-
-                # Extract parameters
-                parameters = []
-                for param in method_details.get('parameters', []):
-                    param_info = {
-                        'name': param.get('name'),
-                        'required': param.get('required', False),
-                        'type': param.get('type', 'unknown'),
-                        'description': param.get('description', '')[:100]  # Truncate
-                    }
-                    parameters.append(param_info)
-
-                methods_by_category[category][method_name] = {
-                    'path': path,
-                    'http_method': http_method.upper(),
-                    'description': method_details.get('description', '')[:200],
-                    'summary': method_details.get('summary', ''),
-                    'parameters': parameters,
-                    'parameter_count': len(parameters),
-                    'required_params': [p['name'] for p in parameters if p['required']]
-                }
-                break  # Only process first HTTP method found
-
-    return dict(methods_by_category)
+from slackkb.openapi import load_spec_index
+from slackkb.output import discard_stdout, write_ndjson
+from slackkb.profile import add_profile_arguments, start_profiler
 
 
 def get_summary(methods_by_category: dict) -> dict:
@@ -108,14 +53,21 @@ def get_summary(methods_by_category: dict) -> dict:
 def main():
     parser = argparse.ArgumentParser(description='Parse Slack OpenAPI specification')
     parser.add_argument('--json', action='store_true', help='Output full JSON')
+    parser.add_argument('--ndjson', action='store_true',
+                        help='Output one JSON object per method per line')
     parser.add_argument('--summary', action='store_true', help='Output summary only')
     parser.add_argument('--list-methods', action='store_true', help='List all method names')
     parser.add_argument('--category', type=str, help='Filter to specific category')
+    parser.add_argument('--method', type=str, help='Output JSON for a single method')
     parser.add_argument('--spec-path', type=str,
                         default='archived-sources/slack-api/slack-web-openapi-v2.json',
                         help='Path to OpenAPI spec file')
+    parser.add_argument('--no-index', action='store_true',
+                        help='Parse the spec directly instead of its compiled sidecar index')
+    add_profile_arguments(parser)
 
     args = parser.parse_args()
+    profiler = start_profiler(args)
 
     # Find spec file
     script_dir = Path(__file__).parent
@@ -127,9 +79,26 @@ def main():
         print("Run the archiver to download the spec first.")
         return 1
 
-    # Load and parse spec
-    spec = load_openapi_spec(spec_path)
-    methods = extract_methods(spec)
+    # Load the compiled index (rebuilt if the spec or its .meta.json changed)
+    with profiler.phase('load index'):
+        index = load_spec_index(spec_path, use_index=not args.no_index)
+    for problem in index.problems:
+        print(f"Warning: {problem}", file=sys.stderr)
+
+    # Single method: decode only its entry in the spec
+    if args.method:
+        record = index.method(args.method)
+        if record is None:
+            print(f"Error: Method '{args.method}' not found")
+            return 1
+        print(json.dumps({args.method: record}, indent=2))
+        return 0
+
+    # Method names per category come from the index alone; descriptions and
+    # parameters are only decoded for --json
+    methods = {}
+    for m in index.methods:
+        methods.setdefault(m['category'], {})[m['name']] = None
 
     # Filter by category if specified
     if args.category:
@@ -141,7 +110,18 @@ def main():
             return 1
 
     # Output based on mode
-    if args.list_methods:
+    if args.ndjson:
+        # One record per method, in spec order, written as it is decoded
+        records = ({'name': m['name'], 'category': m['category'], **record}
+                   for m, record in index.records(args.category))
+        with profiler.phase('write NDJSON'):
+            try:
+                write_ndjson(records, sys.stdout, flush=True)
+            except BrokenPipeError:
+                discard_stdout()
+                return 1
+
+    elif args.list_methods:
         # Flat list of all method names
         all_methods = []
         for category_methods in methods.values():
@@ -165,16 +145,22 @@ def main():
 
     elif args.json:
         # Full JSON output
+        with profiler.phase('decode methods'):
+            if args.category:
+                methods = {args.category: index.category(args.category)}
+            else:
+                methods = index.methods_by_category()
         output = {
             'spec_info': {
-                'title': spec.get('info', {}).get('title', 'Slack Web API'),
-                'version': spec.get('info', {}).get('version', 'unknown'),
+                'title': index.title,
+                'version': index.version,
                 'source': str(spec_path)
             },
             'summary': get_summary(methods),
             'methods_by_category': methods
         }
-        print(json.dumps(output, indent=2))
+        with profiler.phase('write JSON'):
+            print(json.dumps(output, indent=2))
 
     else:
         # Default: summary with method lists
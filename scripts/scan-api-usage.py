@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Detect the Slack API methods each tool uses by scanning its source.
+
+Every file of the clones in tmp/ (see clone-all.py) is searched once for
+all method names of the OpenAPI spec. Results are cached by git blob SHA in
+.cache/source-scan.pickle, so after clone-all.py --update only files that
+changed upstream are read and scanned again. The methods found, with file:line
+evidence, are compared with each project's api-coverage: "+" marks a
+method found in the source but not listed in the YAML, "-" a listed method
+that was not found.
+
+Usage:
+    ./scripts/scan-api-usage.py                      # Diff every cloned tool against its YAML
+    ./scripts/scan-api-usage.py rusq--slackdump      # Only these tools (file name or name)
+    ./scripts/scan-api-usage.py --all                # Also list the methods that agree
+    ./scripts/scan-api-usage.py --json               # Detected methods with evidence, as JSON
+    ./scripts/scan-api-usage.py --ndjson             # One JSON line per tool
+    ./scripts/scan-api-usage.py --evidence 0         # Keep every location (default: first 3)
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+from slackkb.cache import open_cache
+from slackkb.catalog import Catalog
+from slackkb.clones import cloned_projects, default_clones_dir, select_projects
+from slackkb.openapi import load_spec_index
+from slackkb.output import discard_stdout, write_ndjson
+from slackkb.parallel import add_jobs_argument
+from slackkb.profile import add_profile_arguments, start_profiler
+from slackkb.registry import get_tool_methods
+from slackkb.scancache import open_scan_cache
+from slackkb.scanner import CloneScan, scan_clones
+
+
+# =============================================================================
+# RESULTS
+# =============================================================================
+
+def tool_record(project, scan: CloneScan, spec_methods: set, evidence: int,
+                repo_root: Path) -> dict:
+    """What was detected in one clone, and how it differs from the YAML."""
+    supported, partial = get_tool_methods(project)
+    listed = (supported | partial) & spec_methods
+    detected = set(scan.evidence)
+    try:
+        clone = scan.root.relative_to(repo_root).as_posix()
+    except ValueError:
+        clone = str(scan.root)
+    return {
+        'tool': project.get('name'),
+        'file': project.filename,
+        'clone': clone,
+        'files': scan.files,
+        'detected': {method: scan.evidence[method][:evidence or None]
+                     for method in scan.methods},
+        'not-in-yaml': sorted(detected - listed),
+        'not-detected': sorted(listed - detected),
+    }
+
+
+def print_record(record: dict, show_all: bool = False):
+    """Print one tool's diff against its YAML."""
+    detected = record['detected']
+    added = set(record['not-in-yaml'])
+    print(f"\n{record['tool']}  ({record['clone']}, {record['files']} files)")
+    print(f"  {len(detected)} detected: {len(added)} not in YAML, "
+          f"{len(record['not-detected'])} listed but not found")
+
+    width = max([len(m) for m in detected] + [len(m) for m in record['not-detected']] + [0])
+    for method, locations in detected.items():
+        if method in added:
+            print(f"  + {method:<{width}}  {', '.join(locations)}")
+        elif show_all:
+            print(f"    {method:<{width}}  {', '.join(locations)}")
+    for method in record['not-detected']:
+        print(f"  - {method}")
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Detect Slack API methods in the cloned tool repositories'
+    )
+    parser.add_argument('tools', nargs='*',
+                        help='Only scan these tools (project file name or name; default: all)')
+    parser.add_argument('--all', action='store_true',
+                        help='Also list detected methods the YAML already has')
+    parser.add_argument('--json', action='store_true', help='Output as JSON')
+    parser.add_argument('--ndjson', action='store_true', help='Output one JSON line per tool')
+    parser.add_argument('--evidence', type=int, default=3, metavar='N',
+                        help='file:line locations kept per method (0 = all; default: 3)')
+    parser.add_argument('--clones-dir', type=str,
+                        help='Directory holding the clones (default: tmp/)')
+    parser.add_argument('--spec-path', type=str,
+                        default='archived-sources/slack-api/slack-web-openapi-v2.json',
+                        help='Path to OpenAPI spec file')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the parsed-YAML and scan caches')
+    add_jobs_argument(parser)
+    add_profile_arguments(parser)
+
+    args = parser.parse_args()
+    profiler = start_profiler(args)
+
+    script_dir = Path(__file__).parent
+    repo_root = script_dir.parent
+    projects_dir = repo_root / 'projects'
+    spec_path = repo_root / args.spec_path
+    clones_dir = Path(args.clones_dir) if args.clones_dir else default_clones_dir(repo_root)
+
+    if not spec_path.exists():
+        print(f"Error: OpenAPI spec not found at {spec_path}")
+        return 1
+
+    with profiler.phase('load projects'):
+        cache = open_cache(repo_root, enabled=not args.no_cache)
+        catalog = Catalog.load(projects_dir, cache, args.jobs)
+        cache.save()
+    for filepath, e in catalog.errors:
+        print(f"Warning: Failed to load {filepath}: {e}", file=sys.stderr)
+
+    projects = select_projects(catalog.projects, args.tools)
+    if args.tools and not projects:
+        print(f"Error: No projects match: {', '.join(args.tools)}")
+        return 1
+
+    cloned, missing = cloned_projects(projects, clones_dir)
+    for project, root in missing:
+        print(f"Warning: No clone of {project.get('name')} "
+              f"({root or 'no repo-url'})", file=sys.stderr)
+    if not cloned:
+        print(f"Error: No clones found in {clones_dir}. Run ./scripts/clone-all.py first.")
+        return 1
+
+    with profiler.phase('load spec'):
+        names = load_spec_index(spec_path).method_names
+    with profiler.phase('scan'):
+        scan_cache = open_scan_cache(repo_root, names, enabled=not args.no_cache)
+        scans = scan_clones([root for _, root in cloned], names, args.jobs, scan_cache)
+        scan_cache.save()
+
+    records = [tool_record(project, scan, set(names), args.evidence, repo_root)
+               for (project, _), scan in zip(cloned, scans)]
+
+    with profiler.phase('write'):
+        if args.ndjson:
+            try:
+                write_ndjson(records, sys.stdout, flush=True)
+            except BrokenPipeError:
+                discard_stdout()
+                return 1
+        elif args.json:
+            print(json.dumps(records, indent=2))
+        else:
+            for record in records:
+                print_record(record, args.all)
+            total_files = sum(scan.files for scan in scans)
+            total_bytes = sum(scan.bytes for scan in scans)
+            print(f"\nScanned {total_files} files ({total_bytes / (1 << 20):.1f} MiB) "
+                  f"in {len(scans)} clones for {len(names)} methods; "
+                  f"{scan_cache.misses} new blobs, {scan_cache.hits} from the scan cache")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
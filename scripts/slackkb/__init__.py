@@ -0,0 +1,58 @@
+"""
+Shared helpers for the Slack CLI tools comparison scripts.
+
+The executable scripts in scripts/ import this package directly (the script
+directory is on sys.path when they run), so everything here must stay
+importable without side effects.
+
+The same code is usable as a library. The names below are exported lazily,
+so `from slackkb.cache import ...` does not import the whole package:
+
+    from slackkb import Catalog, generate_full_report, load_spec_index
+
+    catalog = Catalog.load(Path('projects'))
+    results = catalog.validate()
+    report = catalog.render(generate_full_report, timestamp='none')
+    matrix = catalog.coverage(load_spec_index(spec_path).categories())
+    gaps = generate_gaps_table(matrix, matrix.all_methods)
+"""
+
+import importlib
+
+_EXPORTS = {
+    'slackkb.catalog': ['Catalog', 'load_projects'],
+    'slackkb.model': ['Project', 'Flags'],
+    'slackkb.validate': ['ValidationResult', 'validate_file', 'validate_document',
+                         'validate_paths', 'validate_all'],
+    'slackkb.tables': ['generate_full_report', 'generate_report_header', 'generate_statistics',
+                       'generate_overview_table', 'generate_by_category', 'generate_by_language',
+                       'generate_by_maintenance', 'generate_feature_matrix',
+                       'generate_read_capabilities_table', 'generate_query_options_table',
+                       'generate_communication_features_table',
+                       'generate_attachment_handling_table', 'generate_export_capabilities_table',
+                       'generate_mcp_integration_table', 'generate_auth_matrix',
+                       'generate_ai_friendly_table', 'generate_output_formats_table',
+                       'generate_installation_table'],
+    'slackkb.coverage': ['CoverageMatrix', 'VersionedCoverage'],
+    'slackkb.coverage_tables': ['calculate_coverage', 'filter_active_tools',
+                                'get_tool_display_name', 'generate_by_category_table',
+                                'generate_by_tool_table', 'generate_summary',
+                                'generate_gaps_table', 'generate_versions_table'],
+    'slackkb.openapi': ['load_spec_index'],
+    'slackkb.registry': ['load_registry'],
+    'slackkb.cache': ['YamlCache', 'open_cache'],
+    'slackkb.database': ['CatalogDatabase'],
+}
+
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_MODULES)
+
+
+def __getattr__(name):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module 'slackkb' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,46 @@
+"""
+Atomic file replacement for the caches and state files under .cache/.
+
+Each file is written to a temporary file in the same directory and renamed
+over the old one, so a reader (or a run that was interrupted) never sees a
+partial file. Failing to write is not an error: the file is only a cache.
+"""
+
+import os
+import json
+import pickle
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Callable
+
+
+def atomic_write(path: Path, write: Callable[[BinaryIO], None]) -> bool:
+    """
+    Replace path with what write(f) writes. Returns False, leaving any old
+    file alone, if that fails (a read-only checkout works without caches).
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.')
+    except OSError:
+        return False
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp_name, path)
+    except OSError:
+        os.unlink(tmp_name)
+        return False
+    return True
+
+
+def atomic_pickle_dump(path: Path, obj) -> bool:
+    """atomic_write() of obj, pickled."""
+    return atomic_write(path, lambda f: pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def atomic_json_dump(path: Path, obj) -> bool:
+    """atomic_write() of obj as compact JSON."""
+    return atomic_write(path, lambda f: f.write(
+        json.dumps(obj, separators=(',', ':')).encode('utf-8')))
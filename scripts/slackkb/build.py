@@ -0,0 +1,270 @@
+"""
+Make-style build graph for the generated comparison files.
+
+A Target declares its output, the input files it is built from (glob
+patterns relative to the repository root) and the command that writes it.
+A target is stale when its output is missing or the digest of its inputs
+(and command) differs from the one recorded after its last successful
+build. Digests are kept in .cache/build-state.json, with each input's
+stat so that unchanged files are not re-hashed.
+
+Stale targets whose prerequisites are done run in parallel. Each command
+writes a temporary file next to its output, which only replaces the output
+if the content differs, so an unchanged output keeps its mtime.
+"""
+
+import os
+import json
+import stat
+import hashlib
+import tempfile
+import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+
+from slackkb.atomic import atomic_json_dump
+from slackkb.cache import CACHE_DIRNAME, content_digest
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+STATE_VERSION = 1
+STATE_FILENAME = 'build-state.json'
+
+# Placeholder in a target's command for the file it must write
+OUTPUT = '{output}'
+
+
+def default_state_file(repo_root: Path) -> Path:
+    """Return the standard build state location for a repository checkout."""
+    return repo_root / CACHE_DIRNAME / STATE_FILENAME
+
+
+class BuildError(RuntimeError):
+    """A target's command failed."""
+
+
+# =============================================================================
+# TARGETS
+# =============================================================================
+
+class Target:
+    """An output file, the inputs it is built from and the command that builds it."""
+
+    def __init__(self, output: str, inputs: List[str], command: List[str]):
+        self.output = output
+        self.inputs = inputs
+        self.command = command
+
+    def input_paths(self, root: Path) -> List[str]:
+        """Inputs relative to root, globs expanded (a missing literal path is kept)."""
+        paths = set()
+        for pattern in self.inputs:
+            if any(c in pattern for c in '*?['):
+                paths.update(str(p.relative_to(root)) for p in root.glob(pattern))
+            else:
+                paths.add(pattern)
+        return sorted(paths)
+
+    def prerequisites(self, targets: Iterable['Target']) -> List['Target']:
+        """The targets producing any of this target's inputs."""
+        return [t for t in targets if t is not self and t.output in self.inputs]
+
+
+def with_prerequisites(selected: Iterable[Target], targets: List[Target]) -> List[Target]:
+    """The selected targets plus everything they are built from, in targets order."""
+    needed = set()
+    stack = list(selected)
+    while stack:
+        target = stack.pop()
+        if target.output not in needed:
+            needed.add(target.output)
+            stack.extend(target.prerequisites(targets))
+    return [t for t in targets if t.output in needed]
+
+
+# =============================================================================
+# STATE
+# =============================================================================
+
+class BuildState:
+    """Input digests of the last successful build of each target."""
+
+    def __init__(self, state_file: Optional[Path], root: Path):
+        self.state_file = state_file
+        self.root = root
+        self.files = {}
+        self.targets = {}
+        self._dirty = False
+        if state_file is not None:
+            self._read()
+
+    def _read(self):
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get('version') != STATE_VERSION:
+            self._dirty = True
+            return
+        self.files = payload.get('files', {})
+        self.targets = payload.get('targets', {})
+
+    def file_digest(self, relpath: str) -> str:
+        """Content hash of an input, re-hashed only when its stat changed."""
+        path = self.root / relpath
+        try:
+            stat = path.stat()
+        except OSError:
+            return '<missing>'
+
+        entry = self.files.get(relpath)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+
+        digest = content_digest(path.read_bytes())
+        self.files[relpath] = [stat.st_mtime_ns, stat.st_size, digest]
+        self._dirty = True
+        return digest
+
+    def digest(self, target: Target) -> str:
+        """Digest of everything a target is built from."""
+        h = hashlib.sha256()
+        h.update('\0'.join(target.command).encode('utf-8'))
+        for relpath in target.input_paths(self.root):
+            h.update(b'\0' + relpath.encode('utf-8') + b'\0')
+            h.update(self.file_digest(relpath).encode('ascii'))
+        return h.hexdigest()
+
+    def is_stale(self, target: Target) -> bool:
+        if not (self.root / target.output).exists():
+            return True
+        return self.targets.get(target.output) != self.digest(target)
+
+    def record(self, target: Target, digest: str):
+        self.targets[target.output] = digest
+        self._dirty = True
+
+    def save(self):
+        """Write the state back to disk if anything changed."""
+        if self.state_file is None or not self._dirty:
+            return
+
+        payload = {'version': STATE_VERSION, 'files': self.files, 'targets': self.targets}
+        if atomic_json_dump(self.state_file, payload):
+            self._dirty = False
+
+
+# =============================================================================
+# RUNNING
+# =============================================================================
+
+# Read once, while only one thread runs: os.umask() can only be read by setting it
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+
+def output_mode(output: Path) -> int:
+    """Permissions for a rebuilt output: the existing file's, else the umask default."""
+    try:
+        return stat.S_IMODE(output.stat().st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def run_target(target: Target, root: Path) -> bool:
+    """
+    Run a target's command into a temporary file and install it.
+
+    Returns True if the output was written, False if the new content was
+    identical to the existing output. Raises BuildError if the command fails.
+    """
+    output = root / target.output
+    output.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=output.parent, prefix=f'.{output.name}.')
+    os.close(fd)
+    # mkstemp creates the file 0600; the output keeps its mode as before
+    os.chmod(tmp_name, output_mode(output))
+
+    try:
+        command = [tmp_name if arg == OUTPUT else arg for arg in target.command]
+        proc = subprocess.run(command, cwd=root, capture_output=True, text=True)
+        if proc.returncode != 0:
+            detail = (proc.stderr or proc.stdout).strip()
+            raise BuildError(f"{target.output}: command exited with {proc.returncode}"
+                             + (f"\n{detail}" if detail else ''))
+
+        with open(tmp_name, 'rb') as f:
+            content = f.read()
+        try:
+            with open(output, 'rb') as f:
+                if f.read() == content:
+                    return False
+        except OSError:
+            pass
+        os.replace(tmp_name, output)
+        return True
+    finally:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+
+def build(targets: List[Target], state: BuildState, jobs: int = 1, force: bool = False,
+          dry_run: bool = False,
+          report: Callable[[Target, str], None] = None) -> Dict[str, str]:
+    """
+    Bring targets up to date, running independent stale targets in parallel.
+
+    A target runs once all its prerequisites have been built. Returns
+    {output: status}, status being 'up to date', 'written', 'unchanged'
+    (rebuilt, identical content), 'stale' (dry run) or 'failed'. A target
+    whose prerequisite failed is 'skipped'.
+    """
+    report = report or (lambda target, status: None)
+    statuses = {}
+    pending = list(targets)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while pending:
+            # The next wave: targets whose prerequisites are all settled
+            wave = [t for t in pending
+                    if all(p.output in statuses for p in t.prerequisites(targets))]
+            if not wave:
+                raise BuildError('Dependency cycle between: '
+                                 + ', '.join(t.output for t in pending))
+            pending = [t for t in pending if t not in wave]
+
+            runs = {}
+            for target in wave:
+                blocked = [p.output for p in target.prerequisites(targets)
+                           if statuses.get(p.output) in ('failed', 'skipped')]
+                if blocked:
+                    statuses[target.output] = 'skipped'
+                elif not force and not state.is_stale(target):
+                    statuses[target.output] = 'up to date'
+                elif dry_run:
+                    statuses[target.output] = 'stale'
+                else:
+                    # Digest the inputs before running, so edits made during
+                    # the build leave the target stale for the next run
+                    digest = state.digest(target)
+                    runs[target] = (digest, pool.submit(run_target, target, state.root))
+                    continue
+                report(target, statuses[target.output])
+
+            for target, (digest, future) in runs.items():
+                try:
+                    written = future.result()
+                except (BuildError, OSError) as e:
+                    statuses[target.output] = 'failed'
+                    report(target, f'failed: {e}')
+                    continue
+                state.record(target, digest)
+                statuses[target.output] = 'written' if written else 'unchanged'
+                report(target, statuses[target.output])
+
+    return statuses
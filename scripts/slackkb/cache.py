@@ -0,0 +1,247 @@
+"""
+On-disk cache of parsed project YAML documents.
+
+Every script in this repository parses the same projects/*.yaml files, and
+PyYAML parsing dominates their run time. This cache stores each parsed
+document keyed by its resolved path. An entry is reused when the file's
+mtime and size are unchanged; if only the stat changed (e.g. after a fresh
+checkout), the content hash decides. A warm run over an unchanged catalog
+never calls the YAML parser.
+
+The cache is a single pickle file (a PickleStore), rewritten atomically on
+save() and kept under max_bytes by evicting the least recently used entries.
+Everything else under .cache/ is written through slackkb.atomic as well.
+"""
+
+import io
+import os
+import pickle
+import hashlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+from slackkb.atomic import atomic_pickle_dump
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+CACHE_VERSION = 1
+
+CACHE_DIRNAME = '.cache'
+CACHE_FILENAME = 'parsed-yaml.pickle'
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def default_cache_file(repo_root: Path) -> Path:
+    """Return the standard cache location for a repository checkout."""
+    return repo_root / CACHE_DIRNAME / CACHE_FILENAME
+
+
+def parse_yaml_bytes(raw: bytes, name: str = None):
+    """Parse raw file content exactly as the scripts always have."""
+    stream = io.StringIO(raw.decode('utf-8'))
+    if name is not None:
+        # PyYAML reports this name in error marks, as it does for open files
+        stream.name = name
+    return yaml.safe_load(stream)
+
+
+def content_digest(raw: bytes) -> str:
+    """Return the content hash used to validate cache entries."""
+    return hashlib.sha256(raw).hexdigest()
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class PickleStore(ABC):
+    """
+    A dict of entries persisted as one pickle file.
+
+    header() holds what a stored file must match to be reused (format
+    version, and whatever else the entries depend on); a mismatch starts
+    over. save() trims the entries with evict() and rewrites the file, only
+    if something changed.
+    """
+
+    def __init__(self, cache_file: Optional[Path]):
+        self.cache_file = cache_file
+        self.entries = {}
+        self._dirty = False
+
+        if cache_file is not None:
+            self._read()
+
+    @property
+    def enabled(self) -> bool:
+        return self.cache_file is not None
+
+    @abstractmethod
+    def header(self) -> dict:
+        """Values a stored file must carry for its entries to be reused."""
+
+    def _load(self, payload: dict):
+        self.entries = payload.get('entries', {})
+
+    def _dump(self) -> dict:
+        return {'entries': self.entries}
+
+    def evict(self):
+        pass
+
+    def _read(self):
+        try:
+            with open(self.cache_file, 'rb') as f:
+                payload = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return
+
+        if (not isinstance(payload, dict)
+                or any(payload.get(key) != value for key, value in self.header().items())):
+            # Stale format, or entries made by different code: start over
+            self._dirty = True
+            return
+        self._load(payload)
+
+    def save(self):
+        """Write the entries back to disk if anything changed."""
+        if not self.enabled or not self._dirty:
+            return
+
+        self.evict()
+        payload = self.header()
+        payload.update(self._dump())
+        if atomic_pickle_dump(self.cache_file, payload):
+            self._dirty = False
+
+
+class YamlCache(PickleStore):
+    """
+    Persistent map of file path -> parsed YAML document.
+
+    Entries record when they were last used, but that alone does not make
+    the cache dirty, so a warm run does not rewrite the file. The catalog
+    is far below max_bytes, so eviction rarely runs at all.
+    """
+
+    def __init__(self, cache_file: Optional[Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._clock = 0
+        super().__init__(cache_file)
+
+    def header(self) -> dict:
+        return {'version': CACHE_VERSION, 'yaml': yaml.__version__}
+
+    def _load(self, payload: dict):
+        super()._load(payload)
+        self._clock = payload.get('clock', 0)
+
+    def _dump(self) -> dict:
+        return {'clock': self._clock, 'entries': self.entries}
+
+    def _touch(self, entry: dict):
+        self._clock += 1
+        entry['used'] = self._clock
+
+    def lookup(self, filepath: Path, stat: os.stat_result = None, raw: bytes = None):
+        """
+        Return (True, document) if filepath has a valid entry, else (False, None).
+
+        Only stats the file unless the stat changed and raw content is needed
+        to compare hashes.
+        """
+        if not self.enabled:
+            return False, None
+
+        key = str(filepath.resolve())
+        entry = self.entries.get(key)
+        if entry is None:
+            return False, None
+
+        if stat is None:
+            stat = filepath.stat()
+
+        if entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+            if raw is None:
+                raw = filepath.read_bytes()
+            if entry['digest'] != content_digest(raw):
+                return False, None
+            entry['mtime_ns'] = stat.st_mtime_ns
+            entry['size'] = stat.st_size
+            self._dirty = True
+
+        self.hits += 1
+        self._touch(entry)
+        # Hand out a fresh copy so callers may annotate the document freely
+        return True, pickle.loads(entry['blob'])
+
+    def store(self, filepath: Path, stat: os.stat_result, digest: str, document):
+        """Record a freshly parsed document."""
+        self.misses += 1
+        if not self.enabled:
+            return
+
+        entry = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'digest': digest,
+            'blob': pickle.dumps(document, protocol=pickle.HIGHEST_PROTOCOL),
+        }
+        self._touch(entry)
+        self.entries[str(filepath.resolve())] = entry
+        self._dirty = True
+
+    def load(self, filepath: Path):
+        """
+        Return the parsed document for filepath, parsing only on a cache miss.
+
+        Raises the same exceptions as reading and parsing the file directly.
+        """
+        stat = filepath.stat()
+        raw = None
+
+        entry = self.entries.get(str(filepath.resolve())) if self.enabled else None
+        if entry is not None and (entry['mtime_ns'] != stat.st_mtime_ns
+                                  or entry['size'] != stat.st_size):
+            raw = filepath.read_bytes()
+
+        hit, document = self.lookup(filepath, stat, raw)
+        if hit:
+            return document
+
+        if raw is None:
+            raw = filepath.read_bytes()
+        document = parse_yaml_bytes(raw, str(filepath))
+        self.store(filepath, stat, content_digest(raw), document)
+        return document
+
+    def evict(self):
+        total = sum(len(e['blob']) for e in self.entries.values())
+        if total <= self.max_bytes:
+            return
+        for key, entry in sorted(self.entries.items(), key=lambda kv: kv[1]['used']):
+            total -= len(entry['blob'])
+            del self.entries[key]
+            if total <= self.max_bytes:
+                break
+
+
+def open_cache(repo_root: Path, enabled: bool = True) -> YamlCache:
+    """Open the repository's parse cache (a pass-through cache if disabled)."""
+    return YamlCache(default_cache_file(repo_root) if enabled else None)
+
+
+def load_yaml(filepath: Path, cache: Optional[YamlCache] = None):
+    """Parse a YAML file, going through cache when one is given."""
+    if cache is not None:
+        return cache.load(filepath)
+    return parse_yaml_bytes(filepath.read_bytes(), str(filepath))
@@ -0,0 +1,119 @@
+"""
+The project catalog, loaded once and shared by every consumer.
+
+A Catalog holds the projects parsed from the project files, as compact
+model.Project objects. Validation, the table renderers and the coverage
+matrix all work from the same parsed projects, so one process can validate,
+render and compute coverage from one load:
+
+    catalog = Catalog.load(Path('projects'), cache=open_cache(repo_root))
+    results = catalog.validate()
+    report = catalog.render(generate_full_report, timestamp='none')
+    matrix = catalog.coverage(load_spec_index(spec_path).categories())
+
+Nothing here prints or exits; files that failed to load are listed in
+Catalog.errors for the caller to report.
+"""
+
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from slackkb.cache import YamlCache
+from slackkb.coverage import CoverageMatrix
+from slackkb.index import CatalogIndex
+from slackkb.model import Project
+from slackkb.output import render
+from slackkb.parallel import iter_documents, load_documents
+from slackkb.validate import ValidationResult, validate_document
+
+
+def to_project(filepath: Path, data, error: Optional[Exception] = None
+               ) -> Tuple[Optional[Project], Optional[Exception]]:
+    """
+    (project, error) for one parsed file. Empty files give neither; a
+    document that is not a mapping is an error.
+    """
+    if error is None and data and isinstance(data, dict):
+        return Project(data, filepath.name), None
+    if error is None and data:
+        error = ValueError(f"top-level YAML is a {type(data).__name__}, not a mapping")
+    return None, error
+
+
+class Catalog:
+    """Parsed project files, in path order."""
+
+    def __init__(self, paths: List[Path], documents: List[Tuple[object, Optional[Exception]]]):
+        self.paths = list(paths)
+        self.projects = []
+        self.errors = []
+        # What validate() needs per path: the Project, or the raw document
+        # and error of a file that did not yield one
+        self._entries = []
+        for filepath, (data, error) in zip(self.paths, documents):
+            project, error = to_project(filepath, data, error)
+            if project is not None:
+                self.projects.append(project)
+                self._entries.append((project, None))
+                continue
+            self._entries.append((data, error))
+            if error is not None:
+                self.errors.append((filepath, error))
+        self._index = None
+
+    @classmethod
+    def load(cls, projects_dir: Path, cache: YamlCache = None, jobs: int = 1) -> 'Catalog':
+        """Parse every *.yaml file in projects_dir."""
+        return cls.from_paths(sorted(projects_dir.glob('*.yaml')), cache, jobs)
+
+    @classmethod
+    def from_paths(cls, paths: List[Path], cache: YamlCache = None, jobs: int = 1) -> 'Catalog':
+        """Parse the given project files."""
+        return cls(paths, load_documents(paths, cache, jobs))
+
+    def __len__(self):
+        return len(self.projects)
+
+    @property
+    def index(self) -> CatalogIndex:
+        """The projects sorted, grouped and packed for the table renderers (built once)."""
+        if self._index is None:
+            self._index = CatalogIndex(self.projects)
+        return self._index
+
+    def validate(self) -> List[ValidationResult]:
+        """Validate every file without re-parsing."""
+        results = []
+        for filepath, (data, error) in zip(self.paths, self._entries):
+            if isinstance(data, Project):
+                data = data.to_dict()
+            results.append(validate_document(filepath, data, error))
+        return results
+
+    def render(self, renderer: Callable, **kwargs) -> str:
+        """Render one of the tables.generate_* functions to a string."""
+        return render(renderer(self.index, **kwargs))
+
+    def coverage(self, all_methods) -> CoverageMatrix:
+        """
+        Coverage of every project against {category: [method names]} or a
+        registry.MethodRegistry; pass it to the coverage_tables renderers.
+        """
+        return CoverageMatrix(self.projects, all_methods)
+
+
+def load_projects(projects_dir: Path, cache: YamlCache = None, jobs: int = 1) -> List[Project]:
+    """Load all project YAML files (files that fail to parse are skipped)."""
+    return Catalog.load(projects_dir, cache, jobs).projects
+
+
+def iter_projects(paths: List[Path], cache: YamlCache = None, jobs: int = 1
+                  ) -> Iterator[Tuple[Path, Optional[Project], Optional[Exception]]]:
+    """
+    (path, project, error) for each file, in path order, yielded as soon as
+    the file is parsed rather than after the whole catalog is loaded.
+    """
+    for filepath, (data, error) in zip(paths, iter_documents(paths, cache, jobs)):
+        project, error = to_project(filepath, data, error)
+        if project is not None or error is not None:
+            yield filepath, project, error
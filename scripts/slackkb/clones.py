@@ -0,0 +1,291 @@
+"""
+Where the tracked repositories are cloned for analysis, and keeping them there.
+
+scripts/clone-all.py clones each project's repo-url into tmp/owner--repo
+(the same owner--repo naming as the project files). The helpers here map
+projects to those directories for the Python tools that read the clones,
+select_projects() and cloned_projects() pick what those tools work on, and
+sync_clones() creates and updates the clones.
+
+Every repository also has a bare mirror in .cache/mirrors/owner--repo.git,
+holding all of its refs. Mirrors are blobless (--filter=blob:none): they
+carry the full history of commits and trees, which is small, and no file
+contents. A clone in tmp/ borrows that history from its mirror through
+`git clone --reference`, so creating or re-creating it downloads only the
+blobs its checkout needs. Blobs are fetched from the upstream repository,
+since a blobless mirror has none to give. With full=True the mirrors keep
+every blob as well, and clones are made without any download at all.
+"""
+
+import re
+import shutil
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from slackkb.cache import CACHE_DIRNAME
+from slackkb.git import GitError, run_git
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+CLONES_DIRNAME = 'tmp'
+MIRRORS_DIRNAME = 'mirrors'
+
+# Cloning waits on the network, not the CPU
+DEFAULT_CLONE_JOBS = 8
+
+# https://host/owner/repo[/...] -> owner, repo
+REPO_URL_PATTERN = re.compile(r'^https?://[^/]+/([^/]+)/([^/]+)/?')
+
+# file:///any/path/owner/repo[.git] -> owner, repo (local repositories, for tests)
+FILE_URL_PATTERN = re.compile(r'^file://[^/]*/(?:.*/)?([^/]+)/([^/]+?)(?:\.git)?/?$')
+
+
+def default_clones_dir(repo_root: Path) -> Path:
+    """Return the standard clone location for a repository checkout."""
+    return repo_root / CLONES_DIRNAME
+
+
+def default_mirrors_dir(repo_root: Path) -> Path:
+    """Return the standard mirror cache location for a repository checkout."""
+    return repo_root / CACHE_DIRNAME / MIRRORS_DIRNAME
+
+
+def clone_dirname(repo_url: str) -> Optional[str]:
+    """owner--repo for a repository URL, or None if it is not one."""
+    match = REPO_URL_PATTERN.match(repo_url or '') or FILE_URL_PATTERN.match(repo_url or '')
+    if match is None:
+        return None
+    return f'{match.group(1)}--{match.group(2)}'
+
+
+def clone_dir(clones_dir: Path, project) -> Optional[Path]:
+    """The clone directory of a project (which may not exist yet)."""
+    dirname = clone_dirname(project.get('repo-url'))
+    return None if dirname is None else clones_dir / dirname
+
+
+def mirror_dir(mirrors_dir: Path, project) -> Optional[Path]:
+    """The bare mirror of a project's repository (which may not exist yet)."""
+    dirname = clone_dirname(project.get('repo-url'))
+    return None if dirname is None else mirrors_dir / f'{dirname}.git'
+
+
+# =============================================================================
+# SELECTION
+# =============================================================================
+
+def select_projects(projects: List, tools: Sequence[str]) -> List:
+    """
+    The projects named in tools, by name, project file name or file stem,
+    in catalog order. No tools selects every project.
+    """
+    if not tools:
+        return list(projects)
+    wanted = set(tools)
+    return [p for p in projects
+            if p.get('name') in wanted or Path(p.filename).stem in wanted
+            or p.filename in wanted]
+
+
+def cloned_projects(projects: List, clones_dir: Path) -> Tuple[List, List]:
+    """
+    Split projects into ([(project, clone root)], [(project, expected root)])
+    by whether their clone exists. The expected root of a project without a
+    usable repo-url is None.
+    """
+    cloned, missing = [], []
+    for project in projects:
+        root = clone_dir(clones_dir, project)
+        if root is None or not root.is_dir():
+            missing.append((project, root))
+        else:
+            cloned.append((project, root))
+    return cloned, missing
+
+
+# =============================================================================
+# MIRRORS
+# =============================================================================
+
+def sync_mirror(url: str, mirror: Path, fetch: bool = False, full: bool = False) -> bool:
+    """
+    Create the bare mirror of url, or with fetch=True bring an existing
+    one up to date. Returns True if anything was downloaded.
+    """
+    if mirror.exists():
+        if not fetch:
+            return False
+        run_git(mirror, 'fetch', '--quiet', '--prune', 'origin')
+        return True
+
+    mirror.parent.mkdir(parents=True, exist_ok=True)
+    args = ['clone', '--quiet', '--mirror']
+    if not full:
+        args.append('--filter=blob:none')
+    run_git(mirror.parent, *args, url, mirror.name)
+    # Clones in tmp/ read objects from here through their alternates, so
+    # nothing may ever be pruned
+    run_git(mirror, 'config', 'gc.auto', '0')
+    return True
+
+
+# =============================================================================
+# CLONES
+# =============================================================================
+
+class CloneOptions(NamedTuple):
+    update: bool = False    # fetch existing mirrors and clones
+    force: bool = False     # delete and re-create existing clones
+    pin: bool = False       # check out each project's repo-commit
+    full: bool = False      # keep every blob in the mirrors
+    dry_run: bool = False   # only report what would be done
+
+
+class CloneResult(NamedTuple):
+    project: object
+    target: Optional[Path]
+    # 'cloned', 'updated', 'pinned', 'skipped', 'failed', or 'planned' (dry run)
+    action: str
+    detail: str = ''
+
+
+def resolve_commit(root: Path, commit: str) -> Optional[str]:
+    """Full SHA of a (possibly abbreviated) commit, or None if root lacks it."""
+    try:
+        output = run_git(root, 'rev-parse', '--verify', '--quiet', f'{commit}^{{commit}}')
+    except GitError:
+        return None
+    return output.decode('ascii').strip() or None
+
+
+def _clone(url: str, target: Path, mirror: Path, full: bool):
+    target.parent.mkdir(parents=True, exist_ok=True)
+    args = ['clone', '--quiet', '--no-checkout', '--reference', str(mirror.resolve())]
+    if not full:
+        args.append('--filter=blob:none')
+    run_git(target.parent, *args, url, target.name)
+
+
+def _checkout(target: Path, commit: Optional[str], fresh: bool):
+    """Check out commit (detached), or the remote's default branch."""
+    if commit is not None:
+        run_git(target, 'checkout', '--quiet', '--detach', commit)
+        return
+    if fresh:
+        # Cloned with --no-checkout, already on the default branch
+        run_git(target, 'reset', '--quiet', '--hard', 'HEAD')
+        return
+    try:
+        run_git(target, 'merge', '--quiet', '--ff-only', '@{upstream}')
+    except GitError:
+        # Detached (pinned before) or diverged: take what the remote has
+        run_git(target, 'reset', '--quiet', '--hard', 'origin/HEAD')
+
+
+def _plan(target: Path, commit: Optional[str], options: CloneOptions) -> str:
+    at = f' at {commit}' if commit else ''
+    if not target.exists():
+        return f'would clone{at}'
+    if options.force:
+        return f'would re-clone{at}'
+    if options.update:
+        return f'would update{at}'
+    if commit:
+        return f'would check out {commit}'
+    return 'exists'
+
+
+def sync_clone(project, clones_dir: Path, mirrors_dir: Path,
+               options: CloneOptions = CloneOptions()) -> CloneResult:
+    """
+    Bring one project's clone in line with options.
+
+    A missing clone is created (after its mirror); an existing one is left
+    alone unless options ask to update, re-create or pin it. With pin, the
+    clone ends up detached at the project's repo-commit, fetching once if
+    the commit is not there yet; projects without one get the default branch.
+    """
+    url = project.get('repo-url')
+    target = clone_dir(clones_dir, project)
+    if target is None:
+        return CloneResult(project, None, 'skipped',
+                           f'unsupported repo-url: {url}' if url else 'no repo-url')
+    mirror = mirror_dir(mirrors_dir, project)
+    commit = project.get('repo-commit') if options.pin else None
+    commit = str(commit) if commit else None
+
+    if options.dry_run:
+        return CloneResult(project, target, 'planned', _plan(target, commit, options))
+
+    try:
+        fetched = sync_mirror(url, mirror, fetch=options.update, full=options.full)
+        if options.force and target.exists():
+            shutil.rmtree(target)
+
+        if not target.exists():
+            action = 'cloned'
+            _clone(url, target, mirror, options.full)
+            fetched = True
+        elif options.update:
+            action = 'updated'
+            run_git(target, 'fetch', '--quiet', '--prune', 'origin')
+            fetched = True
+        elif commit is not None:
+            action = 'pinned'
+        else:
+            return CloneResult(project, target, 'skipped', 'exists')
+
+        sha = None
+        if commit is not None:
+            sha = resolve_commit(target, commit)
+            if sha is None and not fetched:
+                # Pinned to a commit newer than the clone: fetch it
+                sync_mirror(url, mirror, fetch=True, full=options.full)
+                run_git(target, 'fetch', '--quiet', '--prune', 'origin')
+                sha = resolve_commit(target, commit)
+            if sha is None:
+                return CloneResult(project, target, 'failed',
+                                   f'repo-commit {commit} not found')
+            if action == 'pinned' and resolve_commit(target, 'HEAD') == sha:
+                return CloneResult(project, target, 'skipped', f'already at {commit}')
+        _checkout(target, sha, fresh=action == 'cloned')
+    except (GitError, OSError) as e:
+        # git's first line names the problem; the rest is advice
+        return CloneResult(project, target, 'failed', str(e).splitlines()[0])
+
+    return CloneResult(project, target, action, f'at {commit}' if commit else '')
+
+
+def sync_clones(projects: List, clones_dir: Path, mirrors_dir: Path,
+                options: CloneOptions = CloneOptions(),
+                jobs: int = DEFAULT_CLONE_JOBS) -> Iterator[CloneResult]:
+    """
+    sync_clone() for every project, up to jobs at a time.
+
+    Results are yielded in project order as they complete. A project whose
+    repository is already handled for an earlier project is skipped, so no
+    two tasks ever work on the same directory.
+    """
+    seen = {}
+    tasks = []
+    for project in projects:
+        target = clone_dir(clones_dir, project)
+        if target is not None and target in seen:
+            tasks.append(CloneResult(project, target, 'skipped',
+                                     f'same repository as {seen[target]}'))
+            continue
+        if target is not None:
+            seen[target] = project.filename
+        tasks.append(project)
+
+    def run(task):
+        if isinstance(task, CloneResult):
+            return task
+        return sync_clone(task, clones_dir, mirrors_dir, options)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        yield from pool.map(run, tasks)
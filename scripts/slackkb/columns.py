@@ -0,0 +1,208 @@
+"""
+Columnar, bit-packed view of the catalog's capability sections.
+
+For every section.field that holds feature flags (slack-features.search,
+read-capabilities.read-threads, ...), TriStateColumn keeps two Python ints
+used as bitsets: bit i of true_bits is set if project i has the flag set,
+bit i of false_bits if it is explicitly unset. A project with neither bit
+set has no value. Python ints are arbitrary precision and their bitwise
+operators run in C, so combining, counting and filtering whole columns
+costs a handful of word operations per 64 projects.
+
+Columns are built in one pass over the catalog, with rows in the order
+given (CatalogIndex uses star order).
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+from slackkb.model import Flags
+
+
+# Sections where a non-empty string also means "available" (e.g. the
+# Homebrew formula name under installation)
+STRING_MEANS_TRUE = frozenset(['installation'])
+
+
+_AS_ONE = bytes.maketrans(b'01', b'\x00\x01')
+_AS_TWO = bytes.maketrans(b'01', b'\x00\x02')
+
+
+def pack(row_indexes: List[int], size: int) -> int:
+    """Pack row indexes into an int with those bits set."""
+    if not row_indexes:
+        return 0
+    digits = bytearray(b'0' * size)
+    for i in row_indexes:
+        digits[i] = 0x31  # '1'
+    # Row 0 is the least significant bit
+    return int(digits[::-1], 2)
+
+
+def _popcount_fallback(bits: int) -> int:
+    """Number of set bits (int.bit_count() before Python 3.10)."""
+    return bin(bits).count('1')
+
+
+# popcount(bits): number of set bits
+popcount = getattr(int, 'bit_count', None) or _popcount_fallback
+
+
+def unpack(bits: int, size: int) -> str:
+    """Return one '0'/'1' character per row, row 0 first."""
+    if size == 0:
+        return ''
+    return format(bits, f'0{size}b')[::-1]
+
+
+class TriStateColumn:
+    """True / False / missing flags for one field across all projects."""
+
+    __slots__ = ('true_bits', 'false_bits', 'size')
+
+    def __init__(self, true_bits: int, false_bits: int, size: int):
+        self.true_bits = true_bits
+        self.false_bits = false_bits
+        self.size = size
+
+    @property
+    def known_bits(self) -> int:
+        return self.true_bits | self.false_bits
+
+    @property
+    def missing_bits(self) -> int:
+        return ~self.known_bits & ((1 << self.size) - 1)
+
+    def count_true(self) -> int:
+        return popcount(self.true_bits)
+
+    def count_false(self) -> int:
+        return popcount(self.false_bits)
+
+    def codes(self) -> bytes:
+        """One byte per row: 0 = missing, 1 = true, 2 = false."""
+        if self.size == 0:
+            return b''
+        t = unpack(self.true_bits, self.size).encode('ascii').translate(_AS_ONE)
+        f = unpack(self.false_bits, self.size).encode('ascii').translate(_AS_TWO)
+        # The two bitsets never overlap, so OR-ing the byte strings (as big
+        # integers) merges them without a per-row Python loop
+        merged = int.from_bytes(t, 'big') | int.from_bytes(f, 'big')
+        return merged.to_bytes(self.size, 'big')
+
+    def cells(self, yes: str, no: str, unknown: str) -> List[str]:
+        """Render every row of the column as one of three strings."""
+        return list(map((unknown, yes, no).__getitem__, self.codes()))
+
+
+class CapabilityColumns:
+    """All tri-state columns of a catalog, keyed by (section, field)."""
+
+    def __init__(self, rows: List[dict]):
+        self.size = len(rows)
+        self._columns = {}
+
+        # section -> field -> [row indexes]; nested dicts avoid building a
+        # tuple key for every cell
+        true_rows = {}
+        false_rows = {}
+        # Packed model.Flags sections, grouped by (section, layout): their
+        # bits are turned into row lists one field at a time below
+        packed = {}
+        for i, project in enumerate(rows):
+            for section, values in project.items():
+                kind = type(values)
+                if kind is Flags and section not in STRING_MEANS_TRUE:
+                    key = (section, values.layout)
+                    if key in packed:
+                        packed[key].append((i, values.true_bits, values.false_bits))
+                    else:
+                        packed[key] = [(i, values.true_bits, values.false_bits)]
+                    continue
+                if kind is not dict and kind is not Flags:
+                    continue
+                trues = true_rows.get(section)
+                if trues is None:
+                    trues = true_rows[section] = {}
+                    false_rows[section] = {}
+                falses = false_rows[section]
+                strings_count = section in STRING_MEANS_TRUE
+                for field, value in values.items():
+                    if value is True or (strings_count and value and type(value) is str):
+                        if field in trues:
+                            trues[field].append(i)
+                        else:
+                            trues[field] = [i]
+                    elif value is False:
+                        if field in falses:
+                            falses[field].append(i)
+                        else:
+                            falses[field] = [i]
+
+        for (section, layout), members in packed.items():
+            trues = true_rows.setdefault(section, {})
+            falses = false_rows.setdefault(section, {})
+            for j, field in enumerate(layout.keys):
+                bit = 1 << j
+                hits = [i for i, true_bits, _ in members if true_bits & bit]
+                if hits:
+                    trues.setdefault(field, []).extend(hits)
+                hits = [i for i, _, false_bits in members if false_bits & bit]
+                if hits:
+                    falses.setdefault(field, []).extend(hits)
+
+        for section, trues in true_rows.items():
+            falses = false_rows[section]
+            for field in dict.fromkeys(list(trues) + list(falses)):
+                self._columns[(section, field)] = TriStateColumn(
+                    pack(trues.get(field, []), self.size),
+                    pack(falses.get(field, []), self.size),
+                    self.size,
+                )
+
+    def set_row(self, i: int, project: dict, sections: Iterable[str]):
+        """Re-read row i's flags in the given sections from a new version of its project."""
+        bit = 1 << i
+        sections = set(sections)
+        for (section, _), column in self._columns.items():
+            if section in sections:
+                column.true_bits &= ~bit
+                column.false_bits &= ~bit
+
+        for section in sections:
+            values = project.get(section)
+            if type(values) is not dict and type(values) is not Flags:
+                continue
+            strings_count = section in STRING_MEANS_TRUE
+            for field, value in values.items():
+                if value is True or (strings_count and value and type(value) is str):
+                    true_bit, false_bit = bit, 0
+                elif value is False:
+                    true_bit, false_bit = 0, bit
+                else:
+                    continue
+                column = self._columns.get((section, field))
+                if column is None:
+                    column = self._columns[(section, field)] = TriStateColumn(0, 0, self.size)
+                column.true_bits |= true_bit
+                column.false_bits |= false_bit
+
+    def column(self, section: str, field: str) -> TriStateColumn:
+        """Return the column for section.field (all-missing if never set)."""
+        column = self._columns.get((section, field))
+        if column is None:
+            column = TriStateColumn(0, 0, self.size)
+        return column
+
+    def keys(self) -> Iterable[Tuple[str, str]]:
+        return self._columns.keys()
+
+    def matrix_cells(self, section: str, fields: List[str], yes: str, no: str,
+                     unknown: str) -> List[Tuple[str, ...]]:
+        """Render a section as rows of cells, one tuple per project."""
+        columns = [self.column(section, f).cells(yes, no, unknown) for f in fields]
+        return list(zip(*columns)) if columns else [() for _ in range(self.size)]
+
+    def summary(self, section: str) -> Dict[str, int]:
+        """Number of projects with each field of a section set to true."""
+        return {field: self._columns[(s, field)].count_true()
+                for (s, field) in self._columns if s == section}
@@ -0,0 +1,219 @@
+"""
+Tool x method coverage matrix for generate-api-coverage-table.py.
+
+Method names are interned to dense integer ids (MethodTable), and each tool
+becomes one row of the matrix: a Python int with bit i set if the tool
+covers method i. API categories are column masks over the same ids. Every
+statistic in the coverage report is then a reduction over those ints:
+
+    methods a tool covers in a category   popcount(row & category)
+    methods no tool covers                spec & ~(row_1 | row_2 | ...)
+    a tool's gaps                         spec & ~row
+
+Methods a tool lists that are not in the spec are interned too (after the
+spec methods), so overall counts still include them, as they always have.
+With a MethodRegistry the undocumented surface is treated the same way: its
+methods count as covered, but not toward the spec total or anyone's gaps.
+
+VersionedCoverage applies the same idea to several spec snapshots at once:
+all versions share one MethodTable, so each version is a single mask and
+added/removed methods between two versions are mask differences.
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+from slackkb.columns import popcount
+from slackkb.index import star_key
+from slackkb.registry import (MethodRegistry, MethodTable, get_tool_methods,
+                              has_coverage_data)
+
+
+def percentage(covered: int, total: int) -> float:
+    return round(covered / total * 100, 1) if total else 0
+
+
+# =============================================================================
+# MATRIX
+# =============================================================================
+
+def _web_methods(project: dict) -> set:
+    supported, partial = get_tool_methods(project)
+    return supported | partial
+
+
+class CoverageMatrix:
+    """
+    Coverage of every project against one spec, built once per run.
+
+    all_methods is either {category: [method names]} for a single spec, or
+    a MethodRegistry spanning several API surfaces.
+    """
+
+    def __init__(self, projects: List[dict], all_methods, table: MethodTable = None):
+        if isinstance(all_methods, MethodRegistry):
+            self.registry = all_methods
+            all_methods = self.registry.all_methods()
+            table = self.registry.table
+            tool_methods = self.registry.tool_methods
+        else:
+            self.registry = None
+            tool_methods = _web_methods
+
+        self.projects = projects
+        self.all_methods = all_methods
+        self.table = table if table is not None else MethodTable()
+
+        # Column masks. Spec methods are interned before any tool's methods.
+        self.categories = {cat: self.table.mask(methods) for cat, methods in all_methods.items()}
+        self.category_sizes = {cat: len(methods) for cat, methods in all_methods.items()}
+        documented = (self.registry.spec_categories() if self.registry is not None
+                      else self.categories)
+        self.spec_bits = 0
+        self.total_methods = 0
+        for cat, bits in self.categories.items():
+            if cat in documented:
+                self.spec_bits |= bits
+                self.total_methods += self.category_sizes[cat]
+
+        # One row per project
+        self._tool_methods = tool_methods
+        self.rows = [self.table.mask(tool_methods(p)) for p in projects]
+
+        self.active = [i for i, p in enumerate(projects) if has_coverage_data(p)]
+        active = set(self.active)
+        self.excluded = [i for i in range(len(projects)) if i not in active]
+
+        self._counts = None
+
+    @classmethod
+    def of(cls, projects, all_methods) -> 'CoverageMatrix':
+        """Return projects itself if already a matrix, else build one."""
+        if isinstance(projects, cls):
+            return projects
+        return cls(projects, all_methods)
+
+    def replace(self, i: int, project: dict, fields: Set[str] = None) -> bool:
+        """
+        Swap in a new version of projects[i], recomputing only its row. Always
+        succeeds (rows do not depend on order); fields is accepted so callers
+        can treat this and CatalogIndex.replace() alike.
+        """
+        self.projects[i] = project
+        self.rows[i] = self.table.mask(self._tool_methods(project))
+        if (i in self.active) != has_coverage_data(project):
+            active = set(self.active) ^ {i}
+            self.active = sorted(active)
+            self.excluded = [j for j in range(len(self.projects)) if j not in active]
+        if self._counts is not None:
+            self._counts[i] = {cat: popcount(self.rows[i] & mask)
+                               for cat, mask in self.categories.items()}
+        return True
+
+    @property
+    def counts(self) -> List[Dict[str, int]]:
+        """Covered methods per category, one dict per row (row & column mask)."""
+        if self._counts is None:
+            categories = list(self.categories.items())
+            self._counts = [{cat: popcount(row & mask) for cat, mask in categories}
+                            for row in self.rows]
+        return self._counts
+
+    def covered(self, i: int) -> int:
+        """All methods row i covers, including ones outside the spec."""
+        return popcount(self.rows[i])
+
+    def union(self, rows: Iterable[int] = None) -> int:
+        """Methods covered by at least one of the given rows (default: all)."""
+        bits = 0
+        for i in (range(len(self.rows)) if rows is None else rows):
+            bits |= self.rows[i]
+        return bits
+
+    def gaps(self, i: int) -> int:
+        """Spec methods row i does not cover."""
+        return self.spec_bits & ~self.rows[i]
+
+    def gaps_by_category(self, i: int) -> Dict[str, List[str]]:
+        """Uncovered spec methods of row i per category (sorted, empty ones omitted)."""
+        gaps = self.gaps(i)
+        result = {}
+        for cat in sorted(self.categories):
+            missing = gaps & self.categories[cat]
+            if missing:
+                result[cat] = sorted(self.table.decode(missing))
+        return result
+
+    def top_categories(self, i: int, limit: int = 3) -> List[Tuple[str, int]]:
+        """Categories with the most covered methods (ties in spec order)."""
+        counts = [(cat, n) for cat, n in self.counts[i].items() if n > 0]
+        counts.sort(key=lambda x: -x[1])
+        return counts[:limit]
+
+    def by_stars(self, rows: List[int]) -> List[int]:
+        """Rows sorted by stars, descending (stable)."""
+        return sorted(rows, key=lambda i: -star_key(self.projects[i]))
+
+    def coverage(self, i: int) -> Dict[str, dict]:
+        """Per-category statistics for row i, in calculate_coverage() format."""
+        row = self.rows[i]
+        coverage = {}
+        for cat, mask in self.categories.items():
+            covered = row & mask
+            count = self.counts[i][cat]
+            total = self.category_sizes[cat]
+            coverage[cat] = {
+                'covered': count,
+                'total': total,
+                'percentage': percentage(count, total),
+                'methods': sorted(self.table.decode(covered)),
+            }
+
+        total_covered = self.covered(i)
+        coverage['_overall'] = {
+            'covered': total_covered,
+            'total': self.total_methods,
+            'percentage': percentage(total_covered, self.total_methods),
+        }
+        return coverage
+
+
+class VersionedCoverage:
+    """Coverage of every project against several spec versions in one pass."""
+
+    def __init__(self, projects: List[dict], versions: Dict[str, Iterable[str]],
+                 table: MethodTable = None):
+        self.projects = projects
+        self.table = table if table is not None else MethodTable()
+
+        # One mask per version over the shared method ids
+        self.labels = list(versions)
+        self.version_bits = {label: self.table.mask(names) for label, names in versions.items()}
+        self.sizes = {label: popcount(bits) for label, bits in self.version_bits.items()}
+
+        # Tool rows are interned once and reused for every version
+        self.rows = []
+        for p in projects:
+            supported, partial = get_tool_methods(p)
+            self.rows.append(self.table.mask(supported | partial))
+        self.active = [i for i, p in enumerate(projects) if has_coverage_data(p)]
+
+        # covered[i][label]: methods of that version row i covers
+        self.covered = [{label: popcount(row & bits) for label, bits in self.version_bits.items()}
+                        for row in self.rows]
+
+    def by_stars(self, rows: List[int]) -> List[int]:
+        """Rows sorted by stars, descending (stable)."""
+        return sorted(rows, key=lambda i: -star_key(self.projects[i]))
+
+    def diff(self, old: str, new: str) -> Tuple[List[str], List[str]]:
+        """(added, removed) method names going from version old to new."""
+        old_bits = self.version_bits[old]
+        new_bits = self.version_bits[new]
+        added = sorted(self.table.decode(new_bits & ~old_bits))
+        removed = sorted(self.table.decode(old_bits & ~new_bits))
+        return added, removed
+
+    def lost(self, i: int, old: str, new: str) -> List[str]:
+        """Methods row i covers that were removed between old and new."""
+        gone = self.version_bits[old] & ~self.version_bits[new]
+        return sorted(self.table.decode(self.rows[i] & gone))
@@ -0,0 +1,281 @@
+"""
+Markdown renderers for the API coverage report.
+
+Each generate_* function takes the projects and the spec's methods
+({category: [method names]} or a registry.MethodRegistry), or an already
+built CoverageMatrix, and returns one table as a string. Tools are labelled
+by display_name(), their owner/repo.
+"""
+
+from typing import Dict, List, Tuple
+
+from slackkb.columns import popcount
+from slackkb.coverage import CoverageMatrix, VersionedCoverage, percentage
+from slackkb.registry import has_coverage_data
+
+
+# Top-level project fields the coverage tables read
+COVERAGE_FIELDS = ('api-coverage', 'repo-url', 'name', 'stars')
+
+
+def get_tool_display_name(project: dict) -> str:
+    """
+    Get display name for a tool using owner/repo format.
+
+    This prevents column name collisions when multiple repos have same name
+    (e.g., rockymadden/slack-cli vs regisb/slack-cli vs cleentfaar/slack-cli).
+    """
+    repo_url = project.get('repo-url', '')
+    if 'github.com/' in repo_url:
+        # Extract owner/repo from URL
+        parts = repo_url.split('github.com/')[-1].rstrip('/').split('/')
+        if len(parts) >= 2:
+            return f"{parts[0]}/{parts[1]}"
+    # Fallback to name
+    return project.get('name', project.get('_filename', 'unknown'))
+
+
+def display_name(project: dict) -> str:
+    """A project's table label: its precomputed _display_name, else owner/repo."""
+    return project.get('_display_name') or get_tool_display_name(project)
+
+
+def calculate_coverage(project: dict, all_methods: Dict[str, List[str]]) -> Dict[str, dict]:
+    """Calculate coverage statistics for a project by category."""
+    return CoverageMatrix([project], all_methods).coverage(0)
+
+
+def filter_active_tools(projects: List[dict]) -> Tuple[List[dict], List[dict]]:
+    """
+    Filter projects to those with API coverage data.
+
+    Returns (active_tools, excluded_tools)
+    """
+    active = []
+    excluded = []
+
+    for p in projects:
+        if has_coverage_data(p):
+            active.append(p)
+        else:
+            excluded.append(p)
+
+    return active, excluded
+
+
+def format_coverage(covered: int, total: int) -> str:
+    """Format coverage as 'X/Y (Z%)'."""
+    if total == 0:
+        return '-'
+    pct = round(covered / total * 100)
+    return f"{covered}/{total} ({pct}%)"
+
+
+def generate_by_category_table(projects, all_methods: Dict[str, List[str]]) -> str:
+    """Generate coverage table grouped by API category."""
+    matrix = CoverageMatrix.of(projects, all_methods)
+
+    if not matrix.active:
+        return "No tools have API coverage data.\n"
+
+    # Categories with at least some coverage: column mask & union of rows
+    union = matrix.union(matrix.active)
+    covered_categories = [cat for cat, mask in matrix.categories.items() if union & mask]
+
+    if not covered_categories:
+        return "No API methods are covered by any tool.\n"
+
+    # Build table
+    lines = []
+    lines.append("## API Coverage by Category\n")
+    lines.append("Coverage shown as: `covered/total (percentage)`\n")
+
+    # Header
+    tools = matrix.by_stars(matrix.active)
+    tool_names = [display_name(matrix.projects[i]) for i in tools]
+    header = "| Category | " + " | ".join(tool_names) + " |"
+    separator = "|" + "|".join(["---"] * (len(tool_names) + 1)) + "|"
+
+    lines.append(header)
+    lines.append(separator)
+
+    # Rows for covered categories (sorted by total methods descending)
+    counts = matrix.counts
+    for cat in sorted(covered_categories, key=lambda c: -matrix.category_sizes[c]):
+        total = matrix.category_sizes[cat]
+        row = f"| **{cat}** ({total}) |"
+        for i in tools:
+            row += f" {format_coverage(counts[i][cat], total)} |"
+        lines.append(row)
+
+    # Overall row
+    lines.append("|" + "-" * 20 + "|" + "|".join(["-" * 15] * len(tool_names)) + "|")
+    row = "| **TOTAL** |"
+    for i in tools:
+        row += f" {format_coverage(matrix.covered(i), matrix.total_methods)} |"
+    lines.append(row)
+
+    # Uncovered categories
+    uncovered = [cat for cat, mask in matrix.categories.items() if not union & mask]
+    if uncovered:
+        lines.append("\n### Categories Without Tool Coverage\n")
+        lines.append("The following API categories have no coverage from any tool:\n")
+        for cat in sorted(uncovered, key=lambda c: -matrix.category_sizes[c]):
+            count = matrix.category_sizes[cat]
+            lines.append(f"- **{cat}** ({count} methods)")
+
+    # Excluded tools
+    if matrix.excluded:
+        lines.append("\n### Tools Without API Coverage Data\n")
+        lines.append("The following tools have no `api-coverage` section:\n")
+        for i in matrix.excluded:
+            p = matrix.projects[i]
+            reason = p.get('warnings', ['No API coverage data'])[0]
+            lines.append(f"- **{display_name(p)}**: {reason[:60]}...")
+
+    return "\n".join(lines)
+
+
+def generate_by_tool_table(projects, all_methods: Dict[str, List[str]]) -> str:
+    """Generate summary table showing each tool's overall coverage."""
+    matrix = CoverageMatrix.of(projects, all_methods)
+
+    lines = []
+    lines.append("## API Coverage by Tool\n")
+
+    if not matrix.active:
+        lines.append("No tools have API coverage data.\n")
+        return "\n".join(lines)
+
+    # Header
+    lines.append("| Tool | Stars | Methods Covered | Coverage % | Top Categories |")
+    lines.append("|------|-------|-----------------|------------|----------------|")
+
+    # Sort by coverage percentage descending
+    total = matrix.total_methods
+    pct = {i: percentage(matrix.covered(i), total) for i in matrix.active}
+    for i in sorted(matrix.active, key=lambda i: -pct[i]):
+        p = matrix.projects[i]
+        top_cats_str = ", ".join(f"{cat}({n})" for cat, n in matrix.top_categories(i))
+        name = f"[{display_name(p)}]({p.get('repo-url', '#')})"
+        stars = p.get('stars') or 0
+        lines.append(
+            f"| {name} | {stars} | {matrix.covered(i)}/{total} | {pct[i]}% | {top_cats_str} |"
+        )
+
+    return "\n".join(lines)
+
+
+def generate_summary(projects, all_methods: Dict[str, List[str]]) -> str:
+    """Generate high-level summary statistics."""
+    matrix = CoverageMatrix.of(projects, all_methods)
+
+    total_methods = matrix.total_methods
+    total_categories = len(matrix.categories)
+
+    # Methods covered by any tool: spec methods against the spec total,
+    # the rest (undocumented or unknown names) counted on their own
+    union = matrix.union(matrix.active)
+    all_covered = popcount(union & matrix.spec_bits)
+    outside_spec = popcount(union & ~matrix.spec_bits)
+
+    lines = []
+    lines.append("## Slack API Coverage Summary\n")
+    lines.append(f"- **Total API Methods**: {total_methods}")
+    lines.append(f"- **Total Categories**: {total_categories}")
+    if matrix.registry is not None and len(matrix.registry.surfaces) > 1:
+        lines.append("- **Surfaces**: " + ", ".join(
+            f"{s.title} ({len(s)})" for s in matrix.registry.surfaces.values()))
+    lines.append(f"- **Tools with Coverage Data**: {len(matrix.active)}")
+    lines.append(f"- **Tools without Coverage Data**: {len(matrix.excluded)}")
+    lines.append(f"- **Methods Covered by At Least One Tool**: {all_covered} ({round(all_covered/total_methods*100, 1)}%)")
+    lines.append(f"- **Methods Not Covered by Any Tool**: {total_methods - all_covered}")
+    if outside_spec:
+        lines.append(f"- **Covered Methods Outside the Spec**: {outside_spec} (not counted above)")
+
+    return "\n".join(lines)
+
+
+def generate_gaps_table(projects, all_methods: Dict[str, List[str]]) -> str:
+    """Show methods not covered by each tool."""
+    matrix = CoverageMatrix.of(projects, all_methods)
+
+    if not matrix.active:
+        return "No tools have API coverage data.\n"
+
+    total = popcount(matrix.spec_bits)
+
+    lines = []
+    lines.append("## API Coverage Gaps by Tool\n")
+
+    for i in matrix.by_stars(matrix.active):
+        covered = matrix.covered(i)
+
+        lines.append(f"\n### {display_name(matrix.projects[i])}")
+        lines.append(f"Covered: {covered}/{total} ({round(covered/total*100, 1)}%)\n")
+
+        gaps_by_cat = matrix.gaps_by_category(i)
+        if gaps_by_cat:
+            lines.append("<details>")
+            lines.append(f"<summary>Missing {sum(len(m) for m in gaps_by_cat.values())} methods</summary>\n")
+            for cat, missing in gaps_by_cat.items():
+                lines.append(f"**{cat}** ({len(missing)}): " +
+                            ", ".join(missing[:10]))
+                if len(missing) > 10:
+                    lines.append(f"  ... and {len(missing) - 10} more")
+            lines.append("</details>")
+
+    return "\n".join(lines)
+
+
+def generate_versions_table(coverage: VersionedCoverage) -> str:
+    """Show each tool's coverage against every spec version, and what changed."""
+    labels = coverage.labels
+
+    lines = []
+    lines.append("## API Coverage Across Spec Versions\n")
+
+    if not coverage.active:
+        lines.append("No tools have API coverage data.\n")
+        return "\n".join(lines)
+
+    header = "| Tool | " + " | ".join(f"{label} ({coverage.sizes[label]})" for label in labels) + " |"
+    separator = "|------|" + "|".join(["---"] * len(labels)) + "|"
+    if len(labels) > 1:
+        header += " Change |"
+        separator += "---|"
+    lines.append(header)
+    lines.append(separator)
+
+    first, last = labels[0], labels[-1]
+    for i in coverage.by_stars(coverage.active):
+        covered = coverage.covered[i]
+        row = f"| {display_name(coverage.projects[i])} |"
+        for label in labels:
+            row += f" {format_coverage(covered[label], coverage.sizes[label])} |"
+        if len(labels) > 1:
+            row += f" {covered[last] - covered[first]:+d} |"
+        lines.append(row)
+
+    lines.append("\n## Method Changes Between Versions\n")
+    if len(labels) < 2:
+        lines.append(f"Only one spec version found ({first}).")
+        return "\n".join(lines)
+
+    for old, new in zip(labels, labels[1:]):
+        added, removed = coverage.diff(old, new)
+        lines.append(f"### {old} → {new}\n")
+        lines.append(f"- **Added** ({len(added)}): " + (", ".join(added) or "none"))
+        lines.append(f"- **Removed** ({len(removed)}): " + (", ".join(removed) or "none"))
+
+        affected = []
+        for i in coverage.by_stars(coverage.active):
+            lost = coverage.lost(i, old, new)
+            if lost:
+                affected.append(f"  - {display_name(coverage.projects[i])}: {', '.join(lost)}")
+        if affected:
+            lines.append("- **Tools using removed methods**:")
+            lines.extend(affected)
+        lines.append("")
+
+    return "\n".join(lines)
@@ -0,0 +1,432 @@
+"""
+SQLite copy of the catalog for ad-hoc queries (catalog.sqlite).
+
+The project files are flattened into normalized tables:
+
+    projects      one row per file: the common scalar fields plus the whole
+                  document as JSON (for json_extract() on anything else)
+    flags         section.field booleans (slack-features.search, ...)
+    methods       supported / partial / undocumented API methods per project
+    evidence      every section's evidence block
+    notes         notes, *-notes and warnings lists, one row per line
+    spec_methods  the methods of the OpenAPI spec, with their category
+
+Updates are incremental. Each project row stores the file's stat and
+content hash; a file whose stat is unchanged is not read, one whose hash is
+unchanged is not parsed, and a changed file only rewrites its own rows. The
+spec is reloaded only when its content hash changes.
+
+Only databases this module created (they have its meta table) are ever
+migrated or rebuilt; any other SQLite file is refused, never emptied.
+"""
+
+import re
+import json
+import sqlite3
+from pathlib import Path
+from typing import List, Optional
+
+from slackkb.cache import YamlCache, content_digest
+from slackkb.columns import STRING_MEANS_TRUE
+from slackkb.openapi import load_spec_index
+from slackkb.parallel import load_documents
+from slackkb.registry import get_tool_methods
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Bump when the schema changes; an older database is rebuilt from scratch
+SCHEMA_VERSION = 1
+
+DATABASE_FILENAME = 'catalog.sqlite'
+
+# Top-level fields copied into projects columns (in SCHEMA order): (key, column)
+PROJECT_COLUMNS = (
+    ('name', 'name'),
+    ('repo-url', 'repo_url'),
+    ('repo-commit', 'repo_commit'),
+    ('description', 'description'),
+    ('language', 'language'),
+    ('category', 'category'),
+    ('maintenance-tier', 'maintenance_tier'),
+    ('license', 'license'),
+    ('stars', 'stars'),
+    ('forks', 'forks'),
+    ('archived', 'archived'),
+    ('last-commit', 'last_commit'),
+    ('last-release', 'last_release'),
+    ('last-update', 'last_update'),
+)
+
+# Evidence keys, stored in columns of the same name with '_' for '-'
+EVIDENCE_FIELDS = ('source-type', 'source-url', 'source-commit', 'source-file',
+                   'source-lines', 'retrieved-date', 'confidence', 'notes')
+
+# Top-level lists stored in notes (section NULL)
+TOP_LEVEL_NOTES = ('notes', 'warnings')
+
+SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE projects (
+    id INTEGER PRIMARY KEY,
+    filename TEXT NOT NULL UNIQUE,
+    content_hash TEXT NOT NULL,
+    mtime_ns INTEGER,
+    size INTEGER,
+    name TEXT,
+    repo_url TEXT,
+    repo_commit TEXT,
+    description TEXT,
+    language TEXT,
+    category TEXT,
+    maintenance_tier TEXT,
+    license TEXT,
+    stars INTEGER,
+    forks INTEGER,
+    archived INTEGER,
+    last_commit TEXT,
+    last_release TEXT,
+    last_update TEXT,
+    document TEXT NOT NULL
+);
+CREATE INDEX projects_language ON projects (language);
+CREATE INDEX projects_category ON projects (category);
+CREATE INDEX projects_maintenance_tier ON projects (maintenance_tier);
+CREATE INDEX projects_stars ON projects (stars);
+
+CREATE TABLE flags (
+    project_id INTEGER NOT NULL REFERENCES projects (id),
+    section TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value INTEGER NOT NULL,
+    detail TEXT,
+    PRIMARY KEY (project_id, section, field)
+) WITHOUT ROWID;
+CREATE INDEX flags_field ON flags (section, field, value);
+
+CREATE TABLE methods (
+    project_id INTEGER NOT NULL REFERENCES projects (id),
+    method TEXT NOT NULL,
+    status TEXT NOT NULL CHECK (status IN ('supported', 'partial', 'undocumented')),
+    detail TEXT
+);
+CREATE INDEX methods_project ON methods (project_id);
+CREATE INDEX methods_method ON methods (method, status);
+
+CREATE TABLE evidence (
+    project_id INTEGER NOT NULL REFERENCES projects (id),
+    section TEXT NOT NULL,
+    source_type TEXT,
+    source_url TEXT,
+    source_commit TEXT,
+    source_file TEXT,
+    source_lines TEXT,
+    retrieved_date TEXT,
+    confidence TEXT,
+    notes TEXT
+);
+CREATE INDEX evidence_project ON evidence (project_id);
+CREATE INDEX evidence_confidence ON evidence (confidence);
+CREATE INDEX evidence_source_type ON evidence (source_type);
+
+CREATE TABLE notes (
+    project_id INTEGER NOT NULL REFERENCES projects (id),
+    section TEXT,
+    field TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX notes_project ON notes (project_id);
+
+CREATE TABLE spec_methods (
+    name TEXT PRIMARY KEY,
+    category TEXT NOT NULL,
+    http_method TEXT,
+    path TEXT,
+    summary TEXT
+);
+CREATE INDEX spec_methods_category ON spec_methods (category);
+"""
+
+CHILD_TABLES = ('flags', 'methods', 'evidence', 'notes')
+
+# Every table SCHEMA creates, the only ones a rebuild drops
+TABLES = tuple(re.findall(r'^CREATE TABLE (\w+)', SCHEMA, re.MULTILINE))
+
+
+class CatalogDatabaseError(Exception):
+    """The file exists but is not a catalog database."""
+
+
+def default_database_file(repo_root: Path) -> Path:
+    """Return the standard database location for a repository checkout."""
+    return repo_root / DATABASE_FILENAME
+
+
+# =============================================================================
+# ROWS
+# =============================================================================
+
+def _text(value) -> Optional[str]:
+    """A cell for a free-form value: strings as-is, anything else as JSON."""
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, default=str, ensure_ascii=False)
+
+
+def _scalar(value):
+    """A cell for a projects column (dates and other objects as text)."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def _note_rows(project_id: int, section: Optional[str], field: str, value) -> List[tuple]:
+    lines = value if isinstance(value, list) else [value]
+    return [(project_id, section, field, i, _text(line))
+            for i, line in enumerate(lines) if line is not None]
+
+
+def project_rows(project_id: int, document: dict) -> dict:
+    """The rows of every child table for one project document."""
+    rows = {table: [] for table in CHILD_TABLES}
+
+    for section, values in document.items():
+        if section in TOP_LEVEL_NOTES and values:
+            rows['notes'].extend(_note_rows(project_id, None, section, values))
+        if not isinstance(values, dict):
+            continue
+        strings_count = section in STRING_MEANS_TRUE
+        for field, value in values.items():
+            if isinstance(value, bool):
+                rows['flags'].append((project_id, section, field, int(value), None))
+            elif strings_count and value and isinstance(value, str):
+                rows['flags'].append((project_id, section, field, 1, value))
+            elif field == 'notes' or field.endswith('-notes'):
+                if value:
+                    rows['notes'].extend(_note_rows(project_id, section, field, value))
+            elif field == 'evidence' and isinstance(value, dict):
+                rows['evidence'].append((project_id, section)
+                                        + tuple(_text(value.get(f)) for f in EVIDENCE_FIELDS))
+
+    supported, partial = get_tool_methods(document)
+    api_coverage = document.get('api-coverage') or {}
+    limitations = {}
+    for item in api_coverage.get('methods-partial', []) or []:
+        if isinstance(item, dict) and item.get('method'):
+            limitations[item['method']] = _text(item.get('limitation'))
+    rows['methods'].extend((project_id, m, 'supported', None) for m in sorted(supported))
+    rows['methods'].extend((project_id, m, 'partial', limitations.get(m))
+                           for m in sorted(partial) if m)
+    for item in api_coverage.get('undocumented-methods', []) or []:
+        name = item.get('method') if isinstance(item, dict) else item
+        if name:
+            notes = _text(item.get('notes')) if isinstance(item, dict) else None
+            rows['methods'].append((project_id, str(name), 'undocumented', notes))
+
+    return rows
+
+
+# =============================================================================
+# DATABASE
+# =============================================================================
+
+class SyncStats:
+    """What one CatalogDatabase.sync() changed."""
+
+    def __init__(self):
+        self.added = 0
+        self.updated = 0
+        self.removed = 0
+        self.unchanged = 0
+        self.spec_methods = None
+        self.errors = []
+
+    def __str__(self):
+        text = (f"{self.added} added, {self.updated} updated, {self.removed} removed, "
+                f"{self.unchanged} unchanged")
+        if self.spec_methods is not None:
+            text += f"; {self.spec_methods} spec methods reloaded"
+        return text
+
+
+class CatalogDatabase:
+    """
+    catalog.sqlite, opened (and created or migrated) on construction.
+
+    With rebuild=True the existing tables are dropped and recreated empty.
+    Raises CatalogDatabaseError for a file that is not a catalog database.
+    """
+
+    def __init__(self, database_file: Path, rebuild: bool = False):
+        self.database_file = database_file
+        self.conn = sqlite3.connect(str(database_file))
+        try:
+            self._ensure_schema(rebuild)
+        except CatalogDatabaseError:
+            self.conn.close()
+            raise
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def _set_meta(self, key: str, value: str):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _ensure_schema(self, rebuild: bool = False):
+        try:
+            tables = {name for (name,) in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'")}
+        except sqlite3.DatabaseError as e:
+            raise CatalogDatabaseError(f"{self.database_file}: {e}") from e
+        if tables and 'meta' not in tables:
+            raise CatalogDatabaseError(
+                f"{self.database_file} is not a catalog database "
+                f"(tables: {', '.join(sorted(tables))}); refusing to overwrite it")
+
+        version = self._meta('schema_version') if tables else None
+        if version == str(SCHEMA_VERSION) and not rebuild:
+            return
+        with self.conn:
+            for name in TABLES:
+                if name in tables:
+                    self.conn.execute(f'DROP TABLE "{name}"')
+            self.conn.executescript(SCHEMA)
+            self._set_meta('schema_version', str(SCHEMA_VERSION))
+
+    # -------------------------------------------------------------------------
+    # Projects
+    # -------------------------------------------------------------------------
+
+    def _write_project(self, project_id: Optional[int], filepath: Path, stat,
+                       digest: str, document: dict) -> int:
+        values = [filepath.name, digest, stat.st_mtime_ns, stat.st_size]
+        values += [_scalar(document.get(key)) for key, _ in PROJECT_COLUMNS]
+        values.append(json.dumps(document, default=str, ensure_ascii=False))
+        columns = ['filename', 'content_hash', 'mtime_ns', 'size']
+        columns += [column for _, column in PROJECT_COLUMNS] + ['document']
+
+        if project_id is None:
+            cursor = self.conn.execute(
+                f"INSERT INTO projects ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * len(columns))})", values)
+            project_id = cursor.lastrowid
+        else:
+            self._delete_rows(project_id)
+            self.conn.execute(
+                f"UPDATE projects SET {', '.join(f'{c} = ?' for c in columns)} WHERE id = ?",
+                values + [project_id])
+
+        for table, rows in project_rows(project_id, document).items():
+            if rows:
+                self.conn.executemany(
+                    f"INSERT INTO {table} VALUES ({', '.join('?' * len(rows[0]))})", rows)
+        return project_id
+
+    def _delete_rows(self, project_id: int):
+        for table in CHILD_TABLES:
+            self.conn.execute(f"DELETE FROM {table} WHERE project_id = ?", (project_id,))
+
+    def _delete_project(self, project_id: int):
+        self._delete_rows(project_id)
+        self.conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+
+    def sync(self, paths: List[Path], cache: YamlCache = None, jobs: int = 1,
+             stats: SyncStats = None) -> SyncStats:
+        """
+        Make the projects tables match exactly the given project files.
+
+        Files that fail to load, or are not a mapping, are listed in
+        stats.errors and their previous rows are dropped.
+        """
+        stats = stats if stats is not None else SyncStats()
+        known = {filename: (project_id, digest, mtime_ns, size)
+                 for project_id, filename, digest, mtime_ns, size in self.conn.execute(
+                     "SELECT id, filename, content_hash, mtime_ns, size FROM projects")}
+
+        with self.conn:
+            changed = []
+            for filepath in paths:
+                entry = known.pop(filepath.name, None)
+                try:
+                    stat = filepath.stat()
+                    if entry is not None and (stat.st_mtime_ns, stat.st_size) == entry[2:]:
+                        stats.unchanged += 1
+                        continue
+                    digest = content_digest(filepath.read_bytes())
+                except OSError as e:
+                    stats.errors.append((filepath, e))
+                    if entry is not None:
+                        self._delete_project(entry[0])
+                    continue
+                if entry is not None and digest == entry[1]:
+                    # Touched but identical: remember the new stat only
+                    self.conn.execute("UPDATE projects SET mtime_ns = ?, size = ? WHERE id = ?",
+                                      (stat.st_mtime_ns, stat.st_size, entry[0]))
+                    stats.unchanged += 1
+                    continue
+                changed.append((filepath, stat, digest, entry))
+
+            documents = load_documents([filepath for filepath, *_ in changed], cache, jobs)
+            for (filepath, stat, digest, entry), (data, error) in zip(changed, documents):
+                project_id = None if entry is None else entry[0]
+                if error is None and not isinstance(data, dict):
+                    error = ValueError(f"top-level YAML is a {type(data).__name__}, not a mapping")
+                if error is not None:
+                    stats.errors.append((filepath, error))
+                    if project_id is not None:
+                        self._delete_project(project_id)
+                    continue
+                self._write_project(project_id, filepath, stat, digest, data)
+                if project_id is None:
+                    stats.added += 1
+                else:
+                    stats.updated += 1
+
+            # Files that no longer exist
+            for project_id, *_ in known.values():
+                self._delete_project(project_id)
+                stats.removed += 1
+
+        return stats
+
+    # -------------------------------------------------------------------------
+    # Spec
+    # -------------------------------------------------------------------------
+
+    def sync_spec(self, spec_path: Path, stats: SyncStats = None) -> SyncStats:
+        """Reload spec_methods if the OpenAPI spec changed since the last sync."""
+        stats = stats if stats is not None else SyncStats()
+        digest = content_digest(spec_path.read_bytes())
+        if digest == self._meta('spec_hash'):
+            return stats
+
+        index = load_spec_index(spec_path)
+        rows = []
+        for category, methods in index.methods_by_category().items():
+            for name, details in methods.items():
+                rows.append((name, category, details['http_method'], details['path'],
+                             details['summary']))
+        with self.conn:
+            self.conn.execute("DELETE FROM spec_methods")
+            self.conn.executemany("INSERT OR REPLACE INTO spec_methods VALUES (?, ?, ?, ?, ?)",
+                                  rows)
+            self._set_meta('spec_hash', digest)
+        stats.spec_methods = len(rows)
+        return stats
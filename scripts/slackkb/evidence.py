@@ -0,0 +1,148 @@
+"""
+Check the commits and files a project file cites against its clone in tmp/.
+
+check-yaml.py only checks that repo-commit and evidence.source-commit look
+like commit hashes. Here each one must name a commit of the tool's
+repository, and each evidence.source-file a path (file or directory) in it
+at that commit, or at repo-commit when the evidence block has no commit of
+its own. All of a clone's checks go to one `git cat-file --batch-check`
+process, so a whole catalog costs a process per clone, not per citation.
+
+The distance of repo-commit from the remote's default branch (origin/HEAD,
+or HEAD in a clone without one) comes from one `git rev-list --count` per
+clone, which shows how far behind an analysis has fallen.
+
+Clones made by clone-all.py are blobless: asking about a file git has not
+downloaded yet makes git fetch that blob once, so the first run against a
+fresh clone may use the network.
+"""
+
+from pathlib import Path
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple, Optional, Tuple
+
+from slackkb.git import CatFileCheck, GitError, is_repository, run_git
+from slackkb.schema import COMMIT_PATTERN
+
+
+# =============================================================================
+# CITATIONS
+# =============================================================================
+
+class Citation(NamedTuple):
+    # 'repo-commit', or the section whose evidence block this is
+    where: str
+    commit: Optional[str]
+    file: Optional[str]
+
+
+def _text(value) -> Optional[str]:
+    if value is None or value == '':
+        return None
+    return str(value).strip()
+
+
+def citations(project) -> List[Citation]:
+    """repo-commit, then every evidence block with a commit or file, in document order."""
+    cited = []
+    repo_commit = _text(project.get('repo-commit'))
+    if repo_commit:
+        cited.append(Citation('repo-commit', repo_commit, None))
+
+    for section, values in project.items():
+        evidence = values if section == 'evidence' else (
+            values.get('evidence') if isinstance(values, Mapping) else None)
+        if not isinstance(evidence, Mapping):
+            continue
+        commit = _text(evidence.get('source-commit'))
+        path = _text(evidence.get('source-file'))
+        if commit or path:
+            cited.append(Citation(section, commit, path))
+    return cited
+
+
+# =============================================================================
+# VERIFICATION
+# =============================================================================
+
+class EvidenceReport:
+    """What one clone says about one project's citations."""
+
+    def __init__(self, project, root: Path):
+        self.project = project
+        self.root = root
+        self.checked = 0
+        # 'where: what is wrong', in citation order
+        self.problems: List[str] = []
+        self.repo_commit: Optional[str] = _text(project.get('repo-commit'))
+        # The ref repo-commit is compared with, and the commit counts:
+        # behind = commits on base since repo-commit, ahead = commits of
+        # repo-commit not on base (non-zero if it is on another branch)
+        self.base: Optional[str] = None
+        self.behind: Optional[int] = None
+        self.ahead: Optional[int] = None
+
+    @property
+    def ok(self) -> bool:
+        return not self.problems
+
+
+def _distance(root: Path, sha: str, base: str) -> Tuple[int, int]:
+    """(ahead, behind): commits only in sha, and only in base."""
+    output = run_git(root, 'rev-list', '--left-right', '--count', f'{sha}...{base}')
+    ahead, behind = output.split()
+    return int(ahead), int(behind)
+
+
+def verify_clone(project, root: Path) -> EvidenceReport:
+    """Check every citation of project against the git repository at root."""
+    report = EvidenceReport(project, root)
+    if not is_repository(root):
+        report.problems.append(f"{root} is not a git repository")
+        return report
+    commits = {}
+
+    try:
+        with CatFileCheck(root) as objects:
+            def resolve(commit: str) -> Optional[str]:
+                if commit not in commits:
+                    info = objects.info(f'{commit}^{{commit}}')
+                    commits[commit] = info.sha if info else None
+                return commits[commit]
+
+            for citation in citations(project):
+                report.checked += 1
+                commit = citation.commit or report.repo_commit or 'HEAD'
+                if commit != 'HEAD' and not COMMIT_PATTERN.match(commit):
+                    report.problems.append(f"{citation.where}: invalid commit hash {commit}")
+                    continue
+                sha = resolve(commit)
+                if sha is None:
+                    report.problems.append(f"{citation.where}: commit {commit} not found")
+                    continue
+                if citation.file:
+                    path = citation.file.lstrip('/')
+                    if path.startswith('./'):
+                        path = path[2:]
+                    if objects.info(f'{sha}:{path.rstrip("/")}') is None:
+                        report.problems.append(
+                            f"{citation.where}: {citation.file} not found at {commit}")
+
+            for base in ('origin/HEAD', 'HEAD'):
+                if objects.info(f'{base}^{{commit}}') is not None:
+                    report.base = base
+                    break
+
+        sha = commits.get(report.repo_commit) if report.repo_commit else None
+        if sha is not None and report.base is not None:
+            report.ahead, report.behind = _distance(root, sha, report.base)
+    except GitError as e:
+        report.problems.append(f"git: {str(e).splitlines()[0]}")
+    return report
+
+
+def verify_clones(pairs: List[Tuple[object, Path]], jobs: int = 1) -> List[EvidenceReport]:
+    """verify_clone() for each (project, clone root), up to jobs clones at a time."""
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        return list(pool.map(lambda pair: verify_clone(*pair), pairs))
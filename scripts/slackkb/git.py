@@ -0,0 +1,133 @@
+"""
+Git plumbing for reading the clones in tmp/ without touching their worktrees.
+
+ls_tree() lists every blob of a commit with its size; CatFile keeps one
+`git cat-file --batch` process per repository open and streams objects
+from it, so reading thousands of blobs costs one process, not thousands.
+CatFileCheck does the same with `--batch-check`, for questions about
+objects (does this commit exist, is this path in it) without their content.
+"""
+
+import subprocess
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+
+class GitError(Exception):
+    """A git command failed or a path is not a git repository."""
+
+
+def run_git(root: Path, *args: str) -> bytes:
+    """Run git in root and return its stdout, raising GitError on failure."""
+    try:
+        result = subprocess.run(['git', '-C', str(root)] + list(args),
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+    except OSError as e:
+        raise GitError(f"cannot run git: {e}") from e
+    if result.returncode != 0:
+        message = result.stderr.decode('utf-8', 'replace').strip()
+        raise GitError(message or f"git {args[0]} failed with status {result.returncode}")
+    return result.stdout
+
+
+def is_repository(root: Path) -> bool:
+    """True if root is the top of a git worktree or a bare repository."""
+    return (root / '.git').exists() or (root / 'HEAD').is_file()
+
+
+# =============================================================================
+# TREES
+# =============================================================================
+
+class TreeEntry(NamedTuple):
+    mode: str
+    type: str
+    sha: str
+    size: Optional[int]
+    path: str
+
+
+def ls_tree(root: Path, treeish: str = 'HEAD') -> List[TreeEntry]:
+    """Every entry of treeish, recursively, in git's path order."""
+    output = run_git(root, 'ls-tree', '-r', '-l', '-z', '--full-tree', treeish)
+    entries = []
+    for record in output.split(b'\0'):
+        if not record:
+            continue
+        info, path = record.split(b'\t', 1)
+        mode, kind, sha, size = info.decode('ascii').split()
+        entries.append(TreeEntry(mode, kind, sha, None if size == '-' else int(size),
+                                 path.decode('utf-8', 'surrogateescape')))
+    return entries
+
+
+# =============================================================================
+# OBJECTS
+# =============================================================================
+
+class ObjectInfo(NamedTuple):
+    sha: str
+    type: str
+    size: int
+
+
+class _CatFileProcess:
+    """One long-lived `git cat-file` in batch mode, answering a line at a time."""
+
+    MODE = '--batch'
+
+    def __init__(self, root: Path):
+        self.root = root
+        try:
+            self._process = subprocess.Popen(
+                ['git', '-C', str(root), 'cat-file', self.MODE],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except OSError as e:
+            raise GitError(f"cannot run git: {e}") from e
+
+    def _query(self, name: str) -> Optional[ObjectInfo]:
+        self._process.stdin.write(name.encode('utf-8') + b'\n')
+        self._process.stdin.flush()
+        header = self._process.stdout.readline()
+        if not header:
+            raise GitError(f"git cat-file exited in {self.root}")
+        # "<name> missing" or "<name> ambiguous"; the name may contain spaces
+        if header.endswith((b' missing\n', b' ambiguous\n')):
+            return None
+        sha, kind, size = header.split()
+        return ObjectInfo(sha.decode('ascii'), kind.decode('ascii'), int(size))
+
+    def close(self):
+        if self._process.poll() is None:
+            self._process.stdin.close()
+            self._process.wait()
+        self._process.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CatFile(_CatFileProcess):
+    """A long-lived `git cat-file --batch` for one repository."""
+
+    def read(self, name: str) -> Optional[bytes]:
+        """Content of an object (sha or rev:path), or None if it does not exist."""
+        info = self._query(name)
+        if info is None:
+            return None
+        content = self._process.stdout.read(info.size)
+        self._process.stdout.read(1)  # trailing newline
+        return content
+
+
+class CatFileCheck(_CatFileProcess):
+    """A long-lived `git cat-file --batch-check`: object types and sizes only."""
+
+    MODE = '--batch-check'
+
+    def info(self, name: str) -> Optional[ObjectInfo]:
+        """sha, type and size of an object (sha, rev or rev:path), or None if missing."""
+        return self._query(name)
@@ -0,0 +1,177 @@
+"""
+Validation manifest for incremental runs of check-yaml.py.
+
+The manifest records, for every validated file, its stat, content hash and
+the last validation outcome. A later run only revalidates files whose
+content changed (or that git reports as changed since a ref) and reuses the
+stored outcome for everything else.
+
+Stored outcomes are only trusted while the validator itself is unchanged:
+the manifest carries a fingerprint of the validator sources and spec.yaml,
+and is discarded when that fingerprint differs.
+"""
+
+import os
+import json
+import hashlib
+import subprocess
+from pathlib import Path
+from typing import Iterable, Optional, Set
+
+from slackkb.atomic import atomic_json_dump
+from slackkb.cache import CACHE_DIRNAME, content_digest
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+MANIFEST_VERSION = 1
+MANIFEST_FILENAME = 'validation-manifest.json'
+
+
+def default_manifest_file(repo_root: Path) -> Path:
+    """Return the standard manifest location for a repository checkout."""
+    return repo_root / CACHE_DIRNAME / MANIFEST_FILENAME
+
+
+def validator_fingerprint(sources: Iterable[Path]) -> str:
+    """Hash the files that determine validation results."""
+    h = hashlib.sha256()
+    for source in sources:
+        h.update(str(source.name).encode('utf-8'))
+        try:
+            h.update(source.read_bytes())
+        except OSError:
+            h.update(b'<missing>')
+    return h.hexdigest()
+
+
+# =============================================================================
+# MANIFEST
+# =============================================================================
+
+class Manifest:
+    """Per-file content hashes plus the last validation outcome."""
+
+    def __init__(self, manifest_file: Path, fingerprint: str):
+        self.manifest_file = manifest_file
+        self.fingerprint = fingerprint
+        self.entries = {}
+        self._dirty = False
+        self._read()
+
+    def _read(self):
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if (not isinstance(payload, dict)
+                or payload.get('version') != MANIFEST_VERSION
+                or payload.get('fingerprint') != self.fingerprint):
+            self._dirty = True
+            return
+
+        self.entries = payload.get('entries', {})
+
+    @staticmethod
+    def key(filepath: Path) -> str:
+        return str(filepath.resolve())
+
+    def get(self, filepath: Path) -> Optional[dict]:
+        return self.entries.get(self.key(filepath))
+
+    def is_current(self, filepath: Path) -> bool:
+        """True if filepath's content matches what was last validated."""
+        entry = self.get(filepath)
+        if entry is None:
+            return False
+
+        try:
+            stat = filepath.stat()
+        except OSError:
+            return False
+        if entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return True
+
+        try:
+            raw = filepath.read_bytes()
+        except OSError:
+            return False
+        if entry['digest'] != content_digest(raw):
+            return False
+
+        entry['mtime_ns'] = stat.st_mtime_ns
+        entry['size'] = stat.st_size
+        self._dirty = True
+        return True
+
+    def record(self, filepath: Path, outcome: dict):
+        """Store the outcome of validating filepath's current content."""
+        try:
+            stat = filepath.stat()
+            digest = content_digest(filepath.read_bytes())
+        except OSError:
+            self.forget(filepath)
+            return
+
+        entry = dict(outcome)
+        entry['mtime_ns'] = stat.st_mtime_ns
+        entry['size'] = stat.st_size
+        entry['digest'] = digest
+        self.entries[self.key(filepath)] = entry
+        self._dirty = True
+
+    def forget(self, filepath: Path):
+        if self.entries.pop(self.key(filepath), None) is not None:
+            self._dirty = True
+
+    def removed(self, present: Iterable[Path], directory: Path) -> list:
+        """Return manifest entries under directory whose files no longer exist."""
+        present_keys = {self.key(p) for p in present}
+        prefix = str(directory.resolve()) + os.sep
+        return [(key, entry) for key, entry in self.entries.items()
+                if key.startswith(prefix) and key not in present_keys]
+
+    def save(self):
+        """Write the manifest back to disk if anything changed."""
+        if not self._dirty:
+            return
+
+        payload = {
+            'version': MANIFEST_VERSION,
+            'fingerprint': self.fingerprint,
+            'entries': self.entries,
+        }
+
+        if atomic_json_dump(self.manifest_file, payload):
+            self._dirty = False
+
+
+# =============================================================================
+# GIT
+# =============================================================================
+
+def changed_since(repo_root: Path, ref: str, directory: Path) -> Set[Path]:
+    """
+    Return files under directory that differ from ref, including untracked ones.
+
+    Raises RuntimeError if git cannot answer (not a repo, unknown ref, ...).
+    """
+    rel_dir = os.path.relpath(directory.resolve(), repo_root.resolve())
+    commands = [
+        ['git', 'diff', '--name-only', '--relative', '--no-renames', ref, '--', rel_dir],
+        ['git', 'ls-files', '--others', '--exclude-standard', '--', rel_dir],
+    ]
+
+    changed = set()
+    for command in commands:
+        proc = subprocess.run(command, cwd=repo_root, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip() or f"{' '.join(command)} failed")
+        for line in proc.stdout.splitlines():
+            if line:
+                changed.add((repo_root / line).resolve())
+    return changed
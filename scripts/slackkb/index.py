@@ -0,0 +1,197 @@
+"""
+Precomputed catalog index shared by the table renderers.
+
+Every renderer in tables.py needs the projects in star order, most need a
+markdown link per project, and the grouped views need buckets by category,
+language or maintenance tier. CatalogIndex computes all of that
+once, so a full report sorts the catalog a single time. Capability flags are
+held as bit-packed columns (see columns.py), with rows in star order.
+
+Any other field can be indexed on demand with field(): one pass maps each
+distinct value (and each element of list values) to a bitset of rows, which
+is what the --where query language evaluates against.
+"""
+
+from collections.abc import Mapping
+from typing import Dict, List, Set
+
+from slackkb.columns import CapabilityColumns, pack, unpack
+from slackkb.model import Project
+
+
+# Defaults used when a project has no value, matching the original renderers
+GROUP_DEFAULTS = {
+    'category': 'other',
+    'language': 'Other',
+    'maintenance-tier': 'unknown',
+}
+
+
+def star_key(project: dict) -> int:
+    """Sort key for star ordering (missing or null stars sort as 0)."""
+    if type(project) is Project:
+        return project.stars or 0
+    return project.get('stars') or 0
+
+
+def resolve(project: dict, path: str):
+    """Look up a dotted path (e.g. 'output-formats.json'), or None."""
+    value = project
+    for part in path.split('.'):
+        if not isinstance(value, Mapping):
+            return None
+        value = value.get(part)
+    return value
+
+
+def link(project: dict) -> str:
+    """Markdown link to a project's repository."""
+    return f"[{project.get('name', 'Unknown')}]({project.get('repo-url', '#')})"
+
+
+def value_key(value):
+    """Key of a value in a FieldIndex; true and false stay apart from 1 and 0."""
+    return (bool, value) if isinstance(value, bool) else value
+
+
+class FieldIndex:
+    """Inverted index of one field: value_key(value) -> bitset of rows holding it."""
+
+    __slots__ = ('values', 'members', 'truthy_bits')
+
+    def __init__(self, rows: List[dict], path: str):
+        values = {}
+        members = {}
+        truthy = []
+        for i, project in enumerate(rows):
+            value = resolve(project, path)
+            if value:
+                truthy.append(i)
+            if isinstance(value, list):
+                for item in value:
+                    try:
+                        members.setdefault(value_key(item), []).append(i)
+                    except TypeError:
+                        continue
+            elif not isinstance(value, Mapping):
+                try:
+                    values.setdefault(value_key(value), []).append(i)
+                except TypeError:
+                    continue
+
+        size = len(rows)
+        self.values = {v: pack(r, size) for v, r in values.items()}
+        self.members = {v: pack(sorted(set(r)), size) for v, r in members.items()}
+        self.truthy_bits = pack(truthy, size)
+
+
+class CatalogIndex:
+    """Star ordering, group-by buckets and per-section lookups for a catalog."""
+
+    def __init__(self, projects: List[dict]):
+        self.projects = projects
+
+        # Stable sort, so ties keep catalog (filename) order
+        self.order = sorted(range(len(projects)), key=lambda i: star_key(projects[i]),
+                            reverse=True)
+        self.by_stars = [projects[i] for i in self.order]
+        self.all_bits = (1 << len(projects)) - 1
+
+        self.links = [link(p) for p in self.by_stars]
+
+        self.total_stars = sum(map(star_key, projects))
+
+        self.columns = CapabilityColumns(self.by_stars)
+
+        self._groups = {}
+        self._sections = {}
+        self._fields = {}
+
+    @classmethod
+    def of(cls, projects) -> 'CatalogIndex':
+        """Return projects itself if already indexed, else index it."""
+        if isinstance(projects, cls):
+            return projects
+        return cls(projects)
+
+    def __len__(self):
+        return len(self.projects)
+
+    def replace(self, i: int, project: dict, fields: Set[str]) -> bool:
+        """
+        Swap in a new version of projects[i] that differs only in the given
+        top-level fields, updating just its rows. Returns False, changing
+        nothing, if the project would move in star order; index anew then.
+        """
+        old = self.projects[i]
+        if star_key(project) != star_key(old):
+            return False
+        row = self.order.index(i)
+
+        self.projects[i] = project
+        self.by_stars[row] = project
+        self.links[row] = link(project)
+        self.columns.set_row(row, project, fields)
+
+        for field in list(self._groups):
+            if field in fields:
+                del self._groups[field]
+                continue
+            bucket = self._groups[field][project.get(field, GROUP_DEFAULTS.get(field))]
+            bucket[next(k for k, p in enumerate(bucket) if p is old)] = project
+        for name, rows in self._sections.items():
+            rows[row] = project.get(name, {}) or {}
+        for path in list(self._fields):
+            if path.split('.', 1)[0] in fields:
+                del self._fields[path]
+        return True
+
+    def group(self, field: str) -> Dict[str, List[dict]]:
+        """
+        Bucket projects by a top-level field.
+
+        Buckets appear in order of first occurrence in the catalog and hold
+        their projects in star order.
+        """
+        buckets = self._groups.get(field)
+        if buckets is None:
+            default = GROUP_DEFAULTS.get(field)
+            buckets = {}
+            for p in self.projects:
+                buckets.setdefault(p.get(field, default), [])
+            for p in self.by_stars:
+                buckets[p.get(field, default)].append(p)
+            self._groups[field] = buckets
+        return buckets
+
+    def counts(self, field: str) -> Dict[str, int]:
+        """Number of projects per value of a top-level field."""
+        return {key: len(members) for key, members in self.group(field).items()}
+
+    def section(self, name: str) -> List[dict]:
+        """A section dict per project, in star order ({} when absent or null)."""
+        rows = self._sections.get(name)
+        if rows is None:
+            rows = [p.get(name, {}) or {} for p in self.by_stars]
+            self._sections[name] = rows
+        return rows
+
+    def field(self, path: str) -> FieldIndex:
+        """Value index for a (dotted) field, rows in star order."""
+        index = self._fields.get(path)
+        if index is None:
+            index = FieldIndex(self.by_stars, path)
+            self._fields[path] = index
+        return index
+
+    def subset(self, bits: int) -> List[dict]:
+        """Projects whose star-order row bit is set, in catalog order."""
+        size = len(self.by_stars)
+        selected = unpack(bits & self.all_bits, size)
+        positions = []
+        row = selected.find('1')
+        while row != -1:
+            positions.append(self.order[row])
+            row = selected.find('1', row + 1)
+        positions.sort()
+        return [self.projects[i] for i in positions]
@@ -0,0 +1,234 @@
+"""
+Compact in-memory model of a project file.
+
+A parsed project is a dict of some 40 keys, with a dozen nested dicts of
+feature flags, and every project repeats the same key strings and the same
+enum values. Project and Flags store the same data in slotted objects:
+
+- the ordered key set of a document (or section) is interned as a Layout,
+  shared by every project with the same keys;
+- a Project keeps its values in one tuple aligned with its layout, plus
+  typed attributes for the fields every renderer reads (name, stars, ...);
+- short strings (enum values like language or category, method names,
+  list items) are interned, so the catalog holds one copy of each;
+- a section holding booleans becomes Flags: true and false values are
+  packed as bits of two ints, other values (notes, formula names) are kept
+  as they are.
+
+Both classes are read-only Mappings, so code written against the raw dicts
+(p.get('language'), section.items(), ...) works unchanged; to_dict() gives
+back the original document. Values that are not flag sections, such as
+api-coverage or evidence, are the raw parsed objects.
+"""
+
+from sys import intern
+from collections.abc import Mapping
+from typing import Dict, Optional, Tuple
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Top-level fields exposed as attributes: (key, attribute)
+ATTRIBUTE_FIELDS = (
+    ('name', 'name'),
+    ('repo-url', 'repo_url'),
+    ('stars', 'stars'),
+    ('language', 'language'),
+    ('category', 'category'),
+    ('maintenance-tier', 'maintenance_tier'),
+    ('description', 'description'),
+)
+
+# Strings up to this length are interned: enum values, method names, list
+# items. Longer ones (descriptions, notes) are rarely repeated.
+INTERN_MAX_LENGTH = 64
+
+FILENAME_KEY = '_filename'
+
+
+class Layout:
+    """An ordered key set shared by every mapping with exactly these keys."""
+
+    __slots__ = ('keys', 'index')
+
+    def __init__(self, keys: Tuple[str, ...]):
+        self.keys = keys
+        self.index = {key: i for i, key in enumerate(keys)}
+
+
+_layouts: Dict[Tuple[str, ...], Layout] = {}
+
+
+def intern_layout(keys) -> Layout:
+    """The shared Layout for these keys (in this order)."""
+    keys = tuple(keys)
+    layout = _layouts.get(keys)
+    if layout is None:
+        layout = _layouts[keys] = Layout(tuple(
+            intern(key) if type(key) is str else key for key in keys))
+    return layout
+
+
+def compact(value):
+    """
+    value with its short strings interned (recursively through lists and
+    dicts), so repeated method names, list items and keys share one copy.
+    """
+    kind = type(value)
+    if kind is str:
+        return intern(value) if len(value) <= INTERN_MAX_LENGTH else value
+    if kind is list:
+        # Most lists hold strings; intern them without a call per item
+        return [(intern(item) if len(item) <= INTERN_MAX_LENGTH else item)
+                if type(item) is str else compact(item) for item in value]
+    if kind is dict:
+        return {intern(key) if type(key) is str else key: compact(item)
+                for key, item in value.items()}
+    return value
+
+
+# =============================================================================
+# FLAG SECTIONS
+# =============================================================================
+
+class Flags(Mapping):
+    """A section of feature flags, packed into bitsets."""
+
+    __slots__ = ('layout', 'true_bits', 'false_bits', 'others')
+
+    def __init__(self, section: dict):
+        self.layout = intern_layout(section)
+        true_bits = false_bits = 0
+        others = None
+        for i, value in enumerate(section.values()):
+            if value is True:
+                true_bits |= 1 << i
+            elif value is False:
+                false_bits |= 1 << i
+            else:
+                if others is None:
+                    others = {}
+                others[self.layout.keys[i]] = compact(value)
+        self.true_bits = true_bits
+        self.false_bits = false_bits
+        # Non-boolean values (lists of notes, formula names, ...) by key
+        self.others = others
+
+    def _value(self, i: int):
+        bit = 1 << i
+        if self.true_bits & bit:
+            return True
+        if self.false_bits & bit:
+            return False
+        return self.others[self.layout.keys[i]]
+
+    def __getitem__(self, key):
+        i = self.layout.index.get(key)
+        if i is None:
+            raise KeyError(key)
+        return self._value(i)
+
+    def get(self, key, default=None):
+        i = self.layout.index.get(key)
+        return default if i is None else self._value(i)
+
+    def __contains__(self, key):
+        return key in self.layout.index
+
+    def __iter__(self):
+        return iter(self.layout.keys)
+
+    def __len__(self):
+        return len(self.layout.keys)
+
+    def items(self):
+        return [(key, self._value(i)) for i, key in enumerate(self.layout.keys)]
+
+    def values(self):
+        return [self._value(i) for i in range(len(self.layout.keys))]
+
+    def to_dict(self) -> dict:
+        return dict(self.items())
+
+    def __repr__(self):
+        return f'Flags({self.to_dict()!r})'
+
+
+def _is_flag_section(value) -> bool:
+    if type(value) is not dict:
+        return False
+    for item in value.values():
+        if item is True or item is False:
+            return True
+    return False
+
+
+# =============================================================================
+# PROJECTS
+# =============================================================================
+
+class Project(Mapping):
+    """One project file: typed hot fields, interned values, packed flag sections."""
+
+    __slots__ = ('layout', 'field_values', 'filename') + tuple(a for _, a in ATTRIBUTE_FIELDS)
+
+    def __init__(self, document: dict, filename: Optional[str] = None):
+        if filename is not None:
+            document = dict(document)
+            document[FILENAME_KEY] = filename
+        self.layout = intern_layout(document)
+        values = []
+        for value in document.values():
+            if _is_flag_section(value):
+                value = Flags(value)
+            else:
+                value = compact(value)
+            values.append(value)
+        self.field_values = tuple(values)
+
+        self.filename = document.get(FILENAME_KEY)
+        for key, attribute in ATTRIBUTE_FIELDS:
+            i = self.layout.index.get(key)
+            setattr(self, attribute, None if i is None else self.field_values[i])
+
+    @classmethod
+    def of(cls, project) -> 'Project':
+        """Return project itself if already a Project, else convert the dict."""
+        if isinstance(project, cls):
+            return project
+        return cls(project)
+
+    def __getitem__(self, key):
+        i = self.layout.index.get(key)
+        if i is None:
+            raise KeyError(key)
+        return self.field_values[i]
+
+    def get(self, key, default=None):
+        i = self.layout.index.get(key)
+        return default if i is None else self.field_values[i]
+
+    def __contains__(self, key):
+        return key in self.layout.index
+
+    def __iter__(self):
+        return iter(self.layout.keys)
+
+    def __len__(self):
+        return len(self.layout.keys)
+
+    def items(self):
+        return list(zip(self.layout.keys, self.field_values))
+
+    def values(self):
+        return list(self.field_values)
+
+    def to_dict(self) -> dict:
+        """The document as parsed (plus _filename), flag sections as dicts."""
+        return {key: value.to_dict() if type(value) is Flags else value
+                for key, value in zip(self.layout.keys, self.field_values)}
+
+    def __repr__(self):
+        return f'Project({self.filename or self.name!r})'
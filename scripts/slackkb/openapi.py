@@ -0,0 +1,491 @@
+"""
+Compiled sidecar index for the archived Slack OpenAPI spec.
+
+The spec is a 1.2 MB JSON file, most of it response schemas under
+'definitions' that none of the scripts use. load_spec_index() instead reads
+a compact index stored next to it (slack-web-openapi-v2.index.json) holding
+only what the scripts need: every method with its category, HTTP verb,
+description, parameters and OAuth scopes.
+
+The index file has two JSON lines. The first holds the method list with
+categories, verbs and scopes, which is all the coverage tables need; the
+second holds descriptions and parameters for every method and is only
+decoded on request. The first line also records the byte range of each
+method's entry in the spec, so a single method or category is read by
+slicing the mmap'd spec and decoding just those fragments.
+
+The index records the SHA-256 of the spec and of its .meta.json. It is
+trusted while both files have the stat (mtime/size) it was built or last
+verified with; otherwise the files are hashed, and the index is rebuilt if
+either hash differs. When built, the method and category counts are checked
+against .meta.json and any disagreement is kept as a problem to report.
+"""
+
+import re
+import json
+import hashlib
+import mmap
+from json.decoder import scanstring
+from pathlib import Path
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from slackkb.atomic import atomic_write
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+INDEX_VERSION = 3
+HTTP_METHODS = ('get', 'post', 'put', 'delete', 'patch')
+
+META_CATEGORY_PATTERN = re.compile(r'^(\S+) \((\d+) methods?\)$')
+
+
+# Files kept next to a spec that are not specs themselves
+SIDECAR_SUFFIXES = ('.index.json', '.meta.json', '.repo.json')
+
+
+def default_index_file(spec_path: Path) -> Path:
+    """slack-web-openapi-v2.json -> slack-web-openapi-v2.index.json"""
+    return spec_path.with_suffix('.index.json')
+
+
+def default_meta_file(spec_path: Path) -> Path:
+    """slack-web-openapi-v2.json -> slack-web-openapi-v2.meta.json"""
+    return spec_path.with_suffix('.meta.json')
+
+
+# =============================================================================
+# EXTRACTION
+# =============================================================================
+
+def load_openapi_spec(spec_path: Path) -> dict:
+    """Load the OpenAPI specification JSON file."""
+    with open(spec_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def method_scopes(details: dict) -> List[str]:
+    """OAuth scopes listed in an operation's security requirements."""
+    scopes = []
+    for requirement in details.get('security', []) or []:
+        for names in requirement.values():
+            for name in names or []:
+                if name not in scopes:
+                    scopes.append(name)
+    return scopes
+
+
+def method_category(method_name: str) -> str:
+    """Category of a method ("conversations.history" -> "conversations")."""
+    if '.' in method_name:
+        return method_name.split('.')[0]
+    return 'other'
+
+
+def method_record(path: str, path_data: dict) -> Optional[dict]:
+    """Summarize the first HTTP operation of one path entry (None if it has none)."""
+    # Get HTTP method details (usually GET or POST)
+    for http_method in HTTP_METHODS:
+        if http_method in path_data:
+            method_details = path_data[http_method]
+
+            # Extract parameters
+            parameters = []
+            for param in method_details.get('parameters', []):
+                param_info = {
+                    'name': param.get('name'),
+                    'required': param.get('required', False),
+                    'type': param.get('type', 'unknown'),
+                    'description': param.get('description', '')[:100]  # Truncate
+                }
+                parameters.append(param_info)
+
+            return {
+                'path': path,
+                'http_method': http_method.upper(),
+                'description': method_details.get('description', '')[:200],
+                'summary': method_details.get('summary', ''),
+                'parameters': parameters,
+                'parameter_count': len(parameters),
+                'required_params': [p['name'] for p in parameters if p['required']]
+            }
+    return None
+
+
+def extract_methods(spec: dict) -> dict:
+    """
+    Extract all API methods from the OpenAPI spec.
+
+    Returns dict with structure:
+    {
+        "category": {
+            "method_name": {
+                "path": "/api/method.name",
+                "description": "...",
+                "parameters": [...],
+                "http_method": "get|post"
+            }
+        }
+    }
+    """
+    methods_by_category = defaultdict(dict)
+
+    paths = spec.get('paths', {})
+
+    for path, path_data in paths.items():
+        # Extract method name from path (e.g., "/conversations.history" -> "conversations.history")
+        method_name = path.lstrip('/')
+
+        record = method_record(path, path_data)
+        if record is not None:
+            methods_by_category[method_category(method_name)][method_name] = record
+
+    return dict(methods_by_category)
+
+
+def scan_path_offsets(raw: bytes) -> Dict[str, Tuple[int, int]]:
+    """
+    Byte range of every entry under the top-level "paths" object.
+
+    The bytes are viewed as latin-1, one character per byte, so positions
+    reported by the JSON scanner are byte offsets into the file.
+    """
+    text = raw.decode('latin-1')
+    decoder = json.JSONDecoder()
+    ws = re.compile(r'[ \t\n\r]*')
+
+    def skip(pos):
+        return ws.match(text, pos).end()
+
+    def members(pos):
+        """Yield (key, value_start, value_end) for the object starting at pos."""
+        pos = skip(pos)
+        if text[pos] != '{':
+            raise ValueError(f"Expected object at byte {pos}")
+        pos = skip(pos + 1)
+        if text[pos] == '}':
+            return
+        while True:
+            key, pos = scanstring(text, pos + 1)
+            pos = skip(skip(pos) + 1)  # ':'
+            _, end = decoder.raw_decode(text, pos)
+            yield key, pos, end
+            pos = skip(end)
+            if text[pos] == '}':
+                return
+            pos = skip(pos + 1)  # ','
+
+    for key, start, _ in members(0):
+        if key == 'paths':
+            # Keys were decoded as latin-1; re-decode them as UTF-8
+            return {k.encode('latin-1').decode('utf-8'): (s, e) for k, s, e in members(start)}
+    return {}
+
+
+def check_meta(methods_by_category: dict, meta: Optional[dict]) -> List[str]:
+    """Compare extracted methods with the counts recorded in .meta.json."""
+    if not meta:
+        return []
+
+    problems = []
+    total = sum(len(m) for m in methods_by_category.values())
+    if 'total_methods' in meta and meta['total_methods'] != total:
+        problems.append(f"Spec has {total} methods but .meta.json says {meta['total_methods']}")
+    if 'total_categories' in meta and meta['total_categories'] != len(methods_by_category):
+        problems.append(f"Spec has {len(methods_by_category)} categories "
+                        f"but .meta.json says {meta['total_categories']}")
+
+    for entry in meta.get('categories', []) or []:
+        match = META_CATEGORY_PATTERN.match(str(entry))
+        if not match:
+            continue
+        category, count = match.group(1), int(match.group(2))
+        actual = len(methods_by_category.get(category, {}))
+        if actual != count:
+            problems.append(f"Category '{category}' has {actual} methods "
+                            f"but .meta.json says {count}")
+    return problems
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+def _file_key(path: Path, raw: bytes = None) -> Optional[dict]:
+    """Stat and SHA-256 of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+        if raw is None:
+            raw = path.read_bytes()
+    except OSError:
+        return None
+    return {
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'sha256': hashlib.sha256(raw).hexdigest(),
+    }
+
+
+def _stat_matches(path: Path, key: Optional[dict]) -> bool:
+    try:
+        stat = path.stat()
+    except OSError:
+        return key is None
+    return (key is not None and key['mtime_ns'] == stat.st_mtime_ns
+            and key['size'] == stat.st_size)
+
+
+def _hash_matches(path: Path, key: Optional[dict]) -> bool:
+    current = _file_key(path)
+    if current is None or key is None:
+        return current is None and key is None
+    if current['sha256'] != key['sha256']:
+        return False
+    key.update(current)
+    return True
+
+
+class SpecIndex:
+    """The parts of an OpenAPI spec the scripts use, without the schemas."""
+
+    def __init__(self, header: dict, details, spec_path: Path = None):
+        self.header = header
+        self.info = header['info']
+        self.problems = header['problems']
+        self.methods = header['methods']
+        self.spec_path = spec_path
+        self._details = details
+        self._by_name = None
+        self._map = None
+
+    @property
+    def title(self) -> str:
+        return self.info.get('title', 'Slack Web API')
+
+    @property
+    def version(self) -> str:
+        return self.info.get('version', 'unknown')
+
+    @property
+    def method_names(self) -> List[str]:
+        return [m['name'] for m in self.methods]
+
+    @property
+    def details(self) -> List[list]:
+        """[description, summary, parameters] per method, decoded on first use."""
+        if isinstance(self._details, (bytes, str)):
+            self._details = json.loads(self._details)
+        return self._details
+
+    def categories(self) -> Dict[str, List[str]]:
+        """Sorted method names per category, categories in spec order."""
+        result = {}
+        for m in self.methods:
+            result.setdefault(m['category'], []).append(m['name'])
+        for names in result.values():
+            names.sort()
+        return result
+
+    def records(self, category: str = None) -> Iterator[Tuple[dict, dict]]:
+        """
+        (header entry, extract_methods() record) per method, in spec order,
+        built one at a time (only methods of category, if given).
+        """
+        for m, (description, summary, params) in zip(self.methods, self.details):
+            if category is not None and m['category'] != category:
+                continue
+            parameters = [
+                {'name': name, 'required': required, 'type': type_, 'description': text}
+                for name, required, type_, text in params
+            ]
+            yield m, {
+                'path': m['path'],
+                'http_method': m['http_method'],
+                'description': description,
+                'summary': summary,
+                'parameters': parameters,
+                'parameter_count': len(parameters),
+                'required_params': [p['name'] for p in parameters if p['required']]
+            }
+
+    def methods_by_category(self) -> dict:
+        """Same structure as extract_methods()."""
+        result = {}
+        for m, record in self.records():
+            result.setdefault(m['category'], {})[m['name']] = record
+        return result
+
+    # -------------------------------------------------------------------------
+    # Single-method access through the spec's byte offsets
+    # -------------------------------------------------------------------------
+
+    def find(self, name: str) -> Optional[dict]:
+        """Header entry of a method, or None."""
+        if self._by_name is None:
+            self._by_name = {m['name']: m for m in self.methods}
+        return self._by_name.get(name)
+
+    def fragment(self, name: str) -> bytes:
+        """Raw JSON of a method's path entry, sliced from the mmap'd spec."""
+        if self._map is None:
+            with open(self.spec_path, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        start, end = self.find(name)['offset']
+        return self._map[start:end]
+
+    def method(self, name: str) -> Optional[dict]:
+        """extract_methods() record for one method, decoding only its entry."""
+        entry = self.find(name)
+        if entry is None:
+            return None
+        return method_record(entry['path'], json.loads(self.fragment(name)))
+
+    def category(self, category: str) -> Dict[str, dict]:
+        """extract_methods() records for one category, in spec order."""
+        return {m['name']: self.method(m['name'])
+                for m in self.methods if m['category'] == category}
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+def build_index(spec_path: Path, meta_path: Path = None) -> Tuple[dict, list]:
+    """Parse the spec and return a fresh index (header, details)."""
+    meta_path = meta_path or default_meta_file(spec_path)
+    raw = spec_path.read_bytes()
+    spec = json.loads(raw)
+
+    meta = None
+    meta_key = _file_key(meta_path)
+    if meta_key is not None:
+        try:
+            meta = json.loads(meta_path.read_bytes())
+        except (OSError, ValueError):
+            meta = None
+
+    methods_by_category = extract_methods(spec)
+    paths = spec.get('paths', {})
+    offsets = scan_path_offsets(raw)
+
+    methods = []
+    details = []
+    for category, category_methods in methods_by_category.items():
+        for name, info in category_methods.items():
+            operation = paths[info['path']][info['http_method'].lower()]
+            methods.append({
+                'name': name,
+                'category': category,
+                'path': info['path'],
+                'http_method': info['http_method'],
+                'scopes': method_scopes(operation),
+                'offset': offsets[info['path']],
+            })
+            details.append([
+                info['description'],
+                info['summary'],
+                [[p['name'], p['required'], p['type'], p['description']]
+                 for p in info['parameters']],
+            ])
+
+    info = spec.get('info', {})
+    header = {
+        'version': INDEX_VERSION,
+        'spec': _file_key(spec_path, raw),
+        'meta': meta_key,
+        'info': {k: info[k] for k in ('title', 'version') if k in info},
+        'problems': check_meta(methods_by_category, meta),
+        'methods': methods,
+    }
+    return header, details
+
+
+def _save(index_file: Path, header: dict, details):
+    """Write the index atomically; an unwritable directory is not an error."""
+    if not isinstance(details, (bytes, str)):
+        details = json.dumps(details, separators=(',', ':'))
+    if isinstance(details, str):
+        details = details.encode('utf-8')
+
+    def write(f):
+        f.write(json.dumps(header, separators=(',', ':')).encode('utf-8'))
+        f.write(b'\n')
+        f.write(details)
+
+    atomic_write(index_file, write)
+
+
+def _read(index_file: Path) -> Tuple[Optional[dict], bytes]:
+    """Return (header, undecoded details), or (None, b'') if unusable."""
+    try:
+        with open(index_file, 'rb') as f:
+            raw = f.read()
+        header_raw, _, details = raw.partition(b'\n')
+        header = json.loads(header_raw)
+    except (OSError, ValueError):
+        return None, b''
+    if not isinstance(header, dict) or header.get('version') != INDEX_VERSION:
+        return None, b''
+    return header, details
+
+
+def load_spec_index(spec_path: Path, index_file: Path = None,
+                    use_index: bool = True) -> SpecIndex:
+    """
+    Return the index for spec_path, rebuilding the sidecar if it is stale.
+
+    With use_index=False the spec is parsed and nothing is written.
+    """
+    if not use_index:
+        return SpecIndex(*build_index(spec_path), spec_path)
+
+    index_file = index_file or default_index_file(spec_path)
+    meta_path = default_meta_file(spec_path)
+
+    header, details = _read(index_file)
+    if header is not None:
+        if _stat_matches(spec_path, header['spec']) and _stat_matches(meta_path, header['meta']):
+            return SpecIndex(header, details, spec_path)
+        # Touched but possibly unchanged (e.g. a fresh checkout): compare hashes
+        if _hash_matches(spec_path, header['spec']) and _hash_matches(meta_path, header['meta']):
+            _save(index_file, header, details)
+            return SpecIndex(header, details, spec_path)
+
+    header, details = build_index(spec_path, meta_path)
+    _save(index_file, header, details)
+    return SpecIndex(header, details, spec_path)
+
+
+def find_spec_snapshots(directory: Path) -> List[Path]:
+    """
+    Spec files in a snapshot directory, sorted by file name.
+
+    Name snapshots so they sort chronologically (for example
+    slack-web-openapi-v2.2024-03-27.json); sidecar files are skipped.
+    """
+    return sorted(p for p in directory.glob('*.json')
+                  if not p.name.endswith(SIDECAR_SUFFIXES))
+
+
+def load_spec_snapshots(directory: Path, use_index: bool = True) -> Dict[str, SpecIndex]:
+    """
+    Index every spec snapshot in directory, keyed by version label.
+
+    The label is the spec's info.version, or the file stem when that is
+    missing or shared with another snapshot.
+    """
+    indexes = [(path, load_spec_index(path, use_index=use_index))
+               for path in find_spec_snapshots(directory)]
+    versions = [index.version for _, index in indexes]
+
+    snapshots = {}
+    for path, index in indexes:
+        label = index.version
+        if label == 'unknown' or versions.count(label) > 1:
+            label = path.stem
+        snapshots[label] = index
+    return snapshots
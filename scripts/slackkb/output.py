@@ -0,0 +1,111 @@
+"""
+Streaming output for the report generators.
+
+Renderers yield their output line by line; write_lines() joins those lines
+in small batches and hands them to a buffered stream, so a report is never
+held in memory as a whole and the first section is written as soon as it
+is rendered. Record dumps (--ndjson) are written one JSON line per record.
+"""
+
+import os
+import sys
+import json
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, TextIO
+
+
+# Chunks joined per write() call, and the buffer size of output files
+WRITE_BATCH = 512
+BUFFER_SIZE = 1 << 16
+
+
+@contextmanager
+def open_output(path: Optional[str]) -> Iterator[TextIO]:
+    """Yield a buffered text stream for path, or stdout when path is None."""
+    if path is None:
+        yield sys.stdout
+        sys.stdout.flush()
+        return
+    with open(path, 'w', encoding='utf-8', buffering=BUFFER_SIZE) as f:
+        yield f
+
+
+def write_chunks(chunks: Iterable[str], stream: TextIO, end: str = '') -> None:
+    """Write chunks of text followed by end, batching small writes."""
+    batch = []
+    for chunk in chunks:
+        batch.append(chunk)
+        if len(batch) >= WRITE_BATCH:
+            stream.write(''.join(batch))
+            batch.clear()
+    batch.append(end)
+    stream.write(''.join(batch))
+
+
+def _separated(lines: Iterable[str]) -> Iterator[str]:
+    lines = iter(lines)
+    for line in lines:
+        yield line
+        break
+    for line in lines:
+        yield '\n'
+        yield line
+
+
+def write_lines(lines: Iterable[str], stream: TextIO, end: str = '') -> None:
+    """
+    Write lines separated by newlines, followed by end.
+
+    The result is the same as stream.write('\\n'.join(lines) + end).
+    """
+    write_chunks(_separated(lines), stream, end)
+
+
+def _json_default(value):
+    # Projects and flag sections (see model.py) encode as the dicts they hold
+    to_dict = getattr(value, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    return str(value)
+
+
+def iter_json(value, indent: int = 2) -> Iterator[str]:
+    """Encode value as JSON in chunks (same text as json.dumps(..., default=str))."""
+    return json.JSONEncoder(indent=indent, default=_json_default).iterencode(value)
+
+
+def iter_ndjson(records: Iterable) -> Iterator[str]:
+    """One compact JSON line (with its newline) per record, encoded as it is reached."""
+    encode = json.JSONEncoder(separators=(',', ':'), default=_json_default).encode
+    for record in records:
+        yield encode(record) + '\n'
+
+
+def write_ndjson(records: Iterable, stream: TextIO, flush: bool = False) -> int:
+    """
+    Write records as newline-delimited JSON as they are produced. With
+    flush, each record is flushed on its own, so a consumer reading a pipe
+    can start on it before the next one is generated. Returns the number of
+    records written.
+    """
+    count = 0
+    for line in iter_ndjson(records):
+        stream.write(line)
+        if flush:
+            stream.flush()
+        count += 1
+    return count
+
+
+def discard_stdout() -> None:
+    """
+    Point stdout at /dev/null once its reader has gone away (BrokenPipeError,
+    e.g. under `| head`), so the interpreter's final flush does not fail too.
+    """
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+
+
+def render(lines: Iterable[str]) -> str:
+    """Collect a renderer's lines into one string."""
+    return '\n'.join(lines)
@@ -0,0 +1,168 @@
+"""
+Process-pool helpers for parsing and validating project YAML files.
+
+Work is distributed with ProcessPoolExecutor.map(), which yields results in
+input order, so output stays deterministic regardless of --jobs. Cache
+lookups and stores happen in the parent process; workers only ever parse.
+Small batches run in-process because starting a pool would cost more than
+the parse itself.
+"""
+
+import os
+import time
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from slackkb.cache import YamlCache, parse_yaml_bytes, content_digest
+from slackkb.profile import CACHED, Timed, active
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Below this many tasks, a pool is slower than a plain loop
+MIN_PARALLEL_TASKS = 32
+
+
+def default_jobs() -> int:
+    """Default --jobs value: one worker per CPU."""
+    return os.cpu_count() or 1
+
+
+def add_jobs_argument(parser):
+    """Add the shared --jobs option to an argparse parser."""
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=default_jobs(),
+        metavar='N',
+        help='Parse files across N worker processes (default: CPU count)'
+    )
+
+
+# =============================================================================
+# ORDERED PARALLEL MAP
+# =============================================================================
+
+def imap_ordered(func: Callable, items: Iterable, jobs: int = 1,
+                 initializer: Callable = None, initargs: tuple = (),
+                 timings: list = None) -> Iterator:
+    """
+    map_ordered() as a generator: each result is yielded as soon as it and
+    every result before it are ready, so the caller can start consuming
+    while later items are still being processed.
+    """
+    items = list(items)
+    if timings is not None:
+        func = Timed(func)
+
+    if jobs <= 1 or len(items) < MIN_PARALLEL_TASKS:
+        results = map(func, items)
+        pool = None
+    else:
+        workers = min(jobs, len(items))
+        chunksize = max(1, len(items) // (workers * 4))
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=initializer,
+                                   initargs=initargs)
+        results = pool.map(func, items, chunksize=chunksize)
+        profiler = active()
+        if profiler is not None:
+            profiler.used_pool()
+
+    try:
+        for result in results:
+            if timings is not None:
+                result, seconds = result
+                timings.append(seconds)
+            yield result
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def map_ordered(func: Callable, items: Iterable, jobs: int = 1,
+                initializer: Callable = None, initargs: tuple = (),
+                timings: list = None) -> list:
+    """
+    Apply func to every item, in parallel when worthwhile, preserving order.
+
+    initializer(*initargs) runs once in each worker process; it is not called
+    when the work runs in-process, where the caller's state is already set up.
+    If timings is a list, the duration of each call is appended to it.
+    """
+    return list(imap_ordered(func, items, jobs, initializer, initargs, timings))
+
+
+# =============================================================================
+# PARSING
+# =============================================================================
+
+def read_and_parse(filepath: Path) -> Tuple[os.stat_result, str, object]:
+    """Read and parse one file, returning what the cache needs to store it."""
+    stat = filepath.stat()
+    raw = filepath.read_bytes()
+    return stat, content_digest(raw), parse_yaml_bytes(raw, str(filepath))
+
+
+def _parse_task(filepath: Path):
+    try:
+        return read_and_parse(filepath), None
+    except Exception as e:
+        return None, e
+
+
+def iter_documents(paths: List[Path], cache: Optional[YamlCache] = None,
+                   jobs: int = 1) -> Iterator[Tuple[object, Optional[Exception]]]:
+    """
+    Parse every path, yielding (document, error) pairs in input order as
+    soon as each is available.
+
+    Cache hits are served in-process; only misses are sent to the pool.
+    """
+    ready = {}
+    pending = []
+    profiler = active()
+    hit_timings = []
+
+    for i, filepath in enumerate(paths):
+        if cache is not None:
+            start = time.perf_counter() if profiler is not None else 0
+            try:
+                hit, document = cache.lookup(filepath)
+            except OSError as e:
+                ready[i] = (None, e)
+                continue
+            if hit:
+                ready[i] = (document, None)
+                if profiler is not None:
+                    hit_timings.append((filepath, time.perf_counter() - start))
+                continue
+        pending.append(i)
+
+    if hit_timings:
+        profiler.record_files(*zip(*hit_timings), kind=CACHED)
+    timings = None if profiler is None else []
+    parsed = imap_ordered(_parse_task, [paths[i] for i in pending], jobs, timings=timings)
+    for i in range(len(paths)):
+        if i in ready:
+            yield ready.pop(i)
+            continue
+        record, error = next(parsed)
+        if error is not None:
+            yield None, error
+            continue
+        stat, digest, document = record
+        if cache is not None:
+            cache.store(paths[i], stat, digest, document)
+        yield document, None
+
+    if profiler is not None:
+        profiler.record_files([paths[i] for i in pending], timings)
+
+
+def load_documents(paths: List[Path], cache: Optional[YamlCache] = None,
+                   jobs: int = 1) -> List[Tuple[object, Optional[Exception]]]:
+    """Parse every path, returning (document, error) pairs in input order."""
+    return list(iter_documents(paths, cache, jobs))
@@ -0,0 +1,219 @@
+"""
+Per-phase timing and profiling for --profile.
+
+Scripts wrap their steps in profiler.phase('name'). With --profile, each
+phase records wall and CPU time (including worker processes), and the
+report printed at exit adds peak RSS and the slowest files, with files
+parsed and files served from the parse cache listed apart. With
+--profile-dump FILE the whole run is also recorded by cProfile and saved
+as pstats data (python -m pstats FILE).
+
+Without --profile, start_profiler() returns NULL_PROFILER: phase() hands
+back one shared no-op context manager and nothing is timed. Per-file timings
+are collected only while a profiler is active (see parallel.map_ordered).
+"""
+
+import os
+import sys
+import time
+import atexit
+from contextlib import contextmanager, nullcontext
+from typing import List, Optional
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+DEFAULT_TOP_FILES = 10
+
+# Kinds of per-file timings, reported as separate lists
+PARSED = 'files parsed'
+CACHED = 'cache hits'
+
+_active = None
+
+
+def add_profile_arguments(parser):
+    """Add the shared --profile options to an argparse parser."""
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Print per-phase wall/CPU time, peak RSS and the slowest file parses to stderr'
+    )
+    parser.add_argument(
+        '--profile-top',
+        type=int,
+        default=DEFAULT_TOP_FILES,
+        metavar='N',
+        help=f'With --profile, how many of the slowest files to list (default: {DEFAULT_TOP_FILES})'
+    )
+    parser.add_argument(
+        '--profile-dump',
+        metavar='FILE',
+        help='Also record the run with cProfile and write pstats data to FILE (implies --profile)'
+    )
+
+
+def active() -> Optional['Profiler']:
+    """The running profiler, or None when profiling is off."""
+    return _active
+
+
+def _cpu_time() -> float:
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def _peak_rss(who) -> Optional[int]:
+    """Peak resident set size in bytes (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _mib(size: Optional[int]) -> str:
+    return 'n/a' if size is None else f'{size / (1 << 20):.1f} MiB'
+
+
+# =============================================================================
+# PROFILERS
+# =============================================================================
+
+class NullProfiler:
+    """Stand-in used without --profile: every hook is a no-op."""
+
+    _context = nullcontext()
+
+    def phase(self, name: str):
+        return self._context
+
+    def record_files(self, paths, seconds, kind: str = PARSED):
+        pass
+
+    def used_pool(self):
+        pass
+
+    def finish(self):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class Profiler:
+    """Wall and CPU time per phase, per-file times and an optional cProfile run."""
+
+    def __init__(self, top: int = DEFAULT_TOP_FILES, dump_file: str = None):
+        self.top = top
+        self.dump_file = dump_file
+        self.phases = []
+        # kind -> [(seconds, path)]
+        self.files = {PARSED: [], CACHED: []}
+        self.pooled = False
+        self.start_wall = time.perf_counter()
+        self.start_cpu = _cpu_time()
+        self._finished = False
+
+        self.cprofile = None
+        if dump_file:
+            import cProfile
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+
+    @contextmanager
+    def phase(self, name: str):
+        wall = time.perf_counter()
+        cpu = _cpu_time()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - wall, _cpu_time() - cpu))
+
+    def record_files(self, paths, seconds, kind: str = PARSED):
+        """Record the time spent on each of paths (in the same order)."""
+        self.files[kind].extend(zip(seconds, (str(p) for p in paths)))
+
+    def used_pool(self):
+        """Note that work ran in worker processes, so their peak RSS is reported."""
+        self.pooled = True
+
+    def slowest(self, kind: str = PARSED) -> List[tuple]:
+        return sorted(self.files[kind], reverse=True)[:self.top]
+
+    def finish(self):
+        """Stop profiling and print the report to stderr (once)."""
+        if self._finished:
+            return
+        self._finished = True
+        if self.cprofile is not None:
+            self.cprofile.disable()
+
+        total_wall = time.perf_counter() - self.start_wall
+        total_cpu = _cpu_time() - self.start_cpu
+        out = sys.stderr
+
+        print("\nProfile", file=out)
+        print("-" * 60, file=out)
+        print(f"{'Phase':<36} {'Wall (s)':>10} {'CPU (s)':>10}", file=out)
+        for name, wall, cpu in self.phases:
+            print(f"{name:<36} {wall:>10.3f} {cpu:>10.3f}", file=out)
+        print(f"{'total':<36} {total_wall:>10.3f} {total_cpu:>10.3f}", file=out)
+
+        peak = _peak_rss(resource.RUSAGE_SELF) if resource else None
+        children = _peak_rss(resource.RUSAGE_CHILDREN) if resource else None
+        line = f"Peak RSS: {_mib(peak)}"
+        if self.pooled and children:
+            line += f" (largest worker: {_mib(children)})"
+        print(line, file=out)
+
+        for kind in (PARSED, CACHED):
+            slowest = self.slowest(kind)
+            if slowest:
+                print(f"Slowest {len(slowest)} of {len(self.files[kind])} {kind}:", file=out)
+                for seconds, path in slowest:
+                    print(f"  {seconds * 1000:>9.2f} ms  {path}", file=out)
+
+        if self.cprofile is not None:
+            try:
+                self.cprofile.dump_stats(self.dump_file)
+                print(f"cProfile stats written to {self.dump_file}", file=out)
+            except OSError as e:
+                print(f"Warning: Cannot write cProfile stats: {e}", file=out)
+
+
+def start_profiler(args):
+    """
+    Start profiling if args ask for it, reporting when the process exits.
+
+    Returns the profiler, or NULL_PROFILER.
+    """
+    global _active
+    if not (args.profile or args.profile_dump):
+        return NULL_PROFILER
+    _active = Profiler(args.profile_top, args.profile_dump)
+    atexit.register(_active.finish)
+    return _active
+
+
+# =============================================================================
+# PER-ITEM TIMING
+# =============================================================================
+
+class Timed:
+    """Wraps a (picklable) function so each call also returns its duration."""
+
+    def __init__(self, func):
+        self.func = func
+
+    def __call__(self, item):
+        start = time.perf_counter()
+        result = self.func(item)
+        return result, time.perf_counter() - start
@@ -0,0 +1,276 @@
+"""
+Catalog query language for generate-tables.py --where.
+
+Examples:
+
+    read-capabilities.read-threads and output-formats.json and language == "Go"
+    maintenance-tier != "archived" and stars >= 500
+    not (slack-features.send-messages or "chat.postMessage" in api-coverage.methods-supported)
+
+Grammar:
+
+    expr     := and_expr ('or' and_expr)*
+    and_expr := not_expr ('and' not_expr)*
+    not_expr := 'not' not_expr | atom
+    atom     := '(' expr ')'
+              | FIELD                      -- field is set / truthy
+              | FIELD OP LITERAL           -- OP: == != < <= > >=
+              | LITERAL 'in' FIELD         -- list field contains value
+    FIELD    := name('.'name)*             -- e.g. language, output-formats.json
+    LITERAL  := "string" | 'string' | number | true | false | null
+
+An expression is compiled once into a tree of closures. Evaluating it never
+looks at project dicts: every leaf maps to a bitset taken from the catalog
+index (capability columns or per-field value indexes) and the boolean
+operators become &, | and ~ on those bitsets.
+"""
+
+import re
+import operator
+from typing import Callable, List, Tuple
+
+from slackkb.index import CatalogIndex, value_key
+
+
+class QueryError(ValueError):
+    """Raised for expressions that cannot be parsed."""
+
+
+# =============================================================================
+# TOKENIZER
+# =============================================================================
+
+TOKEN_PATTERN = re.compile(r'''
+    \s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<number>-?\d+(?:\.\d+)?(?![\w.-]))
+      | (?P<op>==|!=|<=|>=|<|>)
+      | (?P<paren>[()])
+      | (?P<name>[A-Za-z_][A-Za-z0-9_.-]*)
+    )
+''', re.VERBOSE)
+
+KEYWORDS = {'and', 'or', 'not', 'in'}
+CONSTANTS = {'true': True, 'false': False, 'null': None}
+
+# How each token kind is described in error messages
+EXPECTED = {
+    'literal': 'a value',
+    'name': 'a field name',
+    'paren': "')'",
+    'in': "'in'",
+}
+
+COMPARISONS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+
+def tokenize(text: str) -> List[Tuple[str, object]]:
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = TOKEN_PATTERN.match(text, pos)
+        if not match or match.end() == pos:
+            raise QueryError(f"Unexpected input at position {pos}: {text[pos:pos + 20]!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == 'string':
+            value = re.sub(r'\\(.)', r'\1', value[1:-1])
+            tokens.append(('literal', value))
+        elif kind == 'number':
+            tokens.append(('literal', float(value) if '.' in value else int(value)))
+        elif kind == 'name' and value in KEYWORDS:
+            tokens.append((value, value))
+        elif kind == 'name' and value in CONSTANTS:
+            tokens.append(('literal', CONSTANTS[value]))
+        else:
+            tokens.append((kind, value))
+    return tokens
+
+
+# =============================================================================
+# PARSER / COMPILER
+# =============================================================================
+
+# A compiled node maps a CatalogIndex to a bitset of matching rows (star order)
+Node = Callable[[CatalogIndex], int]
+
+
+class _Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, offset=0):
+        i = self.pos + offset
+        return self.tokens[i] if i < len(self.tokens) else ('end', None)
+
+    def take(self, kind=None):
+        token = self.peek()
+        if kind is not None and token[0] != kind:
+            found = token[1] if token[0] != 'end' else 'end of expression'
+            raise QueryError(f"Expected {EXPECTED.get(kind, kind)}, found {found!r}")
+        self.pos += 1
+        return token
+
+    def parse(self) -> Node:
+        node = self.expr()
+        if self.peek()[0] != 'end':
+            raise QueryError(f"Unexpected {self.peek()[1]!r}")
+        return node
+
+    def expr(self) -> Node:
+        node = self.and_expr()
+        while self.peek()[0] == 'or':
+            self.take()
+            node = _or(node, self.and_expr())
+        return node
+
+    def and_expr(self) -> Node:
+        node = self.not_expr()
+        while self.peek()[0] == 'and':
+            self.take()
+            node = _and(node, self.not_expr())
+        return node
+
+    def not_expr(self) -> Node:
+        if self.peek()[0] == 'not':
+            self.take()
+            return _not(self.not_expr())
+        return self.atom()
+
+    def atom(self) -> Node:
+        kind, value = self.peek()
+        if kind == 'paren' and value == '(':
+            self.take()
+            node = self.expr()
+            if self.take('paren')[1] != ')':
+                raise QueryError("Expected ')'")
+            return node
+
+        if kind == 'literal':
+            self.take()
+            self.take('in')
+            return _contains(self.take('name')[1], value)
+
+        if kind == 'name':
+            self.take()
+            if self.peek()[0] == 'op':
+                op = self.take()[1]
+                literal = self.take('literal')[1]
+                return _compare(value, op, literal)
+            return _truthy(value)
+
+        found = value if kind != 'end' else 'end of expression'
+        raise QueryError(f"Expected a field or '(', found {found!r}")
+
+
+def _or(left: Node, right: Node) -> Node:
+    return lambda index: left(index) | right(index)
+
+
+def _and(left: Node, right: Node) -> Node:
+    return lambda index: left(index) & right(index)
+
+
+def _not(inner: Node) -> Node:
+    return lambda index: index.all_bits & ~inner(index)
+
+
+def _flag_column(index: CatalogIndex, path: str):
+    """Return the capability column for a section.field path, if it has one."""
+    section, _, field = path.partition('.')
+    if field and '.' not in field and (section, field) in index.columns.keys():
+        return index.columns.column(section, field)
+    return None
+
+
+def _truthy(path: str) -> Node:
+    def evaluate(index):
+        column = _flag_column(index, path)
+        if column is not None:
+            return column.true_bits
+        return index.field(path).truthy_bits
+    return evaluate
+
+
+def _compare(path: str, op: str, literal) -> Node:
+    compare = COMPARISONS[op]
+
+    def evaluate(index):
+        if op in ('==', '!=') and isinstance(literal, bool):
+            column = _flag_column(index, path)
+            if column is not None:
+                bits = column.true_bits if literal else column.false_bits
+                return bits if op == '==' else index.all_bits & ~bits
+
+        values = index.field(path).values
+        if op == '==':
+            return values.get(value_key(literal), 0) if _hashable(literal) else 0
+        if op == '!=':
+            return index.all_bits & ~(values.get(value_key(literal), 0)
+                                      if _hashable(literal) else 0)
+
+        # Ordering: one comparison per distinct value, not per project.
+        # Booleans (keyed as tuples) and nulls have no order.
+        if literal is None or isinstance(literal, bool):
+            return 0
+        bits = 0
+        for value, value_bits in values.items():
+            if value is None or isinstance(value, tuple):
+                continue
+            try:
+                if compare(value, literal):
+                    bits |= value_bits
+            except TypeError:
+                continue
+        return bits
+    return evaluate
+
+
+def _contains(path: str, literal) -> Node:
+    def evaluate(index):
+        if not _hashable(literal):
+            return 0
+        return index.field(path).members.get(value_key(literal), 0)
+    return evaluate
+
+
+def _hashable(value) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class Query:
+    """A compiled --where expression."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self._node = _Parser(tokenize(text)).parse()
+
+    def mask(self, index: CatalogIndex) -> int:
+        """Bitset of matching rows (bit i = index.by_stars[i])."""
+        return self._node(index)
+
+    def filter(self, projects) -> list:
+        """Return matching projects in catalog order."""
+        index = CatalogIndex.of(projects)
+        return index.subset(self.mask(index))
+
+
+def compile_query(text: str) -> Query:
+    """Parse and compile an expression, raising QueryError if invalid."""
+    if not text or not text.strip():
+        raise QueryError("Empty expression")
+    return Query(text)
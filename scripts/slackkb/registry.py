@@ -0,0 +1,329 @@
+"""
+Registry of Slack API methods across several API surfaces.
+
+Tools use more than the Web API: SCIM, the Audit Logs API, and undocumented
+endpoints recorded under api-coverage.undocumented-methods.
+MethodRegistry merges every surface into one namespaced method index over a
+shared MethodTable, so coverage reports intern each method once per run.
+
+Method keys are "<surface>:<name>" (scim:GET /Users, undocumented:client.userBoot),
+except for the Web API, whose methods keep their bare names
+(chat.postMessage) so existing project files and reports are unchanged.
+Category keys follow the same rule (chat, scim:Users).
+
+Surfaces are produced by loaders registered per kind with @surface_loader.
+The extra surfaces are declared in archived-sources/surfaces.yaml:
+
+    surfaces:
+      scim:
+        title: SCIM API
+        kind: list
+        methods:
+          Users: [GET /Users, POST /Users]
+"""
+
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from slackkb.cache import YamlCache, load_yaml
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+WEB = 'web'
+UNDOCUMENTED = 'undocumented'
+
+SURFACES_CONFIG = Path('archived-sources') / 'surfaces.yaml'
+
+
+def method_category(method: str) -> str:
+    """API category of a method name ('chat.postMessage' -> 'chat')."""
+    if '.' in method:
+        return method.split('.')[0]
+    return 'other'
+
+
+def group_by_category(names: Iterable[str]) -> Dict[str, List[str]]:
+    """Sorted method names per category, categories in first-seen order."""
+    categories = {}
+    for name in names:
+        category = categories.setdefault(method_category(name), [])
+        if name not in category:
+            category.append(name)
+    for category in categories.values():
+        category.sort()
+    return categories
+
+
+# =============================================================================
+# TOOL METHODS
+# =============================================================================
+
+def get_tool_methods(project: dict) -> Tuple[Set[str], Set[str]]:
+    """
+    Get supported and partial methods for a tool.
+
+    Returns (supported_methods, partial_methods)
+    """
+    api_coverage = project.get('api-coverage', {})
+
+    supported = set(api_coverage.get('methods-supported', []))
+
+    partial = set()
+    for item in api_coverage.get('methods-partial', []):
+        if isinstance(item, dict):
+            partial.add(item.get('method', ''))
+        else:
+            partial.add(str(item))
+
+    return supported, partial
+
+
+def get_undocumented_methods(project: dict) -> List[str]:
+    """Method names listed under api-coverage.undocumented-methods."""
+    api_coverage = project.get('api-coverage', {}) or {}
+    names = []
+    for item in api_coverage.get('undocumented-methods', []) or []:
+        name = item.get('method') if isinstance(item, dict) else item
+        if name:
+            names.append(str(name))
+    return names
+
+
+def has_coverage_data(project: dict) -> bool:
+    """True if the project lists any supported or partial methods."""
+    api_coverage = project.get('api-coverage', {})
+    return bool(api_coverage.get('methods-supported', [])
+                or api_coverage.get('methods-partial', []))
+
+
+# =============================================================================
+# INTERNING
+# =============================================================================
+
+class MethodTable:
+    """Interns method names to dense integer ids, in first-seen order."""
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.ids = {}
+        self.names = []
+        for name in names:
+            self.intern(name)
+
+    def __len__(self):
+        return len(self.names)
+
+    def intern(self, name: str) -> int:
+        method_id = self.ids.get(name)
+        if method_id is None:
+            method_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return method_id
+
+    def mask(self, names: Iterable[str]) -> int:
+        """Bitset of the given names, interning any that are new."""
+        bits = 0
+        for name in names:
+            bits |= 1 << self.intern(name)
+        return bits
+
+    def decode(self, bits: int) -> List[str]:
+        """Names of the set bits, in id order."""
+        names = []
+        while bits:
+            low = bits & -bits
+            names.append(self.names[low.bit_length() - 1])
+            bits ^= low
+        return names
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+class Surface:
+    """The methods of one API surface, by category (names without namespace)."""
+
+    def __init__(self, name: str, title: str, categories: Dict[str, List[str]],
+                 source: str = None, problems: List[str] = ()):
+        self.name = name
+        self.title = title
+        self.categories = categories
+        self.source = source
+        self.problems = list(problems)
+
+    def __len__(self):
+        return sum(len(methods) for methods in self.categories.values())
+
+
+class MethodRegistry:
+    """Namespaced, interned methods of every registered surface."""
+
+    def __init__(self, surfaces: Iterable[Surface] = (), table: MethodTable = None):
+        self.table = table if table is not None else MethodTable()
+        self.surfaces = {}
+        self._all_methods = None
+        self._spec_keys = None
+        self._spec_categories = None
+        for surface in surfaces:
+            self.add(surface)
+
+    def add(self, surface: Surface):
+        if surface.name in self.surfaces:
+            raise ValueError(f"Surface '{surface.name}' is already registered")
+        self.surfaces[surface.name] = surface
+        self._all_methods = None
+        self._spec_keys = None
+        self._spec_categories = None
+        # Intern the surface's methods now, so spec methods get the low ids
+        for category, methods in surface.categories.items():
+            self.table.mask(self.key(surface.name, m) for m in methods)
+
+    @staticmethod
+    def key(surface: str, name: str) -> str:
+        """Namespaced key of a method (bare for the Web API)."""
+        return name if surface == WEB else f'{surface}:{name}'
+
+    def all_methods(self) -> Dict[str, List[str]]:
+        """Method keys per category key, across all surfaces."""
+        if self._all_methods is None:
+            result = {}
+            for surface in self.surfaces.values():
+                for category, methods in surface.categories.items():
+                    result[self.key(surface.name, category)] = [
+                        self.key(surface.name, m) for m in methods]
+            self._all_methods = result
+        return self._all_methods
+
+    def resolve(self, name: str) -> str:
+        """
+        Key for a method name as written in a project file.
+
+        "scim:GET /Users" names its surface explicitly; a bare name is a Web
+        API method.
+        """
+        prefix, sep, rest = name.partition(':')
+        if sep and prefix in self.surfaces:
+            return self.key(prefix, rest)
+        return name
+
+    def tool_methods(self, project: dict) -> Set[str]:
+        """Keys of every method a tool uses, on the registered surfaces."""
+        supported, partial = get_tool_methods(project)
+        keys = {self.resolve(m) if isinstance(m, str) else m for m in supported | partial}
+
+        if UNDOCUMENTED in self.surfaces:
+            for name in get_undocumented_methods(project):
+                key = self.resolve(name)
+                # Recorded as undocumented but actually in a spec: count it there
+                if key in self.spec_keys():
+                    keys.add(key)
+                else:
+                    keys.add(self.key(UNDOCUMENTED, name))
+        return keys
+
+    def spec_keys(self) -> Set[str]:
+        """Keys of every method on a documented surface."""
+        if self._spec_keys is None:
+            self._spec_keys = {
+                self.key(surface.name, m)
+                for surface in self.surfaces.values() if surface.name != UNDOCUMENTED
+                for methods in surface.categories.values() for m in methods}
+        return self._spec_keys
+
+    def spec_categories(self) -> Set[str]:
+        """Category keys of every documented surface."""
+        if self._spec_categories is None:
+            self._spec_categories = {
+                self.key(surface.name, category)
+                for surface in self.surfaces.values() if surface.name != UNDOCUMENTED
+                for category in surface.categories}
+        return self._spec_categories
+
+
+# =============================================================================
+# SURFACE LOADERS
+# =============================================================================
+
+# kind -> loader(name, config, repo_root, projects, registry) -> Surface
+SURFACE_LOADERS: Dict[str, Callable] = {}
+
+
+def surface_loader(kind: str):
+    """Register a loader for surfaces of the given kind."""
+    def register(func):
+        SURFACE_LOADERS[kind] = func
+        return func
+    return register
+
+
+@surface_loader('openapi')
+def load_openapi_surface(name, config, repo_root, projects, registry):
+    """A Web API style OpenAPI spec (one method per path), via its sidecar index."""
+    from slackkb.openapi import load_spec_index
+
+    spec_path = repo_root / config['spec']
+    index = load_spec_index(spec_path, use_index=config.get('use-index', True))
+    return Surface(name, config.get('title', index.title), index.categories(), str(spec_path),
+                   index.problems)
+
+
+@surface_loader('list')
+def load_list_surface(name, config, repo_root, projects, registry):
+    """Methods listed in the config, as a list or a {category: [methods]} mapping."""
+    methods = config.get('methods') or []
+    if isinstance(methods, dict):
+        categories = {str(cat): sorted(str(m) for m in names or [])
+                      for cat, names in methods.items()}
+    else:
+        categories = group_by_category(str(m) for m in methods)
+    return Surface(name, config.get('title', name), categories, config.get('source'))
+
+
+@surface_loader('undocumented')
+def load_undocumented_surface(name, config, repo_root, projects, registry):
+    """Every undocumented method recorded in project files that no spec lists."""
+    known = registry.spec_keys()
+    names = []
+    for project in projects:
+        for method in get_undocumented_methods(project):
+            if registry.resolve(method) not in known:
+                names.append(method)
+    return Surface(name, config.get('title', 'Undocumented methods'), group_by_category(names))
+
+
+def load_registry(repo_root: Path, spec_path: Path, projects: List[dict],
+                  surfaces: Optional[List[str]] = None, config_path: Path = None,
+                  cache: YamlCache = None, use_index: bool = True) -> MethodRegistry:
+    """
+    Build the registry: the Web API from spec_path, then the surfaces named
+    in surfaces (all configured ones if surfaces is ['all'], none if None).
+
+    The undocumented surface is loaded last, so it only holds methods that
+    no spec surface lists. Raises ValueError for unknown surfaces or kinds.
+    """
+    registry = MethodRegistry()
+    registry.add(load_openapi_surface(WEB, {'spec': spec_path, 'use-index': use_index},
+                                      repo_root, projects, registry))
+    if not surfaces:
+        return registry
+
+    config_path = config_path or repo_root / SURFACES_CONFIG
+    configured = (load_yaml(config_path, cache) or {}).get('surfaces') or {}
+
+    names = list(configured) if surfaces == ['all'] else surfaces
+    for name in names:
+        if name not in configured:
+            raise ValueError(f"Unknown surface '{name}' (configured: {', '.join(configured)})")
+    names.sort(key=lambda n: configured[n].get('kind') == 'undocumented')
+
+    for name in names:
+        config = configured[name] or {}
+        kind = config.get('kind')
+        loader = SURFACE_LOADERS.get(kind)
+        if loader is None:
+            raise ValueError(f"Surface '{name}' has unknown kind: {kind}")
+        registry.add(loader(name, config, repo_root, projects, registry))
+    return registry
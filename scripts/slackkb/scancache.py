@@ -0,0 +1,113 @@
+"""
+On-disk cache of source scan results, keyed by git blob SHA.
+
+A blob's SHA identifies its content, so the methods found in it never
+change: after `clone-all.py --update`, only blobs that are new in some
+clone have to be read and scanned, and a file shared by several clones
+(or unchanged across commits) is scanned once.
+
+Entries are only valid for the automaton that produced them. The cache
+carries a fingerprint of the scanner source and the method names, and is
+discarded when that differs. Like the parsed-YAML cache it is a
+PickleStore, capped at max_entries by evicting the entries used longest ago.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from slackkb.cache import CACHE_DIRNAME, PickleStore
+from slackkb.incremental import validator_fingerprint
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SCAN_CACHE_VERSION = 1
+SCAN_CACHE_FILENAME = 'source-scan.pickle'
+
+DEFAULT_MAX_ENTRIES = 1_000_000
+
+
+def default_scan_cache_file(repo_root: Path) -> Path:
+    """Return the standard scan cache location for a repository checkout."""
+    return repo_root / CACHE_DIRNAME / SCAN_CACHE_FILENAME
+
+
+def scanner_fingerprint(names: List[str]) -> str:
+    """Hash of what determines a blob's scan result: the scanner and the names."""
+    h = hashlib.sha256(validator_fingerprint([Path(__file__).with_name('scanner.py')])
+                       .encode('ascii'))
+    h.update('\n'.join(names).encode('utf-8'))
+    return h.hexdigest()
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+# (bytes scanned, ((method, line), ...)); bytes is 0 for skipped binaries
+ScanResult = Tuple[int, Tuple[Tuple[str, int], ...]]
+
+
+class ScanCache(PickleStore):
+    """
+    Persistent map of blob SHA -> [last run used, scan result].
+
+    Each run has a number, one more than the last saved run. A hit moves
+    the entry to the current run and marks the cache dirty, so eviction
+    drops the blobs that went unused for the most runs.
+    """
+
+    def __init__(self, cache_file: Optional[Path], fingerprint: str,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._run = 0
+        super().__init__(cache_file)
+        self._run += 1
+
+    def header(self) -> dict:
+        return {'version': SCAN_CACHE_VERSION, 'fingerprint': self.fingerprint}
+
+    def _load(self, payload: dict):
+        super()._load(payload)
+        self._run = payload.get('run', 0)
+
+    def _dump(self) -> dict:
+        return {'run': self._run, 'entries': self.entries}
+
+    def get(self, sha: str) -> Optional[ScanResult]:
+        """The stored result for a blob, or None."""
+        entry = self.entries.get(sha)
+        if entry is None:
+            return None
+        self.hits += 1
+        if entry[0] != self._run:
+            entry[0] = self._run
+            self._dirty = True
+        return entry[1]
+
+    def store(self, sha: str, result: ScanResult):
+        """Record a freshly scanned blob."""
+        self.misses += 1
+        if not self.enabled:
+            return
+        self.entries[sha] = [self._run, result]
+        self._dirty = True
+
+    def evict(self):
+        excess = len(self.entries) - self.max_entries
+        if excess <= 0:
+            return
+        for sha, _ in sorted(self.entries.items(), key=lambda kv: kv[1][0])[:excess]:
+            del self.entries[sha]
+
+
+def open_scan_cache(repo_root: Path, names: List[str], enabled: bool = True) -> ScanCache:
+    """Open the repository's scan cache (a pass-through cache if disabled)."""
+    return ScanCache(default_scan_cache_file(repo_root) if enabled else None,
+                     scanner_fingerprint(names))
@@ -0,0 +1,390 @@
+"""
+Find Slack API method names in the cloned repositories.
+
+Every spec method name, and its underscore alias (chat_postMessage, as
+slack_sdk spells its client methods), is compiled into one Aho-Corasick
+automaton, stored
+as a DFA (one 256-entry row per state, failure links folded in), so each
+byte costs one list lookup no matter how many names there are. Files are
+mmap'd and streamed through it once, one file per task in the worker pool.
+
+Stepping the automaton over every byte in Python is the slow part, and
+most of a source file cannot contain a match: a method name always starts
+with its category and a dot or underscore ("chat.", "chat_") that does not
+follow a word character. A C-level regex search for those anchors finds where a match can
+begin; whenever no anchor lies inside the text the automaton is tracking,
+the scan jumps straight to the next one. The matches are the same as a
+byte-by-byte scan.
+
+A match only counts at word boundaries, and not as the tail of another
+method name: "client.chat.postMessage(", "api.chat.postMessage(" and
+"client.chat_postMessage(" report chat.postMessage, but neither
+"admin.conversations.list" nor "conversations.listAll" reports
+conversations.list.
+"""
+
+import os
+import re
+import mmap
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from slackkb.git import CatFile, GitError, is_repository, ls_tree
+from slackkb.parallel import imap_ordered
+from slackkb.scancache import ScanCache, ScanResult
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Directories that hold dependencies or build output rather than the tool's
+# own code (a vendored SDK mentions every method)
+SKIP_DIRS = frozenset(['.git', '.hg', '.svn', 'node_modules', 'vendor', 'third_party',
+                       '.venv', 'venv', '__pycache__', '.tox', 'dist', 'target'])
+
+# Larger files are generated or minified; files with a NUL byte in their
+# first BINARY_SNIFF_BYTES are binary
+MAX_FILE_BYTES = 8 * 1024 * 1024
+BINARY_SNIFF_BYTES = 8192
+
+# New blobs are read from git in batches of about this size, to bound memory
+BLOB_BATCH_BYTES = 64 * 1024 * 1024
+
+SYMLINK_MODE = '120000'
+
+_WORD = frozenset(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
+_LETTERS = frozenset(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_DOT = ord('.')
+
+
+# =============================================================================
+# AUTOMATON
+# =============================================================================
+
+def method_alias(name: str) -> str:
+    """The underscore spelling of a method (chat.postMessage -> chat_postMessage)."""
+    return name.replace('.', '_')
+
+
+class Automaton:
+    """Aho-Corasick automaton over a fixed set of dotted method names and their aliases."""
+
+    def __init__(self, names: Iterable[str]):
+        # Pattern id -> the method it names; each method has up to two patterns
+        patterns = {}
+        for name in dict.fromkeys(names):
+            for spelling in (name, method_alias(name)):
+                patterns.setdefault(spelling.encode('utf-8'), name)
+        self.names = list(patterns.values())
+        self.patterns = patterns = list(patterns)
+        self.spellings = frozenset(patterns)
+        self.lengths = [len(p) for p in patterns]
+
+        # Trie
+        goto = [{}]
+        outputs = [()]
+        for pid, pattern in enumerate(patterns):
+            state = 0
+            for byte in pattern:
+                nxt = goto[state].get(byte)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][byte] = nxt
+                    goto.append({})
+                    outputs.append(())
+                state = nxt
+            outputs[state] += (pid,)
+
+        # Breadth-first: each state's row is its failure state's row with
+        # its own edges on top, and it also emits its failure state's output
+        depth = [0] * len(goto)
+        fail = [0] * len(goto)
+        delta = [None] * len(goto)
+        delta[0] = [0] * 256
+        for byte, nxt in goto[0].items():
+            delta[0][byte] = nxt
+        queue = deque()
+        for nxt in goto[0].values():
+            depth[nxt] = 1
+            queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            row = list(delta[fail[state]])
+            for byte, nxt in goto[state].items():
+                row[byte] = nxt
+                fail[nxt] = delta[fail[state]][byte]
+                outputs[nxt] += outputs[fail[nxt]]
+                depth[nxt] = depth[state] + 1
+                queue.append(nxt)
+            delta[state] = row
+
+        self.delta = delta
+        self.outputs = outputs
+        self.depth = depth
+
+        # "chat." for chat.postMessage, "chat_" for chat_postMessage
+        prefixes = {re.match(rb'[^._]*[._]', p).group() for p in patterns}
+        prefixes = sorted(prefixes, key=len, reverse=True)
+        self.anchors = re.compile(rb'(?<!\w)(?:' + b'|'.join(map(re.escape, prefixes)) + b')')
+
+    def _extends_method(self, data, dot: int, end: int) -> bool:
+        """True if the word ending at data[dot] ('.') and data[dot:end] spell a known method."""
+        start = dot
+        while start and data[start - 1] in _WORD:
+            start -= 1
+        return start < dot and bytes(data[start:end]) in self.spellings
+
+    def find(self, data) -> List[Tuple[int, int]]:
+        """(start offset, pattern id) of every match in data (bytes or mmap)."""
+        delta, outputs, depth, lengths = self.delta, self.outputs, self.depth, self.lengths
+        search = self.anchors.search
+        size = len(data)
+        hits = []
+        state = 0
+        pos = 0
+        anchor = -1
+        while pos < size:
+            # The automaton tracks the text from pos - depth[state]; if no
+            # anchor starts in there, nothing before the next anchor can match
+            if anchor < pos - depth[state]:
+                match = search(data, pos - depth[state])
+                if match is None:
+                    break
+                anchor = match.start()
+            if anchor >= pos:
+                pos = anchor
+                state = 0
+
+            state = delta[state][data[pos]]
+            pos += 1
+            for pid in outputs[state]:
+                start = pos - lengths[pid]
+                if start:
+                    before = data[start - 1]
+                    if before in _WORD:
+                        continue
+                    if before == _DOT and self._extends_method(data, start - 1, pos):
+                        continue
+                if pos < size:
+                    after = data[pos]
+                    if after in _WORD:
+                        continue
+                    if after == _DOT and pos + 1 < size and data[pos + 1] in _LETTERS:
+                        continue
+                hits.append((start, pid))
+        return _outermost(hits, lengths)
+
+
+def _outermost(hits: List[Tuple[int, int]], lengths: List[int]) -> List[Tuple[int, int]]:
+    """Drop matches inside a longer one ("conversations.list" in "admin.conversations.list")."""
+    if len(hits) < 2:
+        return hits
+    hits.sort(key=lambda hit: (hit[0], -lengths[hit[1]]))
+    result = []
+    reach = -1
+    for start, pid in hits:
+        end = start + lengths[pid]
+        if end > reach:
+            result.append((start, pid))
+            reach = end
+    return result
+
+
+# =============================================================================
+# FILES
+# =============================================================================
+
+def source_files(root: Path) -> List[Path]:
+    """Regular files under root in path order (as git sorts), skipping SKIP_DIRS."""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        for filename in filenames:
+            path = Path(dirpath) / filename
+            if not path.is_symlink():
+                files.append(path)
+    return sorted(files, key=lambda path: path.relative_to(root).as_posix())
+
+
+def tree_files(root: Path) -> List[Tuple[str, str]]:
+    """(path, blob SHA) of the files of a clone's HEAD, skipping SKIP_DIRS."""
+    files = []
+    for entry in ls_tree(root):
+        if entry.type != 'blob' or entry.mode == SYMLINK_MODE:
+            continue
+        if not entry.size or entry.size > MAX_FILE_BYTES:
+            continue
+        if not SKIP_DIRS.isdisjoint(entry.path.split('/')[:-1]):
+            continue
+        files.append((entry.path, entry.sha))
+    return files
+
+
+def line_numbers(data, offsets: List[int]) -> List[int]:
+    """1-based line number of each offset (offsets in ascending order)."""
+    lines = []
+    line = 1
+    previous = 0
+    for offset in offsets:
+        line += data[previous:offset].count(b'\n')
+        previous = offset
+        lines.append(line)
+    return lines
+
+
+def scan_bytes(automaton: Automaton, data) -> List[Tuple[str, int]]:
+    """(method name, line) of every match, in file order."""
+    hits = automaton.find(data)
+    lines = line_numbers(data, [start for start, _ in hits])
+    return [(automaton.names[pid], line) for (_, pid), line in zip(hits, lines)]
+
+
+_automaton: Optional[Automaton] = None
+
+
+def init_scanner(names: List[str]):
+    """Build the automaton scan_file() and scan_blob() use (once per worker process)."""
+    global _automaton
+    _automaton = Automaton(names)
+
+
+def scan_blob(data) -> ScanResult:
+    """(bytes scanned, matches) for one file's content; binaries are skipped."""
+    if not data or len(data) > MAX_FILE_BYTES or data.find(b'\0', 0, BINARY_SNIFF_BYTES) != -1:
+        return 0, ()
+    return len(data), tuple(scan_bytes(_automaton, data))
+
+
+def scan_file(path: str) -> ScanResult:
+    """scan_blob() of a file in the worktree, read through mmap."""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0 or size > MAX_FILE_BYTES:
+            return 0, ()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return scan_blob(data)
+
+
+def _scan_task(path: str):
+    try:
+        return scan_file(path)
+    except OSError:
+        return 0, ()
+
+
+# =============================================================================
+# CLONES
+# =============================================================================
+
+class CloneScan:
+    """Methods found in one clone, with file:line evidence."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.files = 0
+        self.bytes = 0
+        # method -> ['path/in/repo:line', ...] in file order
+        self.evidence: Dict[str, List[str]] = {}
+
+    def add(self, path: str, result: ScanResult):
+        size, matches = result
+        if not size:
+            return
+        self.files += 1
+        self.bytes += size
+        for method, line in matches:
+            self.evidence.setdefault(method, []).append(f'{path}:{line}')
+
+    @property
+    def methods(self) -> List[str]:
+        return sorted(self.evidence)
+
+
+def _read_blobs(pending: Dict[str, Path]) -> Iterator[Tuple[str, bytes]]:
+    """(sha, content) of each pending blob, one cat-file process per clone."""
+    by_root = {}
+    for sha, root in pending.items():
+        by_root.setdefault(root, []).append(sha)
+    for root, shas in by_root.items():
+        with CatFile(root) as objects:
+            for sha in shas:
+                data = objects.read(sha)
+                if data is not None:
+                    yield sha, data
+
+
+def _batches(blobs: Iterable[Tuple[str, bytes]], max_bytes: int) -> Iterator[list]:
+    batch = []
+    size = 0
+    for sha, data in blobs:
+        batch.append((sha, data))
+        size += len(data)
+        if size >= max_bytes:
+            yield batch
+            batch = []
+            size = 0
+    if batch:
+        yield batch
+
+
+def scan_clones(roots: List[Path], names: List[str], jobs: int = 1,
+                cache: ScanCache = None) -> List[CloneScan]:
+    """
+    Scan every file of every clone; returns one CloneScan per root, in order.
+
+    With a cache, a git clone's files are the blobs of its HEAD, listed by
+    git ls-tree: blobs the cache knows are not read at all, and the others
+    are streamed from git cat-file --batch and scanned on the worker pool.
+    Without one (or for a directory that is not a git repository) the
+    worktree files are mmap'd and scanned.
+    """
+    scans = [CloneScan(root) for root in roots]
+    init_scanner(names)
+
+    # (scan, path in repo, blob sha or None for a worktree file)
+    tasks = []
+    for scan in scans:
+        files = None
+        if cache is not None and is_repository(scan.root):
+            try:
+                files = tree_files(scan.root)
+            except GitError:
+                files = None  # e.g. no commit yet
+        if files is None:
+            tasks.extend((scan, path.relative_to(scan.root).as_posix(), None)
+                         for path in source_files(scan.root))
+        else:
+            tasks.extend((scan, path, sha) for path, sha in files)
+
+    # Blobs: cached results, and one scan per new SHA across all clones
+    results = {}
+    pending = {}
+    for scan, _, sha in tasks:
+        if sha is None or sha in results or sha in pending:
+            continue
+        result = cache.get(sha)
+        if result is None:
+            pending[sha] = scan.root
+        else:
+            results[sha] = result
+    for batch in _batches(_read_blobs(pending), BLOB_BATCH_BYTES):
+        scanned = imap_ordered(scan_blob, [data for _, data in batch], jobs,
+                               initializer=init_scanner, initargs=(names,))
+        for (sha, _), result in zip(batch, scanned):
+            results[sha] = result
+            cache.store(sha, result)
+
+    # Worktree files
+    worktree = [(scan, path) for scan, path, sha in tasks if sha is None]
+    scanned = imap_ordered(_scan_task, [str(scan.root / path) for scan, path in worktree], jobs,
+                           initializer=init_scanner, initargs=(names,))
+    files = dict(zip(((id(scan), path) for scan, path in worktree), scanned))
+
+    for scan, path, sha in tasks:
+        if sha is None:
+            scan.add(path, files[(id(scan), path)])
+        elif sha in results:
+            scan.add(path, results[sha])
+    return scans
@@ -0,0 +1,304 @@
+"""
+Validation plan compiled from spec.yaml.
+
+compile_spec() turns the field definitions in spec.yaml into a flat table of
+FieldRule objects: the expected Python type, frozenset enums, format
+checkers and nested property rules are all resolved once. Validating a
+document is then a single pass over its keys with one table lookup each.
+
+Top-level fields are always checked. A property nested inside a section is
+only checked where the spec gives it a severity, which keeps the plan to
+the checks check-yaml.py has always made.
+
+A ValidationPlan pickles as the spec it was compiled from, so it can be
+handed to worker processes and recompiled there.
+"""
+
+import re
+import json
+from pathlib import Path
+from datetime import datetime
+from typing import Optional
+
+from slackkb.cache import YamlCache, load_yaml
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+URL_PATTERN = re.compile(r'^https?://')
+COMMIT_PATTERN = re.compile(r'^[a-fA-F0-9]{7,40}$')
+
+# Only these types are enforced. Strings are not: unquoted dates load as
+# datetime.date, and installation entries use false for "not available".
+TYPE_CHECKS = {
+    'integer': (int, 'an integer'),
+    'boolean': (bool, 'a boolean'),
+    'array': (list, 'an array'),
+    'object': (dict, 'an object'),
+}
+
+SEVERITIES = ('error', 'warning')
+
+
+# =============================================================================
+# VALUE CHECKERS
+# =============================================================================
+
+def validate_date(value, field_name):
+    """Validate date format (YYYY-MM-DD)."""
+    if not DATE_PATTERN.match(str(value)):
+        return f"Invalid date format for '{field_name}': {value} (expected YYYY-MM-DD)"
+    try:
+        datetime.strptime(str(value), '%Y-%m-%d')
+    except ValueError:
+        return f"Invalid date value for '{field_name}': {value}"
+    return None
+
+
+def validate_url(value, field_name):
+    """Validate URL format."""
+    if not URL_PATTERN.match(str(value)):
+        return f"Invalid URL for '{field_name}': {value} (must start with http:// or https://)"
+    return None
+
+
+def validate_commit_hash(value, field_name):
+    """Validate git commit hash format."""
+    if not COMMIT_PATTERN.match(str(value)):
+        return f"Invalid commit hash for '{field_name}': {value}"
+    return None
+
+
+FORMAT_CHECKERS = {
+    'YYYY-MM-DD': validate_date,
+    'URL': validate_url,
+    'hex string (7-40 chars)': validate_commit_hash,
+}
+
+
+class EnumChecker:
+    """Membership test against a frozenset, reporting values in spec order."""
+
+    __slots__ = ('allowed', 'listing')
+
+    def __init__(self, values):
+        self.allowed = frozenset(values)
+        self.listing = ', '.join(str(v) for v in values)
+
+    def __call__(self, value, field_name):
+        try:
+            if value in self.allowed:
+                return None
+        except TypeError:
+            pass
+        return f"Invalid value for '{field_name}': {value} (valid: {self.listing})"
+
+
+# =============================================================================
+# PLAN
+# =============================================================================
+
+class FieldRule:
+    """Precompiled checks for one field (top-level or nested)."""
+
+    __slots__ = ('path', 'is_error', 'expected_type', 'type_message', 'value_checks',
+                 'children', 'item_required', 'item_is_error')
+
+    def __init__(self, path: str, is_error: bool):
+        self.path = path
+        self.is_error = is_error
+        self.expected_type = None
+        # Formatted with the value's type name
+        self.type_message = None
+        self.value_checks = ()
+        self.children = None
+        self.item_required = ()
+        self.item_is_error = False
+
+    def check(self, value, result):
+        if value is None:
+            return
+        report = result.errors if self.is_error else result.warnings
+
+        if self.expected_type is not None and not isinstance(value, self.expected_type):
+            report.append(self.type_message.format(type(value).__name__))
+            return
+
+        if value:
+            for checker in self.value_checks:
+                message = checker(value, self.path)
+                if message:
+                    report.append(message)
+
+        if self.children is not None and isinstance(value, dict):
+            children = self.children
+            for key, child_value in value.items():
+                child = children.get(key)
+                if child is not None:
+                    child.check(child_value, result)
+
+        if self.item_required and isinstance(value, list):
+            item_report = result.errors if self.item_is_error else result.warnings
+            for i, item in enumerate(value):
+                if isinstance(item, dict):
+                    for key in self.item_required:
+                        if key not in item:
+                            item_report.append(f"{self.path}[{i}] should have '{key}' field")
+
+    def describe(self) -> dict:
+        """JSON-friendly description of this rule."""
+        info = {}
+        if self.expected_type is not None or self.value_checks or self.item_required:
+            info['severity'] = 'error' if self.is_error else 'warning'
+        if self.expected_type is not None:
+            info['type'] = next(name for name, (t, _) in TYPE_CHECKS.items()
+                                if t is self.expected_type)
+        for checker in self.value_checks:
+            if isinstance(checker, EnumChecker):
+                info['enum'] = sorted(checker.allowed, key=str)
+            else:
+                info['format'] = next(fmt for fmt, fn in FORMAT_CHECKERS.items()
+                                      if fn is checker)
+        if self.children:
+            info['properties'] = {k: c.describe() for k, c in self.children.items()}
+        if self.item_required:
+            info['item-required'] = list(self.item_required)
+        return info
+
+
+class ValidationPlan:
+    """All field rules compiled from one spec.yaml."""
+
+    def __init__(self, spec: dict):
+        self.spec = spec
+        self.required = ()
+        self.rules = {}
+
+    def __reduce__(self):
+        return (compile_spec, (self.spec,))
+
+    def check(self, data: dict, result):
+        """
+        Run every spec-derived check on one document. Missing required
+        fields are reported first, then the rest in the document's key order.
+        """
+        for field in self.required:
+            if field not in data:
+                result.errors.append(f"Missing required field: '{field}'")
+
+        rules = self.rules
+        for key, value in data.items():
+            rule = rules.get(key)
+            if rule is not None:
+                rule.check(value, result)
+
+    def describe(self) -> dict:
+        """JSON-friendly description, for consumers other than check-yaml.py."""
+        return {
+            'schema-version': self.spec.get('schema-version'),
+            'required': list(self.required),
+            'fields': {k: r.describe() for k, r in self.rules.items()},
+        }
+
+
+# =============================================================================
+# COMPILER
+# =============================================================================
+
+def _resolve_ref(spec: dict, definition: dict) -> dict:
+    ref = definition.get('$ref')
+    if not ref:
+        return definition
+    if not ref.startswith('#/'):
+        raise ValueError(f"Unsupported $ref: {ref}")
+    node = spec
+    for part in ref[2:].split('/'):
+        node = node[part]
+    return node
+
+
+def _compile_field(spec: dict, path: str, definition: dict,
+                   nested: bool = False) -> Optional[FieldRule]:
+    """
+    The rule for one field, or None if nothing in it is checked. A nested
+    property without a severity gets no checks of its own, though its own
+    properties still may.
+    """
+    definition = _resolve_ref(spec, definition or {})
+
+    severity = definition.get('severity', None if nested else 'error')
+    if severity is not None and severity not in SEVERITIES:
+        raise ValueError(f"Invalid severity for '{path}': {severity}")
+    rule = FieldRule(path, severity == 'error')
+
+    if severity is not None:
+        type_name = definition.get('type')
+        if type_name in TYPE_CHECKS:
+            rule.expected_type, label = TYPE_CHECKS[type_name]
+            if nested:
+                rule.type_message = f"{path} must be {label}"
+            else:
+                rule.type_message = f"Field '{path}' must be {label}, got {{}}"
+
+        checks = []
+        fmt = definition.get('format')
+        if fmt in FORMAT_CHECKERS:
+            checks.append(FORMAT_CHECKERS[fmt])
+        if definition.get('enum'):
+            checks.append(EnumChecker(definition['enum']))
+        rule.value_checks = tuple(checks)
+
+        items = _resolve_ref(spec, definition.get('items') or {})
+        item_props = items.get('properties') or {}
+        rule.item_required = tuple(k for k, p in item_props.items() if (p or {}).get('required'))
+        rule.item_is_error = items.get('severity', 'warning') == 'error'
+
+    children = {}
+    for key, prop in (definition.get('properties') or {}).items():
+        child = _compile_field(spec, f'{path}.{key}', prop, nested=True)
+        if child is not None:
+            children[key] = child
+    rule.children = children or None
+
+    if (rule.expected_type is None and not rule.value_checks and not rule.children
+            and not rule.item_required):
+        return None
+    return rule
+
+
+def compile_spec(spec: dict) -> ValidationPlan:
+    """Compile the 'fields' section of a parsed spec.yaml."""
+    plan = ValidationPlan(spec)
+    fields = spec.get('fields') or {}
+
+    plan.required = tuple(name for name, d in fields.items() if (d or {}).get('required') is True)
+    rules = {name: _compile_field(spec, name, d) for name, d in fields.items()}
+    plan.rules = {name: rule for name, rule in rules.items() if rule is not None}
+    return plan
+
+
+_plans = {}
+
+
+def load_plan(spec_path: Path, cache: Optional[YamlCache] = None) -> ValidationPlan:
+    """
+    Return the compiled plan for spec_path.
+
+    The spec is parsed through the YAML cache and the compiled plan is kept
+    for the life of the process, so repeated calls cost one stat().
+    """
+    stat = spec_path.stat()
+    key = (str(spec_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    plan = _plans.get(key)
+    if plan is None:
+        plan = compile_spec(load_yaml(spec_path, cache))
+        _plans[key] = plan
+    return plan
+
+
+def dump_plan(plan: ValidationPlan) -> str:
+    """Serialize a plan description as JSON."""
+    return json.dumps(plan.describe(), indent=2)
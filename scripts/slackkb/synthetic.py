@@ -0,0 +1,132 @@
+"""
+Synthetic project catalogs for benchmarking.
+
+Synthetic projects are derived from the real files in projects/ (the seeds),
+so every section keeps a realistic size and shape and the files stay valid
+under spec.yaml. Each copy gets its own name, repo-url and star count,
+flips some of its capability flags, and draws its api-coverage lists from
+the OpenAPI spec's method names. Generation is seeded, so a given size and
+seed always produce the same catalog.
+
+A generated directory holds a marker file recording how it was made; it
+is reused as long as the marker matches.
+"""
+
+import re
+import copy
+import json
+import random
+from pathlib import Path
+from typing import List, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as Dumper
+except ImportError:
+    from yaml import SafeDumper as Dumper
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+GENERATOR_VERSION = 1
+MARKER_FILENAME = '.synthetic.json'
+
+# Mean number of methods-supported entries per project (exponential, capped)
+MEAN_METHODS = 20
+
+# Chance of flipping each capability flag of the seed
+FLIP_PROBABILITY = 0.3
+
+
+def load_seeds(projects_dir: Path) -> List[dict]:
+    """The real project documents synthetic projects are derived from."""
+    seeds = []
+    for filepath in sorted(projects_dir.glob('*.yaml')):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+        if isinstance(data, dict):
+            seeds.append(data)
+    if not seeds:
+        raise ValueError(f"No seed projects in {projects_dir}")
+    return seeds
+
+
+def _slug(text: str) -> str:
+    return re.sub(r'[^a-zA-Z0-9_-]+', '-', text).strip('-') or 'tool'
+
+
+def _flip_flags(section: dict, rng: random.Random):
+    for key, value in section.items():
+        if isinstance(value, bool) and rng.random() < FLIP_PROBABILITY:
+            section[key] = not value
+        elif isinstance(value, dict):
+            _flip_flags(value, rng)
+
+
+# =============================================================================
+# GENERATION
+# =============================================================================
+
+def synthesize(seed: dict, number: int, rng: random.Random,
+               methods: List[str]) -> Tuple[str, dict]:
+    """One synthetic project derived from seed, as (filename, document)."""
+    project = copy.deepcopy(seed)
+
+    owner = f'synthetic{number:06d}'
+    repo = _slug(str(seed.get('repo-url', seed.get('name', 'tool'))).rstrip('/').split('/')[-1])
+    project['name'] = f"{seed.get('name', 'tool')}-{number}"
+    project['repo-url'] = f"https://github.com/{owner}/{repo}"
+    project['stars'] = int(rng.paretovariate(1.1) * 10)
+    project['forks'] = project['stars'] // rng.randint(5, 20)
+
+    for value in project.values():
+        if isinstance(value, dict):
+            _flip_flags(value, rng)
+
+    coverage = project.setdefault('api-coverage', {})
+    count = min(len(methods), int(rng.expovariate(1 / MEAN_METHODS)))
+    chosen = rng.sample(methods, count)
+    partial = chosen[:count // 10]
+    coverage['methods-supported'] = sorted(chosen[count // 10:])
+    if partial:
+        coverage['methods-partial'] = [{'method': m, 'limitation': 'Synthetic limitation'}
+                                       for m in sorted(partial)]
+    else:
+        coverage.pop('methods-partial', None)
+
+    return f'{owner}--{repo}.yaml', project
+
+
+def write_catalog(directory: Path, size: int, seeds: List[dict], methods: List[str],
+                  seed: int = 0) -> List[Path]:
+    """Write size synthetic project files to directory (reused if already there)."""
+    marker = {'version': GENERATOR_VERSION, 'size': size, 'seed': seed,
+              'seeds': len(seeds), 'methods': len(methods)}
+    marker_path = directory / MARKER_FILENAME
+    try:
+        with open(marker_path, 'r', encoding='utf-8') as f:
+            if json.load(f) == marker:
+                return sorted(directory.glob('*.yaml'))
+    except (OSError, ValueError):
+        pass
+
+    directory.mkdir(parents=True, exist_ok=True)
+    for stale in directory.glob('*.yaml'):
+        stale.unlink()
+    marker_path.unlink(missing_ok=True)
+
+    rng = random.Random(seed)
+    paths = []
+    for number in range(size):
+        filename, project = synthesize(seeds[number % len(seeds)], number, rng, methods)
+        path = directory / filename
+        with open(path, 'w', encoding='utf-8') as f:
+            yaml.dump(project, f, Dumper=Dumper, sort_keys=False, allow_unicode=True)
+        paths.append(path)
+
+    with open(marker_path, 'w', encoding='utf-8') as f:
+        json.dump(marker, f)
+    return sorted(paths)
@@ -0,0 +1,527 @@
+"""
+Markdown renderers for the comparison tables.
+
+Each generate_* function takes the projects (a list, or a CatalogIndex built
+once and shared between renderers) and yields the lines of one table. They
+only read the projects: writing the lines out is up to the caller, e.g.
+output.write_lines() or output.render().
+"""
+
+from datetime import datetime
+from typing import Iterator, Optional
+
+from slackkb.index import CatalogIndex
+
+
+# =============================================================================
+# TABLE GENERATION FUNCTIONS
+# =============================================================================
+
+def generate_overview_table(projects) -> Iterator[str]:
+    """Generate main overview table sorted by stars."""
+    index = CatalogIndex.of(projects)
+    yield "## Overview\n"
+    yield "| Tool | Language | Stars | Category | Maintenance | Description |"
+    yield "|------|----------|-------|----------|-------------|-------------|"
+
+    for p, link in zip(index.by_stars, index.links):
+        language = p.get('language', 'N/A')
+        stars = p.get('stars', 'N/A')
+        if stars == 'N/A':
+            stars_str = 'N/A'
+        else:
+            stars_str = f"{stars:,}" if isinstance(stars, int) else str(stars)
+        category = p.get('category', 'N/A').replace('-', ' ').title()
+        maintenance = p.get('maintenance-tier', 'N/A').replace('-', ' ').title()
+        description = p.get('description', '')[:60]
+        if len(p.get('description', '')) > 60:
+            description += '...'
+
+        yield f"| {link} | {language} | {stars_str} | {category} | {maintenance} | {description} |"
+
+
+def generate_by_category(projects) -> Iterator[str]:
+    """Generate tables grouped by category."""
+    index = CatalogIndex.of(projects)
+    yield "## By Category\n"
+
+    for category, cat_projects in sorted(index.group('category').items()):
+        cat_title = category.replace('-', ' ').title()
+        yield f"### {cat_title}\n"
+        yield "| Tool | Stars | Maintenance | Description |"
+        yield "|------|-------|-------------|-------------|"
+
+        for p in cat_projects:
+            name = p.get('name', 'Unknown')
+            url = p.get('repo-url', '#')
+            stars = p.get('stars', 'N/A')
+            stars_str = f"{stars:,}" if isinstance(stars, int) else str(stars)
+            maintenance = p.get('maintenance-tier', 'N/A').replace('-', ' ').title()
+            description = p.get('description', '')[:80]
+
+            yield f"| [{name}]({url}) | {stars_str} | {maintenance} | {description} |"
+
+        yield ""
+
+
+def generate_by_language(projects) -> Iterator[str]:
+    """Generate tables grouped by programming language."""
+    index = CatalogIndex.of(projects)
+    yield "## By Programming Language\n"
+
+    for language, lang_projects in sorted(index.group('language').items()):
+        yield f"### {language}\n"
+        yield "| Tool | Stars | Category | Maintenance |"
+        yield "|------|-------|----------|-------------|"
+
+        for p in lang_projects:
+            name = p.get('name', 'Unknown')
+            url = p.get('repo-url', '#')
+            stars = p.get('stars', 'N/A')
+            stars_str = f"{stars:,}" if isinstance(stars, int) else str(stars)
+            category = p.get('category', 'N/A').replace('-', ' ').title()
+            maintenance = p.get('maintenance-tier', 'N/A').replace('-', ' ').title()
+
+            yield f"| [{name}]({url}) | {stars_str} | {category} | {maintenance} |"
+
+        yield ""
+
+
+def generate_by_maintenance(projects) -> Iterator[str]:
+    """Generate tables grouped by maintenance status."""
+    index = CatalogIndex.of(projects)
+    yield "## By Maintenance Status\n"
+
+    # Define order
+    tier_order = ['active-development', 'maintenance-mode', 'community-sustained', 'unmaintained', 'archived']
+
+    tiers = index.group('maintenance-tier')
+
+    for tier in tier_order:
+        if tier not in tiers:
+            continue
+        tier_projects = tiers[tier]
+        tier_title = tier.replace('-', ' ').title()
+
+        # Add emoji indicators
+        emoji = {
+            'active-development': '',
+            'maintenance-mode': '',
+            'community-sustained': '',
+            'unmaintained': '',
+            'archived': ''
+        }.get(tier, '')
+
+        yield f"### {emoji} {tier_title}\n"
+        yield "| Tool | Language | Stars | Last Activity |"
+        yield "|------|----------|-------|---------------|"
+
+        for p in tier_projects:
+            name = p.get('name', 'Unknown')
+            url = p.get('repo-url', '#')
+            language = p.get('language', 'N/A')
+            stars = p.get('stars', 'N/A')
+            stars_str = f"{stars:,}" if isinstance(stars, int) else str(stars)
+            last_commit = p.get('last-commit', 'N/A')
+
+            yield f"| [{name}]({url}) | {language} | {stars_str} | {last_commit} |"
+
+        yield ""
+
+
+def generate_feature_matrix(projects) -> Iterator[str]:
+    """Generate feature comparison matrix."""
+    index = CatalogIndex.of(projects)
+    yield "## Feature Matrix\n"
+
+    features = ['send-messages', 'receive-messages', 'file-upload', 'thread-support',
+                'channel-browse', 'multi-workspace', 'search', 'app-development']
+
+    # Header
+    header = "| Tool |"
+    for f in features:
+        header += f" {f.replace('-', ' ').title()} |"
+    yield header
+
+    separator = "|------|" + "------|" * len(features)
+    yield separator
+
+    cells = index.columns.matrix_cells('slack-features', features, " |", " |", " - |")
+    for link, row_cells in zip(index.links, cells):
+        yield f"| {link} |" + ''.join(row_cells)
+
+
+def generate_auth_matrix(projects) -> Iterator[str]:
+    """Generate authentication comparison matrix."""
+    index = CatalogIndex.of(projects)
+    yield "## Authentication Methods\n"
+
+    auth_methods = ['oauth2', 'legacy-token', 'browser-token', 'api-key', 'env-var-auth']
+
+    # Header
+    header = "| Tool |"
+    for a in auth_methods:
+        header += f" {a.replace('-', ' ').title()} |"
+    yield header
+
+    separator = "|------|" + "------|" * len(auth_methods)
+    yield separator
+
+    cells = index.columns.matrix_cells('authentication', auth_methods, " |", " |", " - |")
+    for link, row_cells in zip(index.links, cells):
+        yield f"| {link} |" + ''.join(row_cells)
+
+    yield "\n**Legend:**  = Supported,  = Not Supported, - = Unknown\n"
+
+    # Add authentication notes
+    yield "### Authentication Notes\n"
+    for p, auth in zip(index.by_stars, index.section('authentication')):
+        notes = auth.get('auth-notes', [])
+        if notes:
+            name = p.get('name', 'Unknown')
+            yield f"**{name}:**"
+            for note in notes:
+                yield f"- {note}"
+            yield ""
+
+
+def generate_ai_friendly_table(projects) -> Iterator[str]:
+    """Generate AI/automation friendliness comparison."""
+    index = CatalogIndex.of(projects)
+    yield "## AI/Automation Friendliness\n"
+
+    ai_features = ['designed-for-ai', 'structured-output', 'scriptable', 'stateless', 'ci-cd-friendly']
+
+    # Header
+    header = "| Tool |"
+    for f in ai_features:
+        header += f" {f.replace('-', ' ').title()} |"
+    yield header
+
+    separator = "|------|" + "------|" * len(ai_features)
+    yield separator
+
+    cells = index.columns.matrix_cells('ai-friendly', ai_features, " |", " |", " - |")
+    for link, row_cells in zip(index.links, cells):
+        yield f"| {link} |" + ''.join(row_cells)
+
+    yield "\n**Best for AI/Automation:** Tools with  in 'Designed For Ai' or 'Structured Output'\n"
+
+
+def generate_output_formats_table(projects) -> Iterator[str]:
+    """Generate output formats comparison."""
+    index = CatalogIndex.of(projects)
+    yield "## Output Formats\n"
+
+    formats = ['json', 'jsonl', 'yaml', 'table', 'plain-text', 'pipe-friendly']
+
+    # Header
+    header = "| Tool |"
+    for f in formats:
+        header += f" {f.upper() if f in ['json', 'jsonl', 'yaml'] else f.replace('-', ' ').title()} |"
+    yield header
+
+    separator = "|------|" + "------|" * len(formats)
+    yield separator
+
+    cells = index.columns.matrix_cells('output-formats', formats, " |", " |", " - |")
+    for link, row_cells in zip(index.links, cells):
+        yield f"| {link} |" + ''.join(row_cells)
+
+
+def generate_installation_table(projects) -> Iterator[str]:
+    """Generate installation methods comparison."""
+    index = CatalogIndex.of(projects)
+    yield "## Installation Methods\n"
+
+    methods = ['homebrew', 'pip', 'npm', 'snap', 'go-install', 'binary', 'aur', 'source-compile']
+
+    # Header
+    header = "| Tool |"
+    for m in methods:
+        header += f" {m.replace('-', ' ').title()} |"
+    yield header
+
+    separator = "|------|" + "------|" * len(methods)
+    yield separator
+
+    cells = index.columns.matrix_cells('installation', methods, " |", " |", " - |")
+    for link, row_cells in zip(index.links, cells):
+        yield f"| {link} |" + ''.join(row_cells)
+
+
+def generate_read_capabilities_table(projects) -> Iterator[str]:
+    """Generate read capabilities comparison matrix."""
+    index = CatalogIndex.of(projects)
+    yield "## Read Capabilities\n"
+
+    capabilities = ['read-messages', 'read-channels', 'read-dms', 'read-group-dms',
+                   'read-threads', 'message-search', 'user-info', 'export-history']
+
+    # Header
+    header = "| Tool |"
+    for c in capabilities:
+        header += f" {c.replace('-', ' ').title()} |"
+    yield header
+
+    separator = "|------|" + "------|" * len(capabilities)
+    yield separator
+
+    cells = index.columns.matrix_cells('read-capabilities', capabilities, " ✓ |", " ✗ |", " - |")
+    for link, row_cells in zip(index.links, cells):
+        yield f"| {link} |" + ''.join(row_cells)
+
+
+def generate_query_options_table(projects) -> Iterator[str]:
+    """Generate query options comparison matrix."""
+    index = CatalogIndex.of(projects)
+    yield "## Query Options\n"
+
+    options = ['date-range-filter', 'limit-results', 'pagination', 'channel-filter',
+              'user-filter', 'keyword-search', 'thread-filter']
+
+    # Header
+    header = "| Tool |"
+    for o in options:
+        header += f" {o.replace('-', ' ').title()} |"
+    yield header
+
+    separator = "|------|" + "------|" * len(options)
+    yield separator
+
+    cells = index.columns.matrix_cells('query-options', options, " ✓ |", " ✗ |", " - |")
+    for link, row_cells in zip(index.links, cells):
+        yield f"| {link} |" + ''.join(row_cells)
+
+
+def generate_communication_features_table(projects) -> Iterator[str]:
+    """Generate communication features comparison matrix."""
+    index = CatalogIndex.of(projects)
+    yield "## Communication Features\n"
+
+    features = ['reply-to-thread', 'reply-with-broadcast', 'start-new-thread',
+               'send-to-dm', 'send-to-channel', 'send-to-group-dm', 'message-formatting']
+
+    # Header
+    header = "| Tool |"
+    for f in features:
+        header += f" {f.replace('-', ' ').title()} |"
+    yield header
+
+    separator = "|------|" + "------|" * len(features)
+    yield separator
+
+    cells = index.columns.matrix_cells('communication-features', features, " ✓ |", " ✗ |", " - |")
+    for link, row_cells in zip(index.links, cells):
+        yield f"| {link} |" + ''.join(row_cells)
+
+
+def generate_attachment_handling_table(projects) -> Iterator[str]:
+    """Generate attachment handling comparison matrix."""
+    index = CatalogIndex.of(projects)
+    yield "## Attachment Handling\n"
+
+    features = ['upload-files', 'download-files', 'upload-from-stdin',
+               'upload-images', 'upload-audio', 'upload-video']
+
+    # Header
+    header = "| Tool |"
+    for f in features:
+        header += f" {f.replace('-', ' ').title()} |"
+    yield header
+
+    separator = "|------|" + "------|" * len(features)
+    yield separator
+
+    cells = index.columns.matrix_cells('attachment-handling', features, " ✓ |", " ✗ |", " - |")
+    for link, row_cells in zip(index.links, cells):
+        yield f"| {link} |" + ''.join(row_cells)
+
+
+def generate_export_capabilities_table(projects) -> Iterator[str]:
+    """Generate export capabilities comparison matrix."""
+    index = CatalogIndex.of(projects)
+    yield "## Export Capabilities\n"
+
+    features = ['full-workspace-export', 'channel-export', 'dm-export',
+               'thread-export', 'include-attachments']
+
+    # Header
+    header = "| Tool |"
+    for f in features:
+        header += f" {f.replace('-', ' ').title()} |"
+    yield header
+
+    separator = "|------|" + "------|" * len(features)
+    yield separator
+
+    cells = index.columns.matrix_cells('export-capabilities', features, " ✓ |", " ✗ |", " - |")
+    for link, row_cells in zip(index.links, cells):
+        yield f"| {link} |" + ''.join(row_cells)
+
+
+def generate_mcp_integration_table(projects) -> Iterator[str]:
+    """Generate MCP integration comparison matrix."""
+    index = CatalogIndex.of(projects)
+    yield "## MCP Integration\n"
+
+    features = ['is-mcp-server', 'stealth-mode', 'rate-limit-handling',
+               'supports-enterprise']
+
+    # Header
+    header = "| Tool |"
+    for f in features:
+        header += f" {f.replace('-', ' ').title()} |"
+    yield header
+
+    separator = "|------|" + "------|" * len(features)
+    yield separator
+
+    cells = index.columns.matrix_cells('mcp-integration', features, " ✓ |", " ✗ |", " - |")
+    for link, row_cells in zip(index.links, cells):
+        yield f"| {link} |" + ''.join(row_cells)
+
+    # Add MCP tools/resources info
+    yield "\n### MCP Tools and Resources\n"
+    for p, mcp in zip(index.by_stars, index.section('mcp-integration')):
+        if mcp.get('is-mcp-server'):
+            name = p.get('name', 'Unknown')
+            yield f"**{name}:**"
+
+            tools = mcp.get('mcp-tools', [])
+            if tools:
+                yield "- Tools:"
+                for tool in tools:
+                    yield f"  - {tool}"
+
+            resources = mcp.get('mcp-resources', [])
+            if resources:
+                yield "- Resources:"
+                for resource in resources:
+                    yield f"  - {resource}"
+
+            notes = mcp.get('notes', [])
+            if notes:
+                yield "- Notes:"
+                for note in notes:
+                    yield f"  - {note}"
+
+            yield ""
+
+
+def generate_statistics(projects) -> Iterator[str]:
+    """Generate summary statistics."""
+    index = CatalogIndex.of(projects)
+    yield "## Statistics\n"
+
+    yield f"- **Total tools tracked:** {len(index)}"
+    yield f"- **Combined GitHub stars:** {index.total_stars:,}"
+    yield ""
+
+    # By category
+    yield "### By Category\n"
+    categories = index.counts('category')
+    for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
+        yield f"- {cat.replace('-', ' ').title()}: {count}"
+    yield ""
+
+    # By language
+    yield "### By Language\n"
+    languages = index.counts('language')
+    for lang, count in sorted(languages.items(), key=lambda x: x[1], reverse=True):
+        yield f"- {lang}: {count}"
+    yield ""
+
+    # By maintenance
+    yield "### By Maintenance Status\n"
+    tiers = index.counts('maintenance-tier')
+    for tier, count in sorted(tiers.items(), key=lambda x: x[1], reverse=True):
+        yield f"- {tier.replace('-', ' ').title()}: {count}"
+
+
+TIMESTAMP_MODES = ('now', 'inputs', 'none')
+
+
+def report_timestamp(projects, mode: str = 'now') -> Optional[str]:
+    """
+    The *Generated:* stamp of the full report.
+
+    'now' is the wall clock; 'inputs' is the newest last-update of the
+    projects, so the report only changes when its inputs do; 'none' (or
+    'inputs' without any last-update) omits the line.
+    """
+    if mode == 'now':
+        return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    if mode == 'inputs':
+        dates = [str(p['last-update']) for p in CatalogIndex.of(projects).projects
+                 if p.get('last-update')]
+        return max(dates) if dates else None
+    return None
+
+
+def generate_report_header(projects, timestamp: str = 'now') -> Iterator[str]:
+    """Generate the title block of the full report."""
+    yield "# Slack CLI Tools Comparison"
+    generated = report_timestamp(projects, timestamp)
+    if generated is not None:
+        yield ""
+        yield f"*Generated: {generated}*"
+
+
+# Sections of the full report, in order
+REPORT_SECTIONS = [
+    generate_report_header,
+    generate_statistics,
+    generate_overview_table,
+    generate_by_category,
+    generate_by_maintenance,
+    generate_feature_matrix,
+    generate_read_capabilities_table,
+    generate_query_options_table,
+    generate_communication_features_table,
+    generate_attachment_handling_table,
+    generate_export_capabilities_table,
+    generate_mcp_integration_table,
+    generate_auth_matrix,
+    generate_ai_friendly_table,
+    generate_output_formats_table,
+    generate_installation_table,
+]
+
+# Top-level project fields each renderer reads (None: re-render on any change).
+# Tables list tools as links in star order, so they all read LINK_FIELDS.
+LINK_FIELDS = ('name', 'repo-url', 'stars')
+
+SECTION_FIELDS = {
+    generate_report_header: None,
+    generate_statistics: ('stars', 'category', 'language', 'maintenance-tier'),
+    generate_overview_table: LINK_FIELDS + ('language', 'category', 'maintenance-tier',
+                                            'description'),
+    generate_by_category: LINK_FIELDS + ('category', 'maintenance-tier', 'description'),
+    generate_by_language: LINK_FIELDS + ('language', 'category', 'maintenance-tier'),
+    generate_by_maintenance: LINK_FIELDS + ('maintenance-tier', 'language', 'last-commit'),
+    generate_feature_matrix: LINK_FIELDS + ('slack-features',),
+    generate_read_capabilities_table: LINK_FIELDS + ('read-capabilities',),
+    generate_query_options_table: LINK_FIELDS + ('query-options',),
+    generate_communication_features_table: LINK_FIELDS + ('communication-features',),
+    generate_attachment_handling_table: LINK_FIELDS + ('attachment-handling',),
+    generate_export_capabilities_table: LINK_FIELDS + ('export-capabilities',),
+    generate_mcp_integration_table: LINK_FIELDS + ('mcp-integration',),
+    generate_auth_matrix: LINK_FIELDS + ('authentication',),
+    generate_ai_friendly_table: LINK_FIELDS + ('ai-friendly',),
+    generate_output_formats_table: LINK_FIELDS + ('output-formats',),
+    generate_installation_table: LINK_FIELDS + ('installation',),
+}
+
+
+def generate_full_report(projects, timestamp: str = 'now') -> Iterator[str]:
+    """Generate complete comparison report."""
+    # Sort and group once; every section below reuses the same index
+    projects = CatalogIndex.of(projects)
+    for i, section in enumerate(REPORT_SECTIONS):
+        if i:
+            yield ""
+        if section is generate_report_header:
+            yield from section(projects, timestamp)
+        else:
+            yield from section(projects)
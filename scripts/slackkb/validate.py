@@ -0,0 +1,228 @@
+"""
+Project file validation against the rules compiled from spec.yaml.
+
+validate_document() checks one parsed document and validate_paths() a batch
+of files across a process pool. Nothing here prints or exits: callers get
+ValidationResult objects and decide how to report them.
+"""
+
+import re
+from pathlib import Path
+
+import yaml
+
+from slackkb.cache import YamlCache, load_yaml
+from slackkb.parallel import map_ordered, read_and_parse
+from slackkb.schema import ValidationPlan, load_plan
+from slackkb.incremental import Manifest
+from slackkb.profile import CACHED, PARSED, active
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Field rules (required fields, types, enums, formats, severities) are not
+# listed here: they are compiled from spec.yaml by slackkb/schema.py.
+SPEC_PATH = Path(__file__).resolve().parent.parent.parent / 'spec.yaml'
+
+FILENAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+--[a-zA-Z0-9_-]+\.yaml$')
+
+_plan = None
+
+
+def get_plan() -> ValidationPlan:
+    """Return the validation plan, compiling spec.yaml on first use."""
+    global _plan
+    if _plan is None:
+        _plan = load_plan(SPEC_PATH)
+    return _plan
+
+
+def set_plan(plan: ValidationPlan):
+    """Install a precompiled plan (also used as the worker initializer)."""
+    global _plan
+    _plan = plan
+
+
+# =============================================================================
+# VALIDATION FUNCTIONS
+# =============================================================================
+
+class ValidationResult:
+    def __init__(self, filename):
+        self.filename = filename
+        self.errors = []
+        self.warnings = []
+
+    def add_error(self, message):
+        self.errors.append(message)
+
+    def add_warning(self, message):
+        self.warnings.append(message)
+
+    @property
+    def is_valid(self):
+        return len(self.errors) == 0
+
+    @property
+    def warning_count(self):
+        return len(self.warnings)
+
+    def to_outcome(self) -> dict:
+        """Serialize for the incremental validation manifest."""
+        return {
+            'errors': self.errors,
+            'warnings': self.warnings,
+        }
+
+    @classmethod
+    def from_outcome(cls, filename, outcome: dict) -> 'ValidationResult':
+        result = cls(filename)
+        result.errors = list(outcome.get('errors', []))
+        result.warnings = list(outcome.get('warnings', []))
+        return result
+
+    def print_results(self, verbose=False):
+        if not self.errors and not self.warnings:
+            if verbose:
+                print(f"  {self.filename}")
+            return
+
+        print(f"\n{self.filename}:")
+        for error in self.errors:
+            print(f"  {error}")
+        for warning in self.warnings:
+            print(f"  {warning}")
+
+
+def validate_file(filepath: Path, verbose: bool = False,
+                  cache: YamlCache = None) -> ValidationResult:
+    """Validate a single YAML file."""
+    try:
+        data = load_yaml(filepath, cache)
+    except Exception as e:
+        return validate_document(filepath, None, e)
+    return validate_document(filepath, data)
+
+
+def validate_document(filepath: Path, data, load_error: Exception = None) -> ValidationResult:
+    """Validate an already-parsed document, or report why it failed to load."""
+    result = ValidationResult(filepath.name)
+
+    if isinstance(load_error, yaml.YAMLError):
+        result.add_error(f"YAML parsing error: {load_error}")
+        return result
+    elif load_error is not None:
+        result.add_error(f"File read error: {load_error}")
+        return result
+
+    if data is None:
+        result.add_error("Empty YAML file")
+        return result
+
+    if not isinstance(data, dict):
+        result.add_error(f"Top-level YAML must be a mapping, got {type(data).__name__}")
+        return result
+
+    # Required fields, types, enums, formats and nested sections
+    get_plan().check(data, result)
+
+    # Filename convention check
+    if not FILENAME_PATTERN.match(filepath.name):
+        result.add_warning(f"Filename should follow pattern: {{owner}}--{{repo}}.yaml")
+
+    # Cross-field consistency checks
+    if data.get('archived') and data.get('maintenance-tier') != 'archived':
+        result.add_warning("If 'archived' is true, 'maintenance-tier' should be 'archived'")
+
+    if data.get('reputable-source') and not data.get('organization'):
+        result.add_warning("If 'reputable-source' is true, 'organization' should be specified")
+
+    return result
+
+
+def _validate_task(task):
+    """Worker: parse (unless the parent had a cached copy) and validate one file."""
+    filepath, cached, data = task
+    record = None
+    if not cached:
+        try:
+            record = read_and_parse(filepath)
+        except Exception as e:
+            return validate_document(filepath, None, e), None
+        data = record[2]
+    return validate_document(filepath, data), record
+
+
+def validate_paths(paths: list, cache: YamlCache = None, jobs: int = 1) -> list:
+    """Validate files across a process pool, returning results in input order."""
+    tasks = []
+    for filepath in paths:
+        cached, data = False, None
+        if cache is not None:
+            try:
+                cached, data = cache.lookup(filepath)
+            except OSError:
+                pass
+        tasks.append((filepath, cached, data))
+
+    results = []
+    profiler = active()
+    timings = None if profiler is None else []
+    validated = map_ordered(_validate_task, tasks, jobs,
+                            initializer=set_plan, initargs=(get_plan(),), timings=timings)
+    if profiler is not None:
+        # A cached file's time is validation only; keep it apart from parses
+        for kind, cached in ((PARSED, False), (CACHED, True)):
+            chosen = [i for i, task in enumerate(tasks) if bool(task[1]) == cached]
+            profiler.record_files([paths[i] for i in chosen], [timings[i] for i in chosen], kind)
+    for filepath, (result, record) in zip(paths, validated):
+        if record is not None and cache is not None:
+            cache.store(filepath, *record)
+        results.append(result)
+
+    return results
+
+
+def validate_all(projects_dir: Path, verbose: bool = False,
+                 cache: YamlCache = None, jobs: int = 1) -> list:
+    """Validate all YAML files in the projects directory."""
+    yaml_files = sorted(projects_dir.glob('*.yaml'))
+    return validate_paths(yaml_files, cache, jobs)
+
+
+def validate_incremental(paths: list, manifest: Manifest, cache: YamlCache = None,
+                         jobs: int = 1, changed: set = None,
+                         directory: Path = None) -> tuple:
+    """
+    Revalidate only files that changed, reusing manifest outcomes for the rest.
+
+    A file counts as changed if its content hash differs from the manifest,
+    or, when changed is given (paths from `git diff`), if it is listed there.
+    If directory is given, entries for files that were deleted from it are
+    dropped.
+
+    Returns (results, revalidated_count).
+    """
+    results = {}
+    stale = []
+    for filepath in paths:
+        current = manifest.is_current(filepath)
+        if current and changed is not None:
+            current = filepath.resolve() not in changed
+        if current:
+            results[filepath] = ValidationResult.from_outcome(filepath.name,
+                                                              manifest.get(filepath))
+        else:
+            stale.append(filepath)
+
+    if directory is not None:
+        for key, _ in manifest.removed(paths, directory):
+            manifest.forget(Path(key))
+
+    for filepath, result in zip(stale, validate_paths(stale, cache, jobs)):
+        results[filepath] = result
+        manifest.record(filepath, result.to_outcome())
+
+    return [results[filepath] for filepath in paths], len(stale)
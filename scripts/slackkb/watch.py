@@ -0,0 +1,418 @@
+"""
+Long-running --watch mode shared by the scripts.
+
+While project files are being edited, a watch session keeps the parsed
+catalog in memory and reacts to each save:
+
+    Watcher          blocks until files matching the watched patterns change,
+                     through inotify on Linux or by polling stat() elsewhere
+    WatchedCatalog   re-parses only the touched files, rebuilds only their
+                     Project models and reports which top-level fields
+                     actually changed
+    Sections         re-renders only the output sections that read those fields
+
+Sections declare the fields they read; a change to 'description' therefore
+re-renders the overview table but leaves the feature matrices alone. The
+scripts patch the changed projects into their CatalogIndex or CoverageMatrix
+in place (see update_index()) rather than indexing the catalog anew.
+
+The parse cache is saved at most every SAVE_INTERVAL seconds while
+watching, and once more on exit.
+"""
+
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import fnmatch
+import traceback
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from slackkb.cache import YamlCache, load_yaml
+from slackkb.catalog import to_project
+from slackkb.model import Project
+from slackkb.parallel import load_documents
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Seconds between stat() passes when inotify is unavailable
+POLL_INTERVAL = 0.5
+
+# Quiet period that ends a burst of events (editors often write in steps)
+DEBOUNCE = 0.05
+
+# Minimum seconds between two saves of the parse cache while watching
+SAVE_INTERVAL = 30.0
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE
+
+EVENT_HEADER = struct.Struct('iIII')
+
+# A watch target: files in directory whose name matches pattern
+Target = Tuple[Path, str]
+
+
+def add_watch_arguments(parser):
+    """Add the shared --watch and --poll options to an argparse parser."""
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and redo the work whenever an input file changes'
+    )
+    parser.add_argument(
+        '--poll',
+        action='store_true',
+        help='With --watch, poll for changes instead of using inotify'
+    )
+
+
+def file_target(path: Path) -> Target:
+    """Watch target for a single file."""
+    return path.parent, path.name
+
+
+# =============================================================================
+# WATCHERS
+# =============================================================================
+
+class PollingWatcher:
+    """Detects changes by comparing stat() snapshots of the watched files."""
+
+    kind = 'polling'
+
+    def __init__(self, targets: Iterable[Target], interval: float = POLL_INTERVAL):
+        self.targets = list(targets)
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, tuple]:
+        snapshot = {}
+        for directory, pattern in self.targets:
+            for path in directory.glob(pattern):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        return snapshot
+
+    def wait(self) -> Set[Path]:
+        """Block until something changed; return the changed paths."""
+        while True:
+            time.sleep(self.interval)
+            snapshot = self._scan()
+            changed = {path for path in snapshot.keys() | self.snapshot.keys()
+                       if snapshot.get(path) != self.snapshot.get(path)}
+            self.snapshot = snapshot
+            if changed:
+                return changed
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Detects changes through inotify(7), watching each directory once."""
+
+    kind = 'inotify'
+
+    def __init__(self, targets: Iterable[Target]):
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        if not hasattr(self._libc, 'inotify_init1'):
+            raise OSError(errno.ENOSYS, 'inotify is not available')
+
+        self.patterns = {}
+        for directory, pattern in targets:
+            self.patterns.setdefault(directory.resolve(), []).append(pattern)
+
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+
+        self.directories = {}
+        try:
+            for directory in self.patterns:
+                wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+                if wd < 0:
+                    raise OSError(ctypes.get_errno(), f'Cannot watch {directory}')
+                self.directories[wd] = directory
+        except OSError:
+            self.close()
+            raise
+
+    def _matches(self, path: Path) -> bool:
+        return any(fnmatch.fnmatch(path.name, pattern) for pattern in self.patterns[path.parent])
+
+    def _read(self, changed: Set[Path]):
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped: report every watched file
+                for directory, patterns in self.patterns.items():
+                    for pattern in patterns:
+                        changed.update(directory.glob(pattern))
+                continue
+            directory = self.directories.get(wd)
+            if directory is None or mask & IN_IGNORED or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if self._matches(path):
+                changed.add(path)
+
+    def wait(self) -> Set[Path]:
+        """Block until something changed; return the changed paths."""
+        changed = set()
+        while not changed:
+            select.select([self.fd], [], [])
+            self._read(changed)
+            # Collect the rest of the burst
+            while select.select([self.fd], [], [], DEBOUNCE)[0]:
+                self._read(changed)
+        return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def open_watcher(targets: Iterable[Target], poll: bool = False):
+    """Return an inotify watcher, or a polling one if inotify is unavailable."""
+    targets = list(targets)
+    if not poll and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(targets)
+        except OSError as e:
+            print(f"Warning: inotify unavailable ({e}), polling for changes", file=sys.stderr)
+    return PollingWatcher(targets)
+
+
+def watch(watcher, rebuild: Callable[[Set[Path]], None],
+          cache: Optional[YamlCache] = None) -> int:
+    """
+    Call rebuild(changed_paths) after every change until interrupted.
+
+    Open the watcher before loading anything, so that edits made during the
+    initial load are not missed. An exception in rebuild is reported and the
+    session keeps running, so a half-edited file cannot end it. The cache is
+    saved at most every SAVE_INTERVAL seconds, and on exit.
+    """
+    print(f"Watching for changes ({watcher.kind}), press Ctrl-C to stop", file=sys.stderr)
+    saved = time.monotonic()
+    try:
+        while True:
+            changed = watcher.wait()
+            try:
+                rebuild(changed)
+            except Exception:
+                traceback.print_exc()
+            if cache is not None and time.monotonic() - saved >= SAVE_INTERVAL:
+                cache.save()
+                saved = time.monotonic()
+    except KeyboardInterrupt:
+        print("", file=sys.stderr)
+    finally:
+        watcher.close()
+        if cache is not None:
+            cache.save()
+    return 0
+
+
+# =============================================================================
+# CATALOG
+# =============================================================================
+
+def changed_fields(old, new) -> Optional[Set[str]]:
+    """
+    Top-level keys whose values differ between two parsed documents.
+
+    Underscore keys (annotations added by the scripts) are ignored. Returns
+    None when the documents cannot be compared field by field.
+    """
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return None if old != new else set()
+    return {key for key in old.keys() | new.keys()
+            if not key.startswith('_') and old.get(key) != new.get(key)}
+
+
+class CatalogChange:
+    """What one refresh of a WatchedCatalog changed."""
+
+    def __init__(self, paths: Set[Path], fields: Optional[Set[str]]):
+        # Files whose parsed content (or load error) changed
+        self.paths = paths
+        # Top-level fields that changed, or None if files came or went
+        self.fields = fields
+
+    def __bool__(self):
+        return bool(self.paths)
+
+
+class WatchedCatalog:
+    """Parsed project files of one directory, kept up to date file by file."""
+
+    def __init__(self, directory: Path, cache: YamlCache = None, jobs: int = 1,
+                 pattern: str = '*.yaml'):
+        self.directory = directory
+        self.cache = cache
+        self.pattern = pattern
+        self.paths = sorted(directory.glob(pattern))
+        self.results = dict(zip(self.paths, load_documents(self.paths, cache, jobs)))
+        # path -> (project, error), built on first use and dropped on change
+        self._models = {}
+
+    def documents(self) -> List[Tuple[object, Optional[Exception]]]:
+        """(document, error) per file, in the order of load_documents()."""
+        return [self.results[path] for path in self.paths]
+
+    def models(self) -> List[Tuple[Path, Optional[Project], Optional[Exception]]]:
+        """
+        (path, project, error) per file, in path order, as catalog.to_project()
+        gives them. Project models are only built for files parsed since the
+        last call.
+        """
+        models = []
+        for path in self.paths:
+            model = self._models.get(path)
+            if model is None:
+                model = self._models[path] = to_project(path, *self.results[path])
+            models.append((path,) + model)
+        return models
+
+    def _load(self, path: Path) -> Tuple[object, Optional[Exception]]:
+        try:
+            return load_yaml(path, self.cache), None
+        except Exception as e:
+            return None, e
+
+    def refresh(self, touched: Iterable[Path]) -> CatalogChange:
+        """Re-parse the touched files (and only those) and report what changed."""
+        directory = self.directory.resolve()
+        touched = {path.name for path in touched if path.parent.resolve() == directory}
+        if not touched:
+            return CatalogChange(set(), set())
+
+        paths = sorted(self.directory.glob(self.pattern))
+        current = set(paths)
+        structural = current != set(self.paths)
+
+        changed_paths = set()
+        fields = set()
+        for path in set(self.paths) - current:
+            del self.results[path]
+            self._models.pop(path, None)
+            changed_paths.add(path)
+
+        for path in paths:
+            old = self.results.get(path)
+            if old is not None and path.name not in touched:
+                continue
+            new = self._load(path)
+            self.results[path] = new
+            self._models.pop(path, None)
+            if old is None:
+                changed_paths.add(path)
+                continue
+            if old[1] is not None or new[1] is not None:
+                if repr(old[1]) != repr(new[1]) or old[0] != new[0]:
+                    changed_paths.add(path)
+                    structural = True
+                continue
+            diff = changed_fields(old[0], new[0])
+            if diff is None:
+                structural = True
+                changed_paths.add(path)
+            elif diff:
+                fields |= diff
+                changed_paths.add(path)
+
+        self.paths = paths
+        return CatalogChange(changed_paths, None if structural else fields)
+
+
+def update_index(index, projects: list, change: Optional[CatalogChange]) -> bool:
+    """
+    Patch the projects of change.paths into index (a CatalogIndex or a
+    CoverageMatrix built from an earlier list of the same files) in place.
+
+    projects is the current list, in the same order as the index's. Returns
+    False, leaving index to be rebuilt, when files came or went, a changed
+    project moved in star order, or change is None.
+    """
+    if change is None or change.fields is None or len(projects) != len(index.projects):
+        return False
+    names = {path.name for path in change.paths}
+    for i, project in enumerate(projects):
+        if project.get('_filename') not in names:
+            continue
+        if project.get('_filename') != index.projects[i].get('_filename'):
+            return False
+        if not index.replace(i, project, change.fields):
+            return False
+    return True
+
+
+# =============================================================================
+# SECTIONS
+# =============================================================================
+
+class Sections:
+    """
+    Output assembled from named sections, each re-rendered only when a field
+    it reads has changed.
+
+    sections is a list of (name, render, fields): render(context) returns the
+    section's text, and fields lists the top-level project fields it reads
+    (None: re-render on every change).
+    """
+
+    def __init__(self, sections: List[Tuple[str, Callable, Optional[Iterable[str]]]],
+                 separator: str = '\n'):
+        self.sections = [(name, render, None if fields is None else frozenset(fields))
+                         for name, render, fields in sections]
+        self.separator = separator
+        self.rendered = {}
+
+    def render(self, context, changed: Optional[Set[str]] = None) -> List[str]:
+        """
+        Re-render the sections affected by the changed fields (all of them
+        if changed is None) and return their names.
+        """
+        updated = []
+        for name, render, fields in self.sections:
+            if (name in self.rendered and changed is not None
+                    and fields is not None and not fields & changed):
+                continue
+            self.rendered[name] = render(context)
+            updated.append(name)
+        return updated
+
+    def text(self) -> str:
+        return self.separator.join(self.rendered[name] for name, _, _ in self.sections)
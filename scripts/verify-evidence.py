@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Verify the commits and source files the project files cite, against the clones.
+
+For every project with a clone in tmp/ (see clone-all.py), repo-commit and
+each evidence block's source-commit must exist in the repository, and each
+source-file must exist at that commit. A clone's checks all go through one
+`git cat-file --batch-check`. The report also shows how many commits each
+repo-commit is behind the default branch, most behind first, to find stale
+analyses. Exits 1 if any citation does not check out.
+
+Usage:
+    ./scripts/verify-evidence.py                     # Verify every cloned tool
+    ./scripts/verify-evidence.py rusq--slackdump     # Only these tools (file name or name)
+    ./scripts/verify-evidence.py --json              # Results as JSON
+    ./scripts/verify-evidence.py --ndjson            # One JSON line per tool
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+from slackkb.cache import open_cache
+from slackkb.catalog import Catalog
+from slackkb.clones import cloned_projects, default_clones_dir, select_projects
+from slackkb.evidence import EvidenceReport, verify_clones
+from slackkb.output import discard_stdout, write_ndjson
+from slackkb.parallel import add_jobs_argument
+
+
+# =============================================================================
+# RESULTS
+# =============================================================================
+
+def evidence_record(report: EvidenceReport, repo_root: Path) -> dict:
+    """One tool's verification result."""
+    try:
+        clone = report.root.relative_to(repo_root).as_posix()
+    except ValueError:
+        clone = str(report.root)
+    return {
+        'tool': report.project.get('name'),
+        'file': report.project.filename,
+        'clone': clone,
+        'checked': report.checked,
+        'problems': report.problems,
+        'repo-commit': report.repo_commit,
+        'base': report.base,
+        'behind': report.behind,
+        'ahead': report.ahead,
+    }
+
+
+def print_record(record: dict):
+    """Print one tool's result: a status line, then its problems."""
+    status = 'ok' if not record['problems'] else f"{len(record['problems'])} problems"
+    print(f"{record['tool']}  ({record['clone']}): {record['checked']} citations, {status}")
+    for problem in record['problems']:
+        print(f"  - {problem}")
+
+
+def print_staleness(records: list):
+    """repo-commits by how far behind the default branch they are."""
+    pinned = [r for r in records if r['behind'] is not None]
+    if not pinned:
+        return
+    pinned.sort(key=lambda r: (-r['behind'], r['tool'] or ''))
+    width = max(len(r['tool'] or '') for r in pinned)
+    print("\nrepo-commit age (commits behind the default branch):")
+    for r in pinned:
+        note = f", {r['ahead']} not on {r['base']}" if r['ahead'] else ''
+        print(f"  {r['tool'] or '':<{width}}  {r['repo-commit']:<12} {r['behind']:>6}{note}")
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Verify cited commits and source files against the cloned repositories'
+    )
+    parser.add_argument('tools', nargs='*',
+                        help='Only verify these tools (project file name or name; default: all)')
+    parser.add_argument('--json', action='store_true', help='Output as JSON')
+    parser.add_argument('--ndjson', action='store_true', help='Output one JSON line per tool')
+    parser.add_argument('--projects-dir', type=str, default='projects',
+                        help='Directory holding the project files (default: projects/)')
+    parser.add_argument('--clones-dir', type=str,
+                        help='Directory holding the clones (default: tmp/)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the parsed-YAML cache')
+    add_jobs_argument(parser)
+
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).parent
+    repo_root = script_dir.parent
+    projects_dir = repo_root / args.projects_dir
+    clones_dir = Path(args.clones_dir) if args.clones_dir else default_clones_dir(repo_root)
+
+    cache = open_cache(repo_root, enabled=not args.no_cache)
+    catalog = Catalog.load(projects_dir, cache, args.jobs)
+    cache.save()
+    for filepath, e in catalog.errors:
+        print(f"Warning: Failed to load {filepath}: {e}", file=sys.stderr)
+
+    projects = select_projects(catalog.projects, args.tools)
+    if args.tools and not projects:
+        print(f"Error: No projects match: {', '.join(args.tools)}")
+        return 1
+
+    cloned, missing = cloned_projects(projects, clones_dir)
+    for project, root in missing:
+        print(f"Warning: No clone of {project.get('name')} "
+              f"({root or 'no repo-url'})", file=sys.stderr)
+    if not cloned:
+        print(f"Error: No clones found in {clones_dir}. Run ./scripts/clone-all.py first.")
+        return 1
+
+    records = [evidence_record(report, repo_root)
+               for report in verify_clones(cloned, args.jobs)]
+    failed = sum(1 for r in records if r['problems'])
+
+    if args.ndjson:
+        try:
+            write_ndjson(records, sys.stdout, flush=True)
+        except BrokenPipeError:
+            discard_stdout()
+            return 1
+    elif args.json:
+        print(json.dumps(records, indent=2))
+    else:
+        for record in records:
+            print_record(record)
+        print_staleness(records)
+        print(f"\nVerified {sum(r['checked'] for r in records)} citations in "
+              f"{len(records)} clones: {failed} with problems")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,8 @@
+"""
+The tests import the scripts' shared package, slackkb, from scripts/.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
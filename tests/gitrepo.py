@@ -0,0 +1,33 @@
+"""
+Throwaway git repositories for the tests, served over file://.
+"""
+
+import subprocess
+from pathlib import Path
+
+
+def git(root: Path, *args: str) -> str:
+    """Run git in root with a fixed identity and return its stdout."""
+    result = subprocess.run(
+        ['git', '-C', str(root), '-c', 'user.name=Test', '-c', 'user.email=test@example.com',
+         '-c', 'init.defaultBranch=main', *args],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    return result.stdout.decode().strip()
+
+
+def init_repo(root: Path) -> Path:
+    """An empty repository at root that partial clones can filter over file://."""
+    root.mkdir(parents=True)
+    git(root, 'init', '--quiet')
+    git(root, 'config', 'uploadpack.allowFilter', 'true')
+    return root
+
+
+def commit(root: Path, name: str, text: str) -> str:
+    """Write and commit one file; returns the new HEAD."""
+    path = root / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    git(root, 'add', name)
+    git(root, 'commit', '--quiet', '-m', f'Write {name}')
+    return git(root, 'rev-parse', 'HEAD')
@@ -0,0 +1,101 @@
+"""
+End-to-end test of scripts/clone-all.py against local file:// repositories.
+
+Each test builds an upstream repository in a temporary directory, a project
+file pointing at it, and runs the script on those with its own clones and
+mirrors directories, so nothing touches the network or the real tmp/.
+
+    python -m pytest tests/
+"""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from gitrepo import commit, git, init_repo
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CLONE_ALL = REPO_ROOT / 'scripts' / 'clone-all.py'
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason='git not installed')
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    """An upstream repository alice/one with two commits, and its project file."""
+    upstream = init_repo(tmp_path / 'upstream' / 'alice' / 'one')
+    first = commit(upstream, 'README.md', 'first\n')
+    second = commit(upstream, 'README.md', 'second\n')
+
+    projects = tmp_path / 'projects'
+    projects.mkdir()
+    (projects / 'alice--one.yaml').write_text(
+        f'name: one\nrepo-url: file://{upstream}\nrepo-commit: {first}\n')
+    return {'tmp': tmp_path, 'upstream': upstream, 'projects': projects,
+            'first': first, 'second': second,
+            'clone': tmp_path / 'clones' / 'alice--one'}
+
+
+def clone_all(catalog, *args: str) -> subprocess.CompletedProcess:
+    tmp = catalog['tmp']
+    return subprocess.run(
+        [sys.executable, str(CLONE_ALL), '--no-cache',
+         '--projects-dir', str(catalog['projects']),
+         '--clones-dir', str(tmp / 'clones'),
+         '--mirrors-dir', str(tmp / 'mirrors'), *args],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+
+def test_clone_then_skip(catalog):
+    result = clone_all(catalog)
+    assert result.returncode == 0, result.stdout
+    assert 'alice--one: cloned' in result.stdout
+    assert (catalog['tmp'] / 'mirrors' / 'alice--one.git').is_dir()
+    assert git(catalog['clone'], 'rev-parse', 'HEAD') == catalog['second']
+    assert (catalog['clone'] / 'README.md').read_text() == 'second\n'
+
+    result = clone_all(catalog)
+    assert 'alice--one: skipped (exists)' in result.stdout
+
+
+def test_pin_update_and_force(catalog):
+    clone = catalog['clone']
+    assert clone_all(catalog).returncode == 0
+
+    result = clone_all(catalog, '--pin')
+    assert result.returncode == 0, result.stdout
+    assert 'alice--one: pinned' in result.stdout
+    assert git(clone, 'rev-parse', 'HEAD') == catalog['first']
+    assert (clone / 'README.md').read_text() == 'first\n'
+
+    third = commit(catalog['upstream'], 'README.md', 'third\n')
+    result = clone_all(catalog, '--update')
+    assert result.returncode == 0, result.stdout
+    assert 'alice--one: updated' in result.stdout
+    assert git(clone, 'rev-parse', 'HEAD') == third
+
+    (clone / 'README.md').write_text('local edit\n')
+    result = clone_all(catalog, '--force')
+    assert result.returncode == 0, result.stdout
+    assert 'alice--one: cloned' in result.stdout
+    assert (clone / 'README.md').read_text() == 'third\n'
+
+
+def test_dry_run_changes_nothing(catalog):
+    result = clone_all(catalog, '--dry-run')
+    assert result.returncode == 0, result.stdout
+    assert 'alice--one: would clone' in result.stdout
+    assert not (catalog['tmp'] / 'clones').exists()
+    assert not (catalog['tmp'] / 'mirrors').exists()
+
+
+def test_missing_repository_fails(catalog):
+    (catalog['projects'] / 'bob--gone.yaml').write_text(
+        f"name: gone\nrepo-url: file://{catalog['tmp'] / 'upstream' / 'bob' / 'gone'}\n")
+    result = clone_all(catalog)
+    assert result.returncode == 1
+    assert 'alice--one: cloned' in result.stdout
+    assert 'bob--gone: failed' in result.stdout
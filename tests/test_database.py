@@ -0,0 +1,185 @@
+"""
+Tests for the SQLite copy of the catalog (slackkb/database.py), as
+build-database.py syncs it.
+
+    python -m pytest tests/
+"""
+
+import sqlite3
+
+import pytest
+
+from slackkb.database import CatalogDatabase, CatalogDatabaseError
+
+ONE = '''name: one
+language: Go
+stars: 10
+notes:
+  - First note
+slack-features:
+  send-messages: true
+  search: false
+  evidence:
+    source-type: code
+    source-url: https://github.com/alice/one
+    confidence: high
+installation:
+  homebrew: brew install one
+api-coverage:
+  methods-supported:
+    - chat.postMessage
+    - users.info
+  methods-partial:
+    - method: files.upload
+      limitation: No snippets
+'''
+
+TWO = '''name: two
+language: Python
+slack-features:
+  send-messages: false
+'''
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    projects = tmp_path / 'projects'
+    projects.mkdir()
+    (projects / 'alice--one.yaml').write_text(ONE)
+    (projects / 'bob--two.yaml').write_text(TWO)
+    return {'projects': projects, 'database_file': tmp_path / 'catalog.sqlite'}
+
+
+def sync(catalog):
+    with CatalogDatabase(catalog['database_file']) as db:
+        stats = db.sync(sorted(catalog['projects'].glob('*.yaml')))
+    return stats
+
+
+def query(catalog, sql: str, *params) -> list:
+    conn = sqlite3.connect(str(catalog['database_file']))
+    try:
+        return conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+
+
+def rows(catalog, table: str, columns: str) -> list:
+    return query(catalog, f"SELECT p.name, {columns} FROM {table} t "
+                          f"JOIN projects p ON p.id = t.project_id ORDER BY 1, 2, 3")
+
+
+def counts(stats) -> tuple:
+    return stats.added, stats.updated, stats.removed, stats.unchanged
+
+
+def test_build(catalog):
+    assert counts(sync(catalog)) == (2, 0, 0, 0)
+    assert query(catalog, "SELECT filename, name, language, stars FROM projects ORDER BY 1") == [
+        ('alice--one.yaml', 'one', 'Go', 10), ('bob--two.yaml', 'two', 'Python', None)]
+    assert rows(catalog, 'flags', 't.section, t.field, t.value, t.detail') == [
+        ('one', 'installation', 'homebrew', 1, 'brew install one'),
+        ('one', 'slack-features', 'search', 0, None),
+        ('one', 'slack-features', 'send-messages', 1, None),
+        ('two', 'slack-features', 'send-messages', 0, None)]
+    assert rows(catalog, 'methods', 't.method, t.status, t.detail') == [
+        ('one', 'chat.postMessage', 'supported', None),
+        ('one', 'files.upload', 'partial', 'No snippets'),
+        ('one', 'users.info', 'supported', None)]
+    assert rows(catalog, 'evidence', 't.section, t.source_type, t.confidence') == [
+        ('one', 'slack-features', 'code', 'high')]
+    assert rows(catalog, 'notes', 't.field, t.position, t.text') == [
+        ('one', 'notes', 0, 'First note')]
+
+
+def test_resync_after_edit(catalog):
+    sync(catalog)
+    two_before = query(catalog, "SELECT * FROM projects WHERE name = 'two'")
+
+    (catalog['projects'] / 'alice--one.yaml').write_text(
+        ONE.replace('search: false', 'search: true')
+           .replace('    - users.info\n', '')
+           .replace('confidence: high', 'confidence: low')
+           .replace('First note', 'Edited note')
+           .replace('stars: 10', 'stars: 11'))
+    assert counts(sync(catalog)) == (0, 1, 0, 1)
+
+    # Only the edited project's rows changed, and its id was kept
+    assert query(catalog, "SELECT * FROM projects WHERE name = 'two'") == two_before
+    assert query(catalog, "SELECT id, stars FROM projects WHERE name = 'one'") == [(1, 11)]
+    assert rows(catalog, 'flags', 't.section, t.field, t.value, t.detail') == [
+        ('one', 'installation', 'homebrew', 1, 'brew install one'),
+        ('one', 'slack-features', 'search', 1, None),
+        ('one', 'slack-features', 'send-messages', 1, None),
+        ('two', 'slack-features', 'send-messages', 0, None)]
+    assert rows(catalog, 'methods', 't.method, t.status, t.detail') == [
+        ('one', 'chat.postMessage', 'supported', None),
+        ('one', 'files.upload', 'partial', 'No snippets')]
+    assert rows(catalog, 'evidence', 't.section, t.source_type, t.confidence') == [
+        ('one', 'slack-features', 'code', 'low')]
+    assert rows(catalog, 'notes', 't.field, t.position, t.text') == [
+        ('one', 'notes', 0, 'Edited note')]
+
+    assert counts(sync(catalog)) == (0, 0, 0, 2)
+
+
+def test_resync_add_remove_and_touch(catalog):
+    sync(catalog)
+    (catalog['projects'] / 'bob--two.yaml').unlink()
+    (catalog['projects'] / 'carol--three.yaml').write_text(TWO.replace('two', 'three'))
+    (catalog['projects'] / 'alice--one.yaml').touch()
+    assert counts(sync(catalog)) == (1, 0, 1, 1)
+    assert query(catalog, "SELECT name FROM projects ORDER BY 1") == [('one',), ('three',)]
+    assert rows(catalog, 'flags', 't.field, t.value, t.detail')[-1] == (
+        'three', 'send-messages', 0, None)
+    assert query(catalog, "SELECT COUNT(*) FROM flags WHERE project_id NOT IN "
+                          "(SELECT id FROM projects)") == [(0,)]
+
+
+def test_broken_file_drops_its_rows(catalog):
+    sync(catalog)
+    (catalog['projects'] / 'alice--one.yaml').write_text('- not\n- a mapping\n')
+    stats = sync(catalog)
+    assert [path.name for path, _ in stats.errors] == ['alice--one.yaml']
+    assert query(catalog, "SELECT name FROM projects") == [('two',)]
+    assert query(catalog, "SELECT COUNT(*) FROM methods") == [(0,)]
+
+
+def test_foreign_tables_survive(catalog):
+    sync(catalog)
+    conn = sqlite3.connect(str(catalog['database_file']))
+    with conn:
+        conn.execute("CREATE TABLE my_ratings (name TEXT, rating INTEGER)")
+        conn.execute("INSERT INTO my_ratings VALUES ('one', 5)")
+    conn.close()
+
+    (catalog['projects'] / 'bob--two.yaml').write_text(TWO.replace('Python', 'Rust'))
+    assert counts(sync(catalog)) == (0, 1, 0, 1)
+    with CatalogDatabase(catalog['database_file'], rebuild=True) as db:
+        db.sync(sorted(catalog['projects'].glob('*.yaml')))
+    assert query(catalog, "SELECT * FROM my_ratings") == [('one', 5)]
+    assert query(catalog, "SELECT name, language FROM projects ORDER BY 1") == [
+        ('one', 'Go'), ('two', 'Rust')]
+
+
+def test_foreign_database_is_refused(tmp_path):
+    database_file = tmp_path / 'other.sqlite'
+    conn = sqlite3.connect(str(database_file))
+    with conn:
+        conn.execute("CREATE TABLE projects (id INTEGER, owner TEXT)")
+        conn.execute("INSERT INTO projects VALUES (1, 'someone else')")
+    conn.close()
+
+    for rebuild in (False, True):
+        with pytest.raises(CatalogDatabaseError, match='not a catalog database'):
+            CatalogDatabase(database_file, rebuild=rebuild)
+    assert query({'database_file': database_file}, "SELECT * FROM projects") == [
+        (1, 'someone else')]
+
+
+def test_non_sqlite_file_is_refused(tmp_path):
+    database_file = tmp_path / 'notes.sqlite'
+    database_file.write_bytes(b'these are my notes, not a database\n' * 100)
+    with pytest.raises(CatalogDatabaseError):
+        CatalogDatabase(database_file)
+    assert database_file.read_bytes() == b'these are my notes, not a database\n' * 100
@@ -0,0 +1,150 @@
+"""
+Tests for incremental validation: the manifest (slackkb/incremental.py) and
+validate_incremental (slackkb/validate.py), as check-yaml.py --incremental
+and --since use them.
+
+    python -m pytest tests/
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from gitrepo import git, init_repo
+from slackkb.incremental import Manifest, changed_since, validator_fingerprint
+from slackkb.schema import load_plan
+from slackkb.validate import set_plan, validate_incremental
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+VALID = '''name: one
+last-update: "2025-01-01"
+repo-url: https://github.com/alice/one
+description: A tool
+language: Go
+category: messaging-cli
+'''
+
+INVALID = 'name: one\n'
+
+
+@pytest.fixture(autouse=True)
+def plan():
+    set_plan(load_plan(REPO_ROOT / 'spec.yaml'))
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    """Two project files, and a validator made of one source file."""
+    projects = tmp_path / 'projects'
+    projects.mkdir()
+    (projects / 'alice--one.yaml').write_text(VALID)
+    (projects / 'bob--two.yaml').write_text(VALID.replace('one', 'two'))
+    validator = tmp_path / 'validate.py'
+    validator.write_text('# rules v1\n')
+    return {'tmp': tmp_path, 'projects': projects, 'validator': validator,
+            'manifest_file': tmp_path / 'manifest.json'}
+
+
+def run(catalog, changed=None) -> tuple:
+    """One check-yaml.py --incremental run: (errors per file, revalidated count)."""
+    fingerprint = validator_fingerprint([catalog['validator']])
+    manifest = Manifest(catalog['manifest_file'], fingerprint)
+    paths = sorted(catalog['projects'].glob('*.yaml'))
+    results, revalidated = validate_incremental(paths, manifest, changed=changed,
+                                                directory=catalog['projects'])
+    manifest.save()
+    return {result.filename: len(result.errors) for result in results}, revalidated
+
+
+def test_unchanged_files_are_reused(catalog):
+    assert run(catalog) == ({'alice--one.yaml': 0, 'bob--two.yaml': 0}, 2)
+    assert run(catalog) == ({'alice--one.yaml': 0, 'bob--two.yaml': 0}, 0)
+
+
+def test_changed_content_is_revalidated(catalog):
+    run(catalog)
+    (catalog['projects'] / 'alice--one.yaml').write_text(INVALID)
+    assert run(catalog) == ({'alice--one.yaml': 5, 'bob--two.yaml': 0}, 1)
+    # The stored outcome is the new one
+    assert run(catalog) == ({'alice--one.yaml': 5, 'bob--two.yaml': 0}, 0)
+
+
+def test_content_change_with_unchanged_mtime(catalog):
+    run(catalog)
+    path = catalog['projects'] / 'alice--one.yaml'
+    stat = path.stat()
+    path.write_text(INVALID)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert run(catalog) == ({'alice--one.yaml': 5, 'bob--two.yaml': 0}, 1)
+
+
+def test_touched_file_is_rehashed_not_revalidated(catalog):
+    run(catalog)
+    path = catalog['projects'] / 'alice--one.yaml'
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert run(catalog) == ({'alice--one.yaml': 0, 'bob--two.yaml': 0}, 0)
+    # The new stat was written back, so the next run does not hash it again
+    manifest = Manifest(catalog['manifest_file'], validator_fingerprint([catalog['validator']]))
+    assert manifest.get(path)['mtime_ns'] == stat.st_mtime_ns + 10**9
+
+
+def test_validator_change_discards_manifest(catalog):
+    run(catalog)
+    catalog['validator'].write_text('# rules v2\n')
+    assert run(catalog) == ({'alice--one.yaml': 0, 'bob--two.yaml': 0}, 2)
+    assert run(catalog)[1] == 0
+
+
+def test_deleted_file_is_forgotten(catalog):
+    run(catalog)
+    path = catalog['projects'] / 'bob--two.yaml'
+    path.unlink()
+    assert run(catalog) == ({'alice--one.yaml': 0}, 0)
+    manifest = Manifest(catalog['manifest_file'], validator_fingerprint([catalog['validator']]))
+    assert manifest.get(path) is None
+    assert manifest.get(catalog['projects'] / 'alice--one.yaml') is not None
+
+    # Restored, it is validated afresh
+    path.write_text(INVALID)
+    assert run(catalog) == ({'alice--one.yaml': 0, 'bob--two.yaml': 5}, 1)
+
+
+def test_since_only_adds_files(catalog):
+    run(catalog)
+    one = catalog['projects'] / 'alice--one.yaml'
+    two = catalog['projects'] / 'bob--two.yaml'
+
+    # Listed by git but unchanged on disk: revalidated anyway
+    assert run(catalog, changed={two.resolve()}) == (
+        {'alice--one.yaml': 0, 'bob--two.yaml': 0}, 1)
+
+    # Changed on disk but not listed by git: still revalidated
+    one.write_text(INVALID)
+    assert run(catalog, changed=set()) == ({'alice--one.yaml': 5, 'bob--two.yaml': 0}, 1)
+
+
+@pytest.mark.skipif(shutil.which('git') is None, reason='git not installed')
+def test_changed_since(catalog):
+    root = init_repo(catalog['tmp'] / 'repo')
+    projects = root / 'projects'
+    projects.mkdir()
+    for name in ('alice--one.yaml', 'bob--two.yaml'):
+        (projects / name).write_text(VALID)
+    (root / 'README.md').write_text('readme\n')
+    git(root, 'add', '.')
+    git(root, 'commit', '--quiet', '-m', 'Add projects')
+
+    assert changed_since(root, 'HEAD', projects) == set()
+
+    (projects / 'alice--one.yaml').write_text(INVALID)
+    (projects / 'carol--three.yaml').write_text(VALID)
+    (root / 'README.md').write_text('changed\n')
+    assert changed_since(root, 'HEAD', projects) == {
+        (projects / 'alice--one.yaml').resolve(), (projects / 'carol--three.yaml').resolve()}
+
+    with pytest.raises(RuntimeError):
+        changed_since(root, 'no-such-ref', projects)
@@ -0,0 +1,164 @@
+"""
+Tests for the --where query language of generate-tables.py (slackkb/query.py).
+
+    python -m pytest tests/
+"""
+
+import re
+
+import pytest
+
+from slackkb.model import Project
+from slackkb.query import QueryError, compile_query, tokenize
+
+DOCUMENTS = [
+    {'name': 'alpha', 'language': 'Go', 'stars': 900, 'archived': False,
+     'maintenance-tier': 'active-development',
+     'output-formats': {'json': True, 'csv': False},
+     'slack-features': {'send-messages': True},
+     'languages': ['Go', 'Shell'],
+     'api-coverage': {'methods-supported': ['chat.postMessage', 'users.info']}},
+    {'name': 'beta', 'language': 'Python', 'stars': 50, 'archived': True,
+     'maintenance-tier': 'archived',
+     'output-formats': {'json': False},
+     'api-coverage': {'methods-supported': ['users.info']}},
+    {'name': 'gamma', 'language': 'Go', 'stars': 1, 'archived': False,
+     'output-formats': {'csv': True},
+     'slack-features': {'send-messages': False}},
+    {'name': 'delta', 'language': 'Rust', 'stars': None, 'maintenance-tier': None},
+]
+
+
+@pytest.fixture(params=['dict', 'model'])
+def projects(request):
+    """The catalog as plain documents and as the compact models the loaders return."""
+    if request.param == 'dict':
+        return DOCUMENTS
+    return [Project(d, f"{d['name']}.yaml") for d in DOCUMENTS]
+
+
+def names(projects, expression: str) -> list:
+    return [p['name'] for p in compile_query(expression).filter(projects)]
+
+
+# =============================================================================
+# PARSER
+# =============================================================================
+
+def test_tokenize():
+    assert tokenize('stars >= 10 and "a b" in languages') == [
+        ('name', 'stars'), ('op', '>='), ('literal', 10), ('and', 'and'),
+        ('literal', 'a b'), ('in', 'in'), ('name', 'languages')]
+    assert tokenize("x == 'it\\'s' or y != -1.5 or z == null") == [
+        ('name', 'x'), ('op', '=='), ('literal', "it's"), ('or', 'or'),
+        ('name', 'y'), ('op', '!='), ('literal', -1.5), ('or', 'or'),
+        ('name', 'z'), ('op', '=='), ('literal', None)]
+    # Dotted, dashed names are one field
+    assert tokenize('read-capabilities.read-threads') == [
+        ('name', 'read-capabilities.read-threads')]
+
+
+@pytest.mark.parametrize('expression, message', [
+    ('', 'Empty expression'),
+    ('   ', 'Empty expression'),
+    ('language = "Go"', 'Unexpected input at position 8'),
+    ('stars >=', "Expected a value, found 'end of expression'"),
+    ('stars >= language', "Expected a value, found 'language'"),
+    ('(language == "Go"', "Expected ')', found 'end of expression'"),
+    ('language == "Go")', "Unexpected ')'"),
+    ('language "Go"', "Unexpected 'Go'"),
+    ('"Go" in', "Expected a field name, found 'end of expression'"),
+    ('"Go" languages', "Expected 'in', found 'languages'"),
+    ('and stars', "Expected a field or '(', found 'and'"),
+    ('not', "Expected a field or '(', found 'end of expression'"),
+    ('stars > 1 and', "Expected a field or '(', found 'end of expression'"),
+    ('"unterminated == 1', 'Unexpected input'),
+    ('()', "Expected a field or '(', found ')'"),
+])
+def test_malformed(expression, message):
+    with pytest.raises(QueryError, match=re.escape(message)):
+        compile_query(expression)
+
+
+# =============================================================================
+# EVALUATION
+# =============================================================================
+
+@pytest.mark.parametrize('expression, expected', [
+    # Truthiness: capability columns and plain fields
+    ('output-formats.json', ['alpha']),
+    ('output-formats.csv', ['gamma']),
+    ('archived', ['beta']),
+    ('maintenance-tier', ['alpha', 'beta']),
+    # Comparisons
+    ('language == "Go"', ['alpha', 'gamma']),
+    ('language != "Go"', ['beta', 'delta']),
+    ('stars >= 50', ['alpha', 'beta']),
+    ('stars < 50', ['gamma']),
+    ('stars == null', ['delta']),
+    ('maintenance-tier == "archived"', ['beta']),
+    # Booleans against a capability column: missing is neither
+    ('output-formats.json == true', ['alpha']),
+    ('output-formats.json == false', ['beta']),
+    ('output-formats.json != true', ['beta', 'gamma', 'delta']),
+    ('slack-features.send-messages == false', ['gamma']),
+    # Membership
+    ('"Shell" in languages', ['alpha']),
+    ('"users.info" in api-coverage.methods-supported', ['alpha', 'beta']),
+    ('"chat.update" in api-coverage.methods-supported', []),
+])
+def test_evaluation(projects, expression, expected):
+    assert names(projects, expression) == expected
+
+
+@pytest.mark.parametrize('expression, expected', [
+    # and binds tighter than or, not tighter than and
+    ('language == "Rust" or language == "Go" and stars > 100', ['alpha', 'delta']),
+    ('(language == "Rust" or language == "Go") and stars > 100', ['alpha']),
+    ('not archived and language == "Go"', ['alpha', 'gamma']),
+    ('not (archived or language == "Go")', ['delta']),
+    ('not not archived', ['beta']),
+    ('language == "Go" and stars > 100 or archived', ['alpha', 'beta']),
+])
+def test_precedence(projects, expression, expected):
+    assert names(projects, expression) == expected
+
+
+@pytest.mark.parametrize('expression', [
+    # Unknown fields are unset everywhere
+    'no-such-field',
+    'no-such-section.flag',
+    'no-such-field == "x"',
+    'no-such-field > 1',
+    '"x" in no-such-field',
+])
+def test_unknown_fields_match_nothing(projects, expression):
+    assert names(projects, expression) == []
+    assert len(names(projects, f'not ({expression})')) == len(DOCUMENTS)
+
+
+@pytest.mark.parametrize('expression, expected', [
+    # A value of another type never matches, and never raises
+    ('stars > "100"', []),
+    ('language > 5', []),
+    ('stars == "900"', []),
+    ('language == 1', []),
+    # true/false are not 1/0
+    ('stars == true', []),
+    ('stars > false', []),
+    ('archived == 1', []),
+    ('archived == 0', []),
+    ('archived == true', ['beta']),
+    ('stars != true', ['alpha', 'beta', 'gamma', 'delta']),
+    ('true in languages', []),
+    # Ordering skips nulls
+    ('stars < 1000', ['alpha', 'beta', 'gamma']),
+    ('stars > null', []),
+])
+def test_type_mismatches(projects, expression, expected):
+    assert names(projects, expression) == expected
+
+
+def test_results_keep_catalog_order(projects):
+    # The index works in star order; filter() hands back catalog order
+    assert names(projects, 'not archived') == ['alpha', 'gamma', 'delta']
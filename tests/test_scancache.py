@@ -0,0 +1,91 @@
+"""
+Tests for scanning clones by blob SHA through the scan cache (slackkb/scancache.py).
+
+The clone is a blobless partial clone of a file:// upstream, as clone-all.py
+makes them, so reading a blob goes through git's lazy fetch.
+
+    python -m pytest tests/
+"""
+
+import shutil
+
+import pytest
+
+from gitrepo import commit, git, init_repo
+from slackkb.git import CatFile
+from slackkb.scancache import ScanCache
+from slackkb.scanner import scan_clones, tree_files
+
+METHODS = ['chat.postMessage', 'chat.update', 'users.info']
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason='git not installed')
+
+
+@pytest.fixture
+def clone(tmp_path):
+    upstream = init_repo(tmp_path / 'upstream' / 'alice' / 'one')
+    commit(upstream, 'main.py', 'client.chat_postMessage()\n')
+    commit(upstream, 'lib/users.py', '\nusers.info\n')
+    commit(upstream, 'vendor/sdk.py', 'chat.update\n')
+    commit(upstream, 'empty.txt', '')
+    root = tmp_path / 'clones' / 'alice--one'
+    git(tmp_path, 'clone', '--quiet', '--filter=blob:none', f'file://{upstream}', str(root))
+    return {'upstream': upstream, 'root': root, 'cache_file': tmp_path / 'scan.pickle'}
+
+
+def scan(clone, fingerprint='f', **kwargs):
+    cache = ScanCache(clone['cache_file'], fingerprint, **kwargs)
+    result = scan_clones([clone['root']], METHODS, 1, cache)[0]
+    cache.save()
+    return result, cache
+
+
+def test_tree_files_and_cat_file(clone):
+    files = dict(tree_files(clone['root']))
+    # Dependencies and empty files are not listed
+    assert sorted(files) == ['lib/users.py', 'main.py']
+    with CatFile(clone['root']) as objects:
+        assert objects.read(files['main.py']) == b'client.chat_postMessage()\n'
+        assert objects.read('0' * 40) is None
+
+
+def test_cache_round_trip(clone):
+    first, cache = scan(clone)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert first.evidence == {'chat.postMessage': ['main.py:1'], 'users.info': ['lib/users.py:2']}
+
+    second, cache = scan(clone)
+    assert (cache.hits, cache.misses) == (2, 0)
+    assert second.evidence == first.evidence
+    assert (second.files, second.bytes) == (first.files, first.bytes)
+
+    # Another scanner or method list discards every entry
+    _, cache = scan(clone, fingerprint='other')
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_only_new_blobs_are_scanned(clone):
+    scan(clone)
+    commit(clone['upstream'], 'main.py', 'chat.update\nchat.update\n')
+    git(clone['root'], 'pull', '--quiet')
+
+    result, cache = scan(clone)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert result.evidence == {'chat.update': ['main.py:1', 'main.py:2'],
+                               'users.info': ['lib/users.py:2']}
+
+
+def test_eviction_keeps_recently_used_blobs(clone):
+    scan(clone)
+    commit(clone['upstream'], 'main.py', 'chat.update\n')
+    git(clone['root'], 'pull', '--quiet')
+    scan(clone)
+    # Back at the first commit every blob is a hit: the run must still
+    # record that they were used, or the newer main.py would outlive them
+    git(clone['root'], 'checkout', '--quiet', 'HEAD~1')
+    _, cache = scan(clone)
+    assert (cache.hits, cache.misses) == (2, 0)
+
+    scan(clone, max_entries=2)
+    current = sorted(sha for _, sha in tree_files(clone['root']))
+    assert sorted(ScanCache(clone['cache_file'], 'f').entries) == current
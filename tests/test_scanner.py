@@ -0,0 +1,156 @@
+"""
+Tests for the method-name scanner behind scan-api-usage.py (slackkb/scanner.py).
+
+    python -m pytest tests/
+"""
+
+import random
+
+import pytest
+
+from slackkb import scanner
+from slackkb.scanner import Automaton, line_numbers, scan_blob, scan_bytes, scan_file
+
+METHODS = ['chat.postMessage', 'chat.update', 'conversations.list', 'conversations.history',
+           'admin.conversations.list', 'users.info', 'api.test', 'files.upload']
+
+
+def found(text: str, methods=METHODS) -> list:
+    return [name for name, _ in scan_bytes(Automaton(methods), text.encode())]
+
+
+@pytest.fixture
+def scanning():
+    scanner.init_scanner(METHODS)
+
+
+# =============================================================================
+# BOUNDARIES
+# =============================================================================
+
+@pytest.mark.parametrize('text, expected', [
+    ('chat.postMessage', ['chat.postMessage']),
+    ('client.chat.postMessage(channel)', ['chat.postMessage']),
+    ('"chat.update"', ['chat.update']),
+    # A word character on either side is part of another identifier
+    ('xchat.postMessage', []),
+    ('chat.postMessages', []),
+    ('_chat.update', []),
+    ('chat.update2', []),
+    # Not the tail of a longer method, nor the head of a longer dotted name
+    ('admin.conversations.list', ['admin.conversations.list']),
+    ('conversations.listAll', []),
+    ('conversations.list.extra', []),
+    ('conversations.list.', ['conversations.list']),
+    # A receiver named like a category is still a receiver
+    ('api.chat.postMessage(', ['chat.postMessage']),
+    ('users.chat.postMessage', ['chat.postMessage']),
+    ('api.test()', ['api.test']),
+    # slack_sdk spells client methods with underscores
+    ('client.chat_postMessage(channel=c)', ['chat.postMessage']),
+    ('client.admin_conversations_list()', ['admin.conversations.list']),
+    ('client.conversations_list()', ['conversations.list']),
+    ('my_chat_postMessage', []),
+    ('chat_postMessage_async', []),
+])
+def test_boundaries(text, expected):
+    assert found(text) == expected
+
+
+def test_matches_in_file_order():
+    text = 'users.info(); chat.update(); users.info()'
+    assert found(text) == ['users.info', 'chat.update', 'users.info']
+
+
+# =============================================================================
+# ANCHOR SKIPPING
+# =============================================================================
+
+def naive_find(automaton: Automaton, data: bytes) -> list:
+    """Every occurrence of every spelling, with the scanner's rules, no automaton."""
+    word = scanner._WORD
+    hits = []
+    for pid, spelling in enumerate(automaton.patterns):
+        start = data.find(spelling)
+        while start != -1:
+            end = start + len(spelling)
+            ok = True
+            if start:
+                before = data[start - 1]
+                if before in word:
+                    ok = False
+                elif before == ord('.'):
+                    head = start - 1
+                    while head and data[head - 1] in word:
+                        head -= 1
+                    if head < start - 1 and data[head:end] in automaton.spellings:
+                        ok = False
+            if end < len(data):
+                if data[end] in word:
+                    ok = False
+                elif (data[end] == ord('.') and end + 1 < len(data)
+                      and data[end + 1] in scanner._LETTERS):
+                    ok = False
+            if ok:
+                hits.append((start, pid))
+            start = data.find(spelling, start + 1)
+    return scanner._outermost(hits, automaton.lengths)
+
+
+def test_anchor_skipping_matches_naive_scan():
+    automaton = Automaton(METHODS)
+    pieces = [m for name in METHODS for m in (name, scanner.method_alias(name))]
+    pieces += ['.', '_', ' ', '\n', 'x', 'api.', 'users.', 'chat', 'admin.', '(', '9', 'é']
+    rng = random.Random(0)
+    for _ in range(500):
+        data = ''.join(rng.choice(pieces) for _ in range(rng.randint(0, 40))).encode()
+        assert sorted(automaton.find(data)) == sorted(naive_find(automaton, data)), data
+
+
+def test_anchor_skipping_across_positions():
+    # Matches far apart, near the start and the end, with noise that holds
+    # anchors ("chat.", "users.") that do not lead to a match
+    filler = 'x = chat.nothing; users.none\n' * 200
+    text = 'chat.update\n' + filler + 'conversations.history\n' + filler + 'files.upload'
+    assert found(text) == ['chat.update', 'conversations.history', 'files.upload']
+
+
+# =============================================================================
+# LINES AND FILES
+# =============================================================================
+
+def test_line_numbers():
+    data = b'a\nb\n\nchat.update\n'
+    assert line_numbers(data, []) == []
+    assert line_numbers(data, [0, 1, 2, 5, 5, len(data)]) == [1, 1, 2, 4, 4, 5]
+
+
+def test_scan_reports_lines():
+    automaton = Automaton(METHODS)
+    data = b'# chat.update\n\nclient.chat_postMessage()\nchat.update\n'
+    assert scan_bytes(automaton, data) == [
+        ('chat.update', 1), ('chat.postMessage', 3), ('chat.update', 4)]
+
+
+def test_scan_blob_skips_binaries(scanning):
+    assert scan_blob(b'chat.update') == (11, (('chat.update', 1),))
+    assert scan_blob(b'\0' + b'chat.update') == (0, ())
+    # Only the start of a file is sniffed for NUL bytes
+    tail = b' ' * scanner.BINARY_SNIFF_BYTES + b'\0 chat.update'
+    assert scan_blob(tail)[1] == (('chat.update', 1),)
+    assert scan_blob(b'') == (0, ())
+
+
+def test_scan_skips_oversized_files(scanning, tmp_path, monkeypatch):
+    monkeypatch.setattr(scanner, 'MAX_FILE_BYTES', 16)
+    small = tmp_path / 'small.py'
+    small.write_bytes(b'chat.update()')
+    large = tmp_path / 'large.py'
+    large.write_bytes(b'chat.update()' + b' ' * 16)
+    empty = tmp_path / 'empty.py'
+    empty.write_bytes(b'')
+
+    assert scan_file(str(small)) == (13, (('chat.update', 1),))
+    assert scan_file(str(large)) == (0, ())
+    assert scan_file(str(empty)) == (0, ())
+    assert scan_blob(large.read_bytes()) == (0, ())
@@ -0,0 +1,157 @@
+"""
+Tests for the --watch refresh path (slackkb/watch.py): after an edit, only
+the edited file is re-parsed and re-modelled, and the index or coverage
+matrix patched in place renders exactly what a fresh one would.
+
+    python -m pytest tests/
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+import yaml
+
+from slackkb.coverage import CoverageMatrix
+from slackkb.coverage_tables import generate_by_tool_table, generate_gaps_table, generate_summary
+from slackkb.index import CatalogIndex
+from slackkb.openapi import load_spec_index
+from slackkb.output import render
+from slackkb.tables import generate_full_report
+from slackkb.watch import WatchedCatalog, update_index
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SPEC_PATH = REPO_ROOT / 'archived-sources' / 'slack-api' / 'slack-web-openapi-v2.json'
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    projects_dir = tmp_path / 'projects'
+    projects_dir.mkdir()
+    for path in (REPO_ROOT / 'projects').glob('*.yaml'):
+        shutil.copy(path, projects_dir / path.name)
+    return WatchedCatalog(projects_dir)
+
+
+def projects_of(catalog) -> list:
+    return [project for _, project, _ in catalog.models() if project is not None]
+
+
+def edit(catalog, name: str, change) -> object:
+    """Apply change(document) to one project file and refresh the catalog."""
+    path = catalog.directory / name
+    document = yaml.safe_load(path.read_text())
+    change(document)
+    path.write_text(yaml.safe_dump(document, sort_keys=False))
+    return catalog.refresh([path])
+
+
+def report(index) -> str:
+    return render(generate_full_report(index, 'none'))
+
+
+def featured(catalog) -> str:
+    """A project with slack-features flags and API coverage data."""
+    for path, project, _ in catalog.models():
+        if (project is not None and project.get('api-coverage')
+                and any(v is True for v in (project.get('slack-features') or {}).values())):
+            return path.name
+    pytest.skip('no project with slack-features and api-coverage')
+
+
+# =============================================================================
+# MODELS
+# =============================================================================
+
+def test_only_the_edited_model_is_rebuilt(catalog):
+    before = {path: project for path, project, _ in catalog.models()}
+    name = featured(catalog)
+    change = edit(catalog, name, lambda d: d.update(description='Edited'))
+    assert change.fields == {'description'}
+    assert {path.name for path in change.paths} == {name}
+
+    for path, project, _ in catalog.models():
+        if path.name == name:
+            assert project is not before[path]
+            assert project['description'] == 'Edited'
+        else:
+            assert project is before[path]
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+def flip_feature(document):
+    features = document['slack-features']
+    field = next(k for k, v in features.items() if v is True)
+    features[field] = False
+    features['brand-new-flag'] = True
+
+
+@pytest.mark.parametrize('change', [
+    lambda d: d.update(description='Edited'),
+    lambda d: d.update(language='Brainfuck', category='export-tool'),
+    flip_feature,
+    lambda d: d.pop('slack-features'),
+    lambda d: d.setdefault('authentication', {}).update({'auth-notes': ['Edited note']}),
+    lambda d: d.update({'maintenance-tier': 'archived', 'archived': True}),
+])
+def test_patched_index_renders_like_a_fresh_one(catalog, change):
+    projects = projects_of(catalog)
+    index = CatalogIndex(projects)
+    # Fill the lazily built groups, sections and field indexes first
+    report(index)
+    index.field('language')
+    index.field('slack-features.send-messages')
+
+    refresh = edit(catalog, featured(catalog), change)
+    projects = projects_of(catalog)
+    assert update_index(index, projects, refresh)
+    fresh = CatalogIndex(projects)
+    assert report(index) == report(fresh)
+    for path in ('language', 'category', 'slack-features.send-messages'):
+        assert index.field(path).values == fresh.field(path).values
+        assert index.field(path).truthy_bits == fresh.field(path).truthy_bits
+
+
+def test_star_change_needs_a_new_index(catalog):
+    index = CatalogIndex(projects_of(catalog))
+    refresh = edit(catalog, featured(catalog), lambda d: d.update(stars=10 ** 9))
+    assert refresh.fields == {'stars'}
+    assert not update_index(index, projects_of(catalog), refresh)
+
+
+def test_added_file_needs_a_new_index(catalog):
+    index = CatalogIndex(projects_of(catalog))
+    path = catalog.directory / 'zed--new.yaml'
+    path.write_text('name: new\nstars: 1\n')
+    refresh = catalog.refresh([path])
+    assert refresh.fields is None
+    assert not update_index(index, projects_of(catalog), refresh)
+
+
+# =============================================================================
+# COVERAGE
+# =============================================================================
+
+def coverage_report(matrix) -> str:
+    return '\n'.join(generate(matrix, matrix.all_methods) for generate in
+                     (generate_summary, generate_by_tool_table, generate_gaps_table))
+
+
+@pytest.mark.parametrize('change', [
+    lambda d: d['api-coverage'].update({'methods-supported': ['chat.postMessage',
+                                                              'not.aRealMethod']}),
+    lambda d: d.pop('api-coverage'),
+    lambda d: d.update(stars=10 ** 9),
+])
+def test_patched_matrix_renders_like_a_fresh_one(catalog, change):
+    all_methods = load_spec_index(SPEC_PATH).categories()
+    matrix = CoverageMatrix(projects_of(catalog), all_methods)
+    matrix.counts
+
+    refresh = edit(catalog, featured(catalog), change)
+    projects = projects_of(catalog)
+    assert update_index(matrix, projects, refresh)
+    assert coverage_report(matrix) == coverage_report(CoverageMatrix(projects, all_methods))